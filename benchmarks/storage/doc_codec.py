@@ -0,0 +1,84 @@
+"""Throughput of docstore node serialization: dataclasses_json vs. fast codecs."""
+import argparse
+import json
+import time
+from typing import Any, Callable, List, Tuple
+
+import numpy as np
+
+from llama_index.constants import DATA_KEY, TYPE_KEY
+from llama_index.data_structs.node import DocumentRelationship, Node
+from llama_index.schema import BaseDocument
+from llama_index.storage.docstore.utils import (
+    bytes_to_doc,
+    doc_to_bytes,
+    doc_to_json,
+    json_to_doc,
+)
+
+
+def make_nodes(num: int, dim: int, text_len: int, seed: int) -> List[Node]:
+    rng = np.random.default_rng(seed)
+    embeddings = rng.normal(size=(num, dim)).astype(np.float32)
+    return [
+        Node(
+            text="x" * text_len,
+            doc_id=f"node_{i}",
+            embedding=embeddings[i].tolist() if dim > 0 else None,
+            extra_info={"file_name": f"doc_{i // 10}.txt", "page": i % 10},
+            relationships={
+                DocumentRelationship.SOURCE: f"doc_{i // 10}",
+                DocumentRelationship.PREVIOUS: f"node_{i - 1}",
+                DocumentRelationship.NEXT: f"node_{i + 1}",
+            },
+        )
+        for i in range(num)
+    ]
+
+
+def legacy_to_json(node: BaseDocument) -> dict:
+    return {DATA_KEY: node.to_dict(), TYPE_KEY: node.get_type()}
+
+
+def legacy_from_json(node_dict: dict) -> BaseDocument:
+    return Node.from_dict(node_dict[DATA_KEY])
+
+
+def timed(fn: Callable[[Any], Any], items: List[Any]) -> Tuple[float, List[Any]]:
+    start = time.perf_counter()
+    results = [fn(item) for item in items]
+    return time.perf_counter() - start, results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num-nodes", type=int, default=20000)
+    parser.add_argument("--dim", type=int, default=1536)
+    parser.add_argument("--text-len", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    nodes = make_nodes(args.num_nodes, args.dim, args.text_len, args.seed)
+
+    print("codec\t\tencode (nodes/s)\tdecode (nodes/s)\tbytes/node")
+    codecs = [
+        (
+            "dataclasses_json",
+            lambda node: json.dumps(legacy_to_json(node)),
+            lambda data: legacy_from_json(json.loads(data)),
+        ),
+        (
+            "fast json",
+            lambda node: json.dumps(doc_to_json(node)),
+            lambda data: json_to_doc(json.loads(data)),
+        ),
+        ("msgpack", doc_to_bytes, bytes_to_doc),
+    ]
+    for name, encode, decode in codecs:
+        encode_time, encoded = timed(encode, nodes)
+        decode_time, _ = timed(decode, encoded)
+        size = sum(len(data) for data in encoded) / len(encoded)
+        print(
+            f"{name:<16}{len(nodes) / encode_time:>12,.0f}\t\t"
+            f"{len(nodes) / decode_time:>12,.0f}\t\t{size:>10,.0f}"
+        )
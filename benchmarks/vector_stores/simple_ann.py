@@ -0,0 +1,110 @@
+"""Recall vs. latency of SimpleVectorStore approximate search against exact search."""
+import argparse
+import time
+from typing import List, Optional
+
+import numpy as np
+
+from llama_index.data_structs.node import Node
+from llama_index.vector_stores.ann_index import IVFIndex
+from llama_index.vector_stores.simple import SimpleVectorStore
+from llama_index.vector_stores.types import NodeWithEmbedding, VectorStoreQuery
+
+
+def make_embeddings(
+    num: int,
+    dim: int,
+    num_clusters: int,
+    noise: float,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """Sample clustered embeddings, which resemble real text embeddings better
+    than uniform noise."""
+    centers = rng.normal(size=(num_clusters, dim))
+    points = centers[rng.integers(0, num_clusters, num)]
+    points += noise * rng.normal(size=(num, dim))
+    return points.astype(np.float32)
+
+
+def build_store(
+    embeddings: np.ndarray, ann_index: Optional[IVFIndex] = None
+) -> SimpleVectorStore:
+    store = SimpleVectorStore(use_matrix=True, ann_index=ann_index)
+    batch_size = 10000
+    for start in range(0, len(embeddings), batch_size):
+        store.add(
+            [
+                NodeWithEmbedding(node=Node(text="", doc_id=str(i)), embedding=emb)
+                for i, emb in enumerate(
+                    embeddings[start : start + batch_size], start=start
+                )
+            ]
+        )
+    return store
+
+
+def run_queries(
+    store: SimpleVectorStore, queries: np.ndarray, top_k: int, **kwargs: int
+) -> List[List[str]]:
+    results = []
+    for query in queries:
+        result = store.query(
+            VectorStoreQuery(query_embedding=query, similarity_top_k=top_k), **kwargs
+        )
+        results.append(result.ids or [])
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num-embeddings", type=int, default=200000)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--num-clusters", type=int, default=1000)
+    parser.add_argument("--noise", type=float, default=1.0)
+    parser.add_argument("--num-queries", type=int, default=100)
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--nlist", type=int, default=None)
+    parser.add_argument(
+        "--nprobe", type=int, nargs="+", default=[1, 4, 16, 32, 64, 128]
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    data = make_embeddings(
+        args.num_embeddings + args.num_queries,
+        args.dim,
+        args.num_clusters,
+        args.noise,
+        rng,
+    )
+    embeddings, queries = data[: args.num_embeddings], data[args.num_embeddings :]
+
+    exact_store = build_store(embeddings)
+    start = time.perf_counter()
+    exact_results = run_queries(exact_store, queries, args.top_k)
+    exact_latency = (time.perf_counter() - start) / args.num_queries
+    print(f"exact: {1000 * exact_latency:.2f} ms/query")
+
+    ann_store = build_store(
+        embeddings, ann_index=IVFIndex(nlist=args.nlist, min_train_size=0)
+    )
+    start = time.perf_counter()
+    ann_store.train_ann_index()
+    print(f"ivf train: {time.perf_counter() - start:.1f} s")
+
+    print("nprobe\trecall@k\tms/query\tspeedup")
+    for nprobe in args.nprobe:
+        start = time.perf_counter()
+        ann_results = run_queries(ann_store, queries, args.top_k, nprobe=nprobe)
+        latency = (time.perf_counter() - start) / args.num_queries
+        recall = np.mean(
+            [
+                len(set(exact) & set(approx)) / max(len(exact), 1)
+                for exact, approx in zip(exact_results, ann_results)
+            ]
+        )
+        print(
+            f"{nprobe}\t{recall:.3f}\t\t{1000 * latency:.2f}\t\t"
+            f"{exact_latency / latency:.1f}x"
+        )
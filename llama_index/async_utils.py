@@ -1,13 +1,33 @@
 """Async utils."""
 import asyncio
-from typing import Any, Coroutine, List
+from typing import Any, Coroutine, List, Optional
 
 
-def run_async_tasks(tasks: List[Coroutine]) -> List[Any]:
-    """Run a list of async tasks."""
+async def gather_with_concurrency(
+    tasks: List[Coroutine], max_concurrency: Optional[int] = None
+) -> List[Any]:
+    """Gather a list of async tasks, with at most max_concurrency running at once."""
+    if max_concurrency is None:
+        return await asyncio.gather(*tasks)
+    if max_concurrency <= 0:
+        raise ValueError("max_concurrency must be > 0")
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _run(task: Coroutine) -> Any:
+        async with semaphore:
+            return await task
+
+    return await asyncio.gather(*[_run(task) for task in tasks])
+
+
+def run_async_tasks(
+    tasks: List[Coroutine], max_concurrency: Optional[int] = None
+) -> List[Any]:
+    """Run a list of async tasks, with at most max_concurrency running at once."""
 
     async def _gather() -> List[Any]:
-        return await asyncio.gather(*tasks)
+        return await gather_with_concurrency(tasks, max_concurrency=max_concurrency)
 
     outputs: List[Any] = asyncio.run(_gather())
     return outputs
@@ -24,6 +24,8 @@ class CBEventType(str, Enum):
         RETRIEVE: Logs for the nodes retrieved for a query.
         SYNTHESIZE: Logs for the result for synthesize calls.
         TREE: Logs for the summary and level of summaries generated.
+        DOCSTORE: Logs for the cache hits and misses of document store reads.
+        EMBEDDING_CACHE: Logs for the cache hits and misses of embedding lookups.
     """
 
     CHUNKING = "chunking"
@@ -34,6 +36,8 @@ class CBEventType(str, Enum):
     RETRIEVE = "retrieve"
     SYNTHESIZE = "synthesize"
     TREE = "tree"
+    DOCSTORE = "docstore"
+    EMBEDDING_CACHE = "embedding_cache"
 
 
 class EventPayload(str, Enum):
@@ -44,10 +48,18 @@ class EventPayload(str, Enum):
     RESPONSE = "response"  # response from LLM
     TEMPLATE = "template"  # template used in LLM call
     QUERY_STR = "query_str"  # query used for query engine
+    CACHE_HITS = "cache_hits"  # number of items served from a cache
+    CACHE_MISSES = "cache_misses"  # number of items missing from a cache
 
 
 # events that will never have children events
-LEAF_EVENTS = (CBEventType.CHUNKING, CBEventType.LLM, CBEventType.EMBEDDING)
+LEAF_EVENTS = (
+    CBEventType.CHUNKING,
+    CBEventType.LLM,
+    CBEventType.EMBEDDING,
+    CBEventType.DOCSTORE,
+    CBEventType.EMBEDDING_CACHE,
+)
 
 
 @dataclass
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from typing import Any, Callable, Dict, List, Optional
+from llama_index.token_counter.token_count_cache import count_tokens
 from llama_index.utils import globals_helper
 from llama_index.callbacks.base import BaseCallbackHandler
 from llama_index.callbacks.schema import CBEventType
@@ -82,12 +83,12 @@ class TokenCountingHandler(BaseCallbackHandler):
                 TokenCountingEvent(
                     event_id=event_id,
                     prompt=payload.get("formatted_prompt", ""),
-                    prompt_token_count=len(
-                        self.tokenizer(payload.get("formatted_prompt", ""))
+                    prompt_token_count=count_tokens(
+                        payload.get("formatted_prompt", ""), self.tokenizer
                     ),
                     completion=payload.get("response", ""),
-                    completion_token_count=len(
-                        self.tokenizer(payload.get("response", ""))
+                    completion_token_count=count_tokens(
+                        payload.get("response", ""), self.tokenizer
                     ),
                 )
             )
@@ -111,7 +112,7 @@ class TokenCountingHandler(BaseCallbackHandler):
                     TokenCountingEvent(
                         event_id=event_id,
                         prompt=chunk,
-                        prompt_token_count=len(self.tokenizer(chunk)),
+                        prompt_token_count=count_tokens(chunk, self.tokenizer),
                         completion="",
                         completion_token_count=0,
                     )
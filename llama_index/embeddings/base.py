@@ -3,18 +3,26 @@
 import asyncio
 from abc import abstractmethod
 from enum import Enum
-from typing import Callable, Coroutine, List, Optional, Tuple
+from typing import Callable, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 
 from llama_index.callbacks.base import CallbackManager
 from llama_index.callbacks.schema import CBEventType, EventPayload
-from llama_index.utils import globals_helper
+from llama_index.embeddings.utils import RateLimiter
+from llama_index.token_counter.token_count_cache import count_tokens
+from llama_index.utils import (
+    ErrorToRetry,
+    aretry_on_exceptions_with_backoff,
+    globals_helper,
+    retry_on_exceptions_with_backoff,
+)
 
 # TODO: change to numpy array
 EMB_TYPE = List
 
 DEFAULT_EMBED_BATCH_SIZE = 10
+DEFAULT_EMBED_MAX_CONCURRENCY = 8
 
 
 class SimilarityMode(str, Enum):
@@ -48,14 +56,148 @@ def similarity(
         return product / norm
 
 
+def _as_matrix(embeddings: Union[np.ndarray, Sequence[EMB_TYPE]]) -> np.ndarray:
+    """Convert embeddings to a 2D float32 matrix (no copy if already one)."""
+    matrix = np.asarray(embeddings, dtype=np.float32)
+    if matrix.ndim == 1 and matrix.size == 0:
+        # empty list of embeddings
+        matrix = matrix.reshape(0, 0)
+    return matrix
+
+
+def _safe_divide(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """Divide, giving 0 where the denominator is 0 (i.e. for zero vectors)."""
+    return np.divide(
+        numerator,
+        denominator,
+        out=np.zeros_like(numerator),
+        where=denominator > 0,
+    )
+
+
+def embedding_norms(embeddings: Union[np.ndarray, Sequence[EMB_TYPE]]) -> np.ndarray:
+    """Get the L2 norm of every row.
+
+    Norms can be computed once and passed to `similarity_batch` and
+    `pairwise_similarity` to avoid recomputing them on every call.
+
+    """
+    return np.linalg.norm(_as_matrix(embeddings), axis=1)
+
+
+def similarity_batch(
+    query_embedding: Union[np.ndarray, Sequence[float]],
+    embeddings: Union[np.ndarray, Sequence[EMB_TYPE]],
+    mode: SimilarityMode = SimilarityMode.DEFAULT,
+    norms: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Get the similarity of a query with every row of an embedding matrix.
+
+    Same scores as `similarity`, computed as float32 matrix products. Cosine
+    similarity with a zero vector is 0.
+
+    Args:
+        query_embedding: embedding of shape (dim,).
+        embeddings: embeddings of shape (n, dim).
+        mode (SimilarityMode): similarity mode.
+        norms (Optional[np.ndarray]): precomputed norms of `embeddings`
+            (see `embedding_norms`), used in cosine mode.
+
+    Returns:
+        np.ndarray: similarities of shape (n,).
+
+    """
+    query_np = np.asarray(query_embedding, dtype=np.float32)
+    matrix = _as_matrix(embeddings)
+    if matrix.shape[0] == 0:
+        return np.zeros(0, dtype=np.float32)
+    if mode == SimilarityMode.EUCLIDEAN:
+        return -np.linalg.norm(matrix - query_np, axis=1)
+
+    products = matrix @ query_np
+    if mode == SimilarityMode.DOT_PRODUCT:
+        return products
+    if norms is None:
+        norms = embedding_norms(matrix)
+    return _safe_divide(products, norms * np.linalg.norm(query_np))
+
+
+def pairwise_similarity(
+    embeddings1: Union[np.ndarray, Sequence[EMB_TYPE]],
+    embeddings2: Union[np.ndarray, Sequence[EMB_TYPE]],
+    mode: SimilarityMode = SimilarityMode.DEFAULT,
+    norms1: Optional[np.ndarray] = None,
+    norms2: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Get the similarity of every row of a matrix with every row of another.
+
+    Args:
+        embeddings1: embeddings of shape (n, dim).
+        embeddings2: embeddings of shape (m, dim).
+        mode (SimilarityMode): similarity mode.
+        norms1 (Optional[np.ndarray]): precomputed norms of `embeddings1`,
+            used in cosine mode.
+        norms2 (Optional[np.ndarray]): precomputed norms of `embeddings2`,
+            used in cosine mode.
+
+    Returns:
+        np.ndarray: similarities of shape (n, m).
+
+    """
+    matrix1 = _as_matrix(embeddings1)
+    matrix2 = _as_matrix(embeddings2)
+    if matrix1.shape[0] == 0 or matrix2.shape[0] == 0:
+        return np.zeros((matrix1.shape[0], matrix2.shape[0]), dtype=np.float32)
+
+    if mode == SimilarityMode.EUCLIDEAN:
+        # |a - b|^2 = |a|^2 + |b|^2 - 2 a.b, in float64 to avoid cancellation
+        # errors for near-identical embeddings
+        matrix1_64 = matrix1.astype(np.float64)
+        matrix2_64 = matrix2.astype(np.float64)
+        squared = (matrix1_64**2).sum(axis=1)[:, np.newaxis] + (matrix2_64**2).sum(
+            axis=1
+        )
+        squared -= 2 * (matrix1_64 @ matrix2_64.T)
+        return -np.sqrt(np.maximum(squared, 0)).astype(np.float32)
+
+    products = matrix1 @ matrix2.T
+    if mode == SimilarityMode.DOT_PRODUCT:
+        return products
+    if norms1 is None:
+        norms1 = embedding_norms(matrix1)
+    if norms2 is None:
+        norms2 = embedding_norms(matrix2)
+    return _safe_divide(products, np.outer(norms1, norms2))
+
+
 class BaseEmbedding:
-    """Base class for embeddings."""
+    """Base class for embeddings.
+
+    Args:
+        embed_batch_size (int): max number of texts per embedding request.
+        tokenizer (Optional[Callable]): tokenizer used to count tokens.
+        callback_manager (Optional[CallbackManager]): callback manager.
+        embed_batch_max_tokens (Optional[int]): max number of tokens per
+            embedding request. A single text above the limit is sent alone.
+        max_concurrency (int): max number of concurrent async requests.
+        requests_per_minute (Optional[int]): budget of requests per minute.
+        tokens_per_minute (Optional[int]): budget of tokens per minute.
+        max_retries (int): number of times a failed request is retried,
+            with exponential backoff. Only transient errors are retried (see
+            `_get_errors_to_retry`).
+
+    """
 
     def __init__(
         self,
         embed_batch_size: int = DEFAULT_EMBED_BATCH_SIZE,
         tokenizer: Optional[Callable] = None,
         callback_manager: Optional[CallbackManager] = None,
+        embed_batch_max_tokens: Optional[int] = None,
+        max_concurrency: int = DEFAULT_EMBED_MAX_CONCURRENCY,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+        max_retries: int = 0,
     ) -> None:
         """Init params."""
         self._total_tokens_used = 0
@@ -66,7 +208,18 @@ class BaseEmbedding:
         self._text_queue: List[Tuple[str, str]] = []
         if embed_batch_size <= 0:
             raise ValueError("embed_batch_size must be > 0")
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency must be > 0")
         self._embed_batch_size = embed_batch_size
+        self._embed_batch_max_tokens = embed_batch_max_tokens
+        self._max_concurrency = max_concurrency
+        self._max_retries = max_retries
+        self._rate_limiter: Optional[RateLimiter] = None
+        if requests_per_minute is not None or tokens_per_minute is not None:
+            self._rate_limiter = RateLimiter(
+                requests_per_minute=requests_per_minute,
+                tokens_per_minute=tokens_per_minute,
+            )
 
     @abstractmethod
     def _get_query_embedding(self, query: str) -> List[float]:
@@ -76,7 +229,7 @@ class BaseEmbedding:
         """Get query embedding."""
         event_id = self.callback_manager.on_event_start(CBEventType.EMBEDDING)
         query_embedding = self._get_query_embedding(query)
-        query_tokens_count = len(self._tokenizer(query))
+        query_tokens_count = count_tokens(query, self._tokenizer)
         self._total_tokens_used += query_tokens_count
         self.callback_manager.on_event_end(
             CBEventType.EMBEDDING,
@@ -134,7 +287,7 @@ class BaseEmbedding:
         """Get text embedding."""
         event_id = self.callback_manager.on_event_start(CBEventType.EMBEDDING)
         text_embedding = self._get_text_embedding(text)
-        text_tokens_count = len(self._tokenizer(text))
+        text_tokens_count = count_tokens(text, self._tokenizer)
         self._total_tokens_used += text_tokens_count
         self.callback_manager.on_event_end(
             CBEventType.EMBEDDING,
@@ -151,35 +304,108 @@ class BaseEmbedding:
         """
         self._text_queue.append((text_id, text))
 
+    def _get_text_batches(
+        self, text_queue: List[Tuple[str, str]]
+    ) -> List[Tuple[List[str], List[str], int]]:
+        """Split queued texts into batches of (ids, texts, number of tokens).
+
+        A batch is flushed once it holds `embed_batch_size` texts, or when the
+        next text would take it over `embed_batch_max_tokens`.
+
+        """
+        batches: List[Tuple[List[str], List[str], int]] = []
+        cur_ids: List[str] = []
+        cur_texts: List[str] = []
+        cur_tokens = 0
+        for text_id, text in text_queue:
+            text_tokens_count = count_tokens(text, self._tokenizer)
+            self._total_tokens_used += text_tokens_count
+            if cur_texts and (
+                self._embed_batch_max_tokens is not None
+                and cur_tokens + text_tokens_count > self._embed_batch_max_tokens
+            ):
+                batches.append((cur_ids, cur_texts, cur_tokens))
+                cur_ids, cur_texts, cur_tokens = [], [], 0
+            cur_ids.append(text_id)
+            cur_texts.append(text)
+            cur_tokens += text_tokens_count
+            if len(cur_texts) == self._embed_batch_size:
+                batches.append((cur_ids, cur_texts, cur_tokens))
+                cur_ids, cur_texts, cur_tokens = [], [], 0
+        if cur_texts:
+            batches.append((cur_ids, cur_texts, cur_tokens))
+        return batches
+
+    def _get_errors_to_retry(self) -> List[ErrorToRetry]:
+        """Get the transient errors that failed requests are retried on.
+
+        Defaults to timeouts and connection errors. Embedding models raising
+        provider-specific transient errors (e.g. rate limits) override this.
+
+        """
+        return [ErrorToRetry(TimeoutError), ErrorToRetry(ConnectionError)]
+
+    def _embed_batch(self, texts: List[str], num_tokens: int) -> List[List[float]]:
+        """Embed a batch of texts, within rate limits and with retries."""
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire(num_tokens)
+        event_id = self.callback_manager.on_event_start(CBEventType.EMBEDDING)
+        if self._max_retries > 0:
+            embeddings = retry_on_exceptions_with_backoff(
+                lambda: self._get_text_embeddings(texts),
+                self._get_errors_to_retry(),
+                max_tries=self._max_retries + 1,
+            )
+        else:
+            embeddings = self._get_text_embeddings(texts)
+        self.callback_manager.on_event_end(
+            CBEventType.EMBEDDING,
+            payload={EventPayload.CHUNKS: texts},
+            event_id=event_id,
+        )
+        return embeddings
+
+    async def _aembed_batch(
+        self, texts: List[str], num_tokens: int, semaphore: asyncio.Semaphore
+    ) -> List[List[float]]:
+        """Asynchronously embed a batch of texts.
+
+        The callback event only covers the request itself, not the time spent
+        waiting for a concurrency slot or for the rate limiter.
+
+        """
+        async with semaphore:
+            if self._rate_limiter is not None:
+                await self._rate_limiter.aacquire(num_tokens)
+            event_id = self.callback_manager.on_event_start(CBEventType.EMBEDDING)
+            if self._max_retries > 0:
+                embeddings = await aretry_on_exceptions_with_backoff(
+                    lambda: self._aget_text_embeddings(texts),
+                    self._get_errors_to_retry(),
+                    max_tries=self._max_retries + 1,
+                )
+            else:
+                embeddings = await self._aget_text_embeddings(texts)
+            self.callback_manager.on_event_end(
+                CBEventType.EMBEDDING,
+                payload={EventPayload.CHUNKS: texts},
+                event_id=event_id,
+            )
+            return embeddings
+
     def get_queued_text_embeddings(self) -> Tuple[List[str], List[List[float]]]:
         """Get queued text embeddings.
 
         Call embedding API to get embeddings for all queued texts.
 
         """
-        text_queue = self._text_queue
-        cur_batch: List[Tuple[str, str]] = []
         result_ids: List[str] = []
         result_embeddings: List[List[float]] = []
-        for idx, (text_id, text) in enumerate(text_queue):
-            cur_batch.append((text_id, text))
-            text_tokens_count = len(self._tokenizer(text))
-            self._total_tokens_used += text_tokens_count
-            if idx == len(text_queue) - 1 or len(cur_batch) == self._embed_batch_size:
-                # flush
-                event_id = self.callback_manager.on_event_start(CBEventType.EMBEDDING)
-                cur_batch_ids = [text_id for text_id, _ in cur_batch]
-                cur_batch_texts = [text for _, text in cur_batch]
-                embeddings = self._get_text_embeddings(cur_batch_texts)
-                result_ids.extend(cur_batch_ids)
-                result_embeddings.extend(embeddings)
-                self.callback_manager.on_event_end(
-                    CBEventType.EMBEDDING,
-                    payload={EventPayload.CHUNKS: cur_batch_texts},
-                    event_id=event_id,
-                )
-
-                cur_batch = []
+        for batch_ids, batch_texts, num_tokens in self._get_text_batches(
+            self._text_queue
+        ):
+            result_ids.extend(batch_ids)
+            result_embeddings.extend(self._embed_batch(batch_texts, num_tokens))
 
         # reset queue
         self._text_queue = []
@@ -190,40 +416,24 @@ class BaseEmbedding:
     ) -> Tuple[List[str], List[List[float]]]:
         """Asynchronously get a list of text embeddings.
 
-        Call async embedding API to get embeddings for all queued texts in parallel.
+        Call async embedding API to get embeddings for all queued texts, with at
+        most `max_concurrency` requests in flight.
         Argument `text_queue` must be passed in to avoid updating it async.
 
         """
-        cur_batch: List[Tuple[str, str]] = []
-        result_ids: List[str] = []
-        result_embeddings: List[List[float]] = []
-        embeddings_coroutines: List[Coroutine] = []
-        for idx, (text_id, text) in enumerate(text_queue):
-            cur_batch.append((text_id, text))
-            text_tokens_count = len(self._tokenizer(text))
-            self._total_tokens_used += text_tokens_count
-            if idx == len(text_queue) - 1 or len(cur_batch) == self._embed_batch_size:
-                # flush
-                event_id = self.callback_manager.on_event_start(CBEventType.EMBEDDING)
-                cur_batch_ids = [text_id for text_id, _ in cur_batch]
-                cur_batch_texts = [text for _, text in cur_batch]
-                embeddings_coroutines.append(
-                    self._aget_text_embeddings(cur_batch_texts)
-                )
-                result_ids.extend(cur_batch_ids)
-                self.callback_manager.on_event_end(
-                    CBEventType.EMBEDDING,
-                    payload={EventPayload.CHUNKS: cur_batch_texts},
-                    event_id=event_id,
-                )
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+        batches = self._get_text_batches(text_queue)
+        batch_embeddings = await asyncio.gather(
+            *[
+                self._aembed_batch(batch_texts, num_tokens, semaphore)
+                for _, batch_texts, num_tokens in batches
+            ]
+        )
 
-        # flatten the results of asyncio.gather, which is a list of embeddings lists
+        result_ids = [text_id for batch_ids, _, _ in batches for text_id in batch_ids]
         result_embeddings = [
-            embedding
-            for embeddings in await asyncio.gather(*embeddings_coroutines)
-            for embedding in embeddings
+            embedding for embeddings in batch_embeddings for embedding in embeddings
         ]
-
         return result_ids, result_embeddings
 
     def similarity(
@@ -235,6 +445,53 @@ class BaseEmbedding:
         """Get embedding similarity."""
         return similarity(embedding1=embedding1, embedding2=embedding2, mode=mode)
 
+    def similarity_batch(
+        self,
+        query_embedding: Union[np.ndarray, Sequence[float]],
+        embeddings: Union[np.ndarray, Sequence[EMB_TYPE]],
+        mode: SimilarityMode = SimilarityMode.DEFAULT,
+        norms: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """Get similarity of a query with every embedding.
+
+        If `similarity` is overridden, it is used for every embedding.
+
+        """
+        if type(self).similarity is not BaseEmbedding.similarity:
+            query_list = list(query_embedding)
+            return np.array(
+                [
+                    self.similarity(query_list, embedding, mode=mode)
+                    for embedding in embeddings
+                ],
+                dtype=np.float32,
+            )
+        return similarity_batch(query_embedding, embeddings, mode=mode, norms=norms)
+
+    def pairwise_similarity(
+        self,
+        embeddings1: Union[np.ndarray, Sequence[EMB_TYPE]],
+        embeddings2: Union[np.ndarray, Sequence[EMB_TYPE]],
+        mode: SimilarityMode = SimilarityMode.DEFAULT,
+    ) -> np.ndarray:
+        """Get similarity of every pair of embeddings.
+
+        If `similarity` is overridden, it is used for every pair.
+
+        """
+        if type(self).similarity is not BaseEmbedding.similarity:
+            return np.array(
+                [
+                    [
+                        self.similarity(embedding1, embedding2, mode=mode)
+                        for embedding2 in embeddings2
+                    ]
+                    for embedding1 in embeddings1
+                ],
+                dtype=np.float32,
+            ).reshape(len(embeddings1), len(embeddings2))
+        return pairwise_similarity(embeddings1, embeddings2, mode=mode)
+
     @property
     def total_tokens_used(self) -> int:
         """Get the total tokens used so far."""
@@ -0,0 +1,219 @@
+"""Embedding cache."""
+
+import hashlib
+from typing import Dict, List, Optional, Tuple
+
+from llama_index.callbacks.schema import CBEventType, EventPayload
+from llama_index.embeddings.base import BaseEmbedding
+from llama_index.storage.kvstore.simple_kvstore import SimpleKVStore
+from llama_index.storage.kvstore.types import BaseKVStore
+from llama_index.utils import ErrorToRetry
+
+DEFAULT_CACHE_COLLECTION = "embedding_cache"
+# attributes identifying the underlying model, by order of preference
+_MODEL_NAME_ATTRS = ("deployment_name", "text_engine", "model_name", "model")
+
+
+def _get_model_name(embed_model: BaseEmbedding) -> str:
+    """Get a name identifying the model behind an embedding class."""
+    if isinstance(embed_model, CachedEmbedding):
+        return embed_model._model_name
+    name = type(embed_model).__name__
+    for attr in _MODEL_NAME_ATTRS:
+        value = getattr(embed_model, attr, None)
+        if isinstance(value, str):
+            return f"{name}:{value}"
+    return name
+
+
+class CachedEmbedding(BaseEmbedding):
+    """Embedding wrapper caching text embeddings in a key-value store.
+
+    Text embeddings are keyed by a hash of the model name and the text, so
+    re-embedding unchanged chunks (e.g. on rebuilds or `refresh_ref_docs`) is
+    served from the cache. Queued texts are looked up first and only the misses
+    are batched to the wrapped model; query embeddings are not cached.
+
+    Any `BaseKVStore` can be used as backend, e.g. a `SimpleKVStore` (which can
+    be persisted to a local file), a `LRUKVStore` to bound memory, or a
+    remote store such as `MongoDBKVStore` to share the cache.
+
+    Cache hits and misses are counted in `cache_hits` and `cache_misses`, and
+    reported in the payload of `EMBEDDING_CACHE` callback events, separate from
+    the `EMBEDDING` events of the requests to the wrapped model.
+
+    Args:
+        embed_model (BaseEmbedding): embedding model to wrap.
+        kvstore (Optional[BaseKVStore]): cache backend.
+            Defaults to a SimpleKVStore.
+        model_name (Optional[str]): name of the model, part of the cache key.
+            Defaults to the class name and model of `embed_model`.
+        collection (str): collection of the key-value store to use.
+
+    """
+
+    def __init__(
+        self,
+        embed_model: BaseEmbedding,
+        kvstore: Optional[BaseKVStore] = None,
+        model_name: Optional[str] = None,
+        collection: str = DEFAULT_CACHE_COLLECTION,
+    ) -> None:
+        """Init params."""
+        super().__init__(
+            embed_batch_size=embed_model._embed_batch_size,
+            tokenizer=embed_model._tokenizer,
+            callback_manager=embed_model.callback_manager,
+            embed_batch_max_tokens=embed_model._embed_batch_max_tokens,
+            max_concurrency=embed_model._max_concurrency,
+            max_retries=embed_model._max_retries,
+        )
+        # share the rate limit budgets of the wrapped model
+        self._rate_limiter = embed_model._rate_limiter
+        self._embed_model = embed_model
+        self._kvstore = kvstore or SimpleKVStore()
+        self._model_name = model_name or _get_model_name(embed_model)
+        self._collection = collection
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+    @property
+    def embed_model(self) -> BaseEmbedding:
+        """Get wrapped embedding model."""
+        return self._embed_model
+
+    @property
+    def kvstore(self) -> BaseKVStore:
+        """Get cache backend."""
+        return self._kvstore
+
+    @property
+    def cache_hits(self) -> int:
+        """Get the number of texts served from the cache so far."""
+        return self._cache_hits
+
+    @property
+    def cache_misses(self) -> int:
+        """Get the number of texts embedded by the wrapped model so far."""
+        return self._cache_misses
+
+    def _get_cache_key(self, text: str) -> str:
+        """Get cache key of a text."""
+        return hashlib.sha256(f"{self._model_name}\0{text}".encode()).hexdigest()
+
+    def _lookup(self, texts: List[str]) -> Tuple[Dict[str, List[float]], List[str]]:
+        """Look up texts in the cache.
+
+        Returns:
+            Tuple[Dict[str, List[float]], List[str]]: cached embeddings by text,
+                and the (deduplicated) texts missing from the cache.
+
+        """
+        event_id = self.callback_manager.on_event_start(CBEventType.EMBEDDING_CACHE)
+        unique_texts = list(dict.fromkeys(texts))
+        keys = [self._get_cache_key(text) for text in unique_texts]
+        vals = self._kvstore.get_many(keys, collection=self._collection)
+        cached: Dict[str, List[float]] = {}
+        misses: List[str] = []
+        for text, key in zip(unique_texts, keys):
+            val = vals.get(key, None)
+            if val is None:
+                misses.append(text)
+            else:
+                cached[text] = val["embedding"]
+        self._cache_hits += len(cached)
+        self._cache_misses += len(misses)
+        self.callback_manager.on_event_end(
+            CBEventType.EMBEDDING_CACHE,
+            payload={
+                EventPayload.CACHE_HITS: len(cached),
+                EventPayload.CACHE_MISSES: len(misses),
+            },
+            event_id=event_id,
+        )
+        return cached, misses
+
+    def _put(self, texts: List[str], embeddings: List[List[float]]) -> None:
+        """Add embeddings to the cache."""
+        self._kvstore.put_all(
+            [
+                (self._get_cache_key(text), {"embedding": embedding})
+                for text, embedding in zip(texts, embeddings)
+            ],
+            collection=self._collection,
+        )
+
+    def _get_errors_to_retry(self) -> List[ErrorToRetry]:
+        """Get the errors to retry on, from the wrapped model."""
+        return self._embed_model._get_errors_to_retry()
+
+    def _get_query_embedding(self, query: str) -> List[float]:
+        """Get query embedding."""
+        return self._embed_model._get_query_embedding(query)
+
+    def _get_text_embedding(self, text: str) -> List[float]:
+        """Get text embedding, and cache it."""
+        embedding = self._embed_model._get_text_embedding(text)
+        self._put([text], [embedding])
+        return embedding
+
+    async def _aget_text_embedding(self, text: str) -> List[float]:
+        """Asynchronously get text embedding, and cache it."""
+        embedding = await self._embed_model._aget_text_embedding(text)
+        self._put([text], [embedding])
+        return embedding
+
+    def _get_text_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Get text embeddings, and cache them."""
+        embeddings = self._embed_model._get_text_embeddings(texts)
+        self._put(texts, embeddings)
+        return embeddings
+
+    async def _aget_text_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Asynchronously get text embeddings, and cache them."""
+        embeddings = await self._embed_model._aget_text_embeddings(texts)
+        self._put(texts, embeddings)
+        return embeddings
+
+    def get_text_embedding(self, text: str) -> List[float]:
+        """Get text embedding, from the cache if possible."""
+        cached, _ = self._lookup([text])
+        if text in cached:
+            return cached[text]
+        return super().get_text_embedding(text)
+
+    def get_queued_text_embeddings(self) -> Tuple[List[str], List[List[float]]]:
+        """Get queued text embeddings.
+
+        Only texts missing from the cache are sent to the embedding model.
+
+        """
+        text_queue = self._text_queue
+        embeddings, misses = self._lookup([text for _, text in text_queue])
+        self._text_queue = [(text, text) for text in misses]
+        _, miss_embeddings = super().get_queued_text_embeddings()
+        embeddings.update(zip(misses, miss_embeddings))
+
+        return (
+            [text_id for text_id, _ in text_queue],
+            [embeddings[text] for _, text in text_queue],
+        )
+
+    async def aget_queued_text_embeddings(
+        self, text_queue: List[Tuple[str, str]]
+    ) -> Tuple[List[str], List[List[float]]]:
+        """Asynchronously get a list of text embeddings.
+
+        Only texts missing from the cache are sent to the embedding model.
+
+        """
+        embeddings, misses = self._lookup([text for _, text in text_queue])
+        _, miss_embeddings = await super().aget_queued_text_embeddings(
+            [(text, text) for text in misses]
+        )
+        embeddings.update(zip(misses, miss_embeddings))
+
+        return (
+            [text_id for text_id, _ in text_queue],
+            [embeddings[text] for _, text in text_queue],
+        )
@@ -7,7 +7,12 @@ import openai
 from tenacity import retry, stop_after_attempt, wait_random_exponential
 
 from llama_index.callbacks.base import CallbackManager
-from llama_index.embeddings.base import DEFAULT_EMBED_BATCH_SIZE, BaseEmbedding
+from llama_index.embeddings.base import (
+    DEFAULT_EMBED_BATCH_SIZE,
+    DEFAULT_EMBED_MAX_CONCURRENCY,
+    BaseEmbedding,
+)
+from llama_index.utils import ErrorToRetry
 
 
 class OpenAIEmbeddingMode(str, Enum):
@@ -211,6 +216,8 @@ class OpenAIEmbedding(BaseEmbedding):
         deployment_name (Optional[str]): Optional deployment of model. Defaults to None.
             If this value is not None, mode and model will be ignored.
             Only available for using AzureOpenAI.
+
+        See `BaseEmbedding` for the batching, concurrency and rate limit options.
     """
 
     def __init__(
@@ -221,15 +228,41 @@ class OpenAIEmbedding(BaseEmbedding):
         embed_batch_size: int = DEFAULT_EMBED_BATCH_SIZE,
         tokenizer: Optional[Callable] = None,
         callback_manager: Optional[CallbackManager] = None,
+        embed_batch_max_tokens: Optional[int] = None,
+        max_concurrency: int = DEFAULT_EMBED_MAX_CONCURRENCY,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+        max_retries: int = 0,
         **kwargs: Any,
     ) -> None:
         """Init params."""
-        super().__init__(embed_batch_size, tokenizer, callback_manager)
+        super().__init__(
+            embed_batch_size,
+            tokenizer,
+            callback_manager,
+            embed_batch_max_tokens=embed_batch_max_tokens,
+            max_concurrency=max_concurrency,
+            requests_per_minute=requests_per_minute,
+            tokens_per_minute=tokens_per_minute,
+            max_retries=max_retries,
+        )
         self.deployment_name = deployment_name
         self.query_engine = get_engine(mode, model, _QUERY_MODE_MODEL_DICT)
         self.text_engine = get_engine(mode, model, _TEXT_MODE_MODEL_DICT)
         self.openai_kwargs = kwargs
 
+    def _get_errors_to_retry(self) -> List[ErrorToRetry]:
+        """Get the transient OpenAI errors that failed requests are retried on."""
+        return [
+            ErrorToRetry(openai.error.RateLimitError),
+            ErrorToRetry(openai.error.ServiceUnavailableError),
+            ErrorToRetry(openai.error.TryAgain),
+            ErrorToRetry(openai.error.Timeout),
+            ErrorToRetry(openai.error.APIError),
+            ErrorToRetry(openai.error.APIConnectionError, lambda e: e.should_retry),
+            *super()._get_errors_to_retry(),
+        ]
+
     def _get_query_embedding(self, query: str) -> List[float]:
         """Get query embedding."""
         return get_embedding(
@@ -1,6 +1,11 @@
 """Embedding utils for LlamaIndex."""
 
-from typing import List
+import asyncio
+import time
+from collections import deque
+from typing import Callable, Deque, List, Optional, Tuple
+
+RATE_LIMIT_WINDOW_SECS = 60.0
 
 
 def save_embedding(embedding: List[float], file_path: str) -> None:
@@ -16,3 +21,66 @@ def load_embedding(file_path: str) -> List[float]:
             embedding = [float(x) for x in line.strip().split(",")]
             break
         return embedding
+
+
+class RateLimiter:
+    """Sliding-window limiter on requests and tokens per minute.
+
+    A request that would exceed either budget waits until enough of the
+    requests sent within the last minute fall out of the window. A single
+    request larger than the token budget is let through once the window is
+    empty.
+
+    Args:
+        requests_per_minute (Optional[int]): max number of requests per minute.
+        tokens_per_minute (Optional[int]): max number of tokens per minute.
+
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Init params."""
+        self._requests_per_minute = requests_per_minute
+        self._tokens_per_minute = tokens_per_minute
+        self._clock = clock
+        # (time, number of tokens) of the requests in the window
+        self._requests: Deque[Tuple[float, int]] = deque()
+        self._num_tokens = 0
+
+    def _get_delay(self, num_tokens: int) -> float:
+        """Record the request and return 0 if allowed, else the time to wait."""
+        now = self._clock()
+        while self._requests and self._requests[0][0] <= now - RATE_LIMIT_WINDOW_SECS:
+            self._num_tokens -= self._requests.popleft()[1]
+
+        over_requests = (
+            self._requests_per_minute is not None
+            and len(self._requests) >= self._requests_per_minute
+        )
+        over_tokens = (
+            self._tokens_per_minute is not None
+            and self._num_tokens + num_tokens > self._tokens_per_minute
+        )
+        if not self._requests or not (over_requests or over_tokens):
+            self._requests.append((now, num_tokens))
+            self._num_tokens += num_tokens
+            return 0.0
+        return self._requests[0][0] + RATE_LIMIT_WINDOW_SECS - now
+
+    def acquire(self, num_tokens: int = 0) -> None:
+        """Wait until a request of `num_tokens` tokens can be sent."""
+        delay = self._get_delay(num_tokens)
+        while delay > 0:
+            time.sleep(delay)
+            delay = self._get_delay(num_tokens)
+
+    async def aacquire(self, num_tokens: int = 0) -> None:
+        """Asynchronously wait until a request of `num_tokens` can be sent."""
+        delay = self._get_delay(num_tokens)
+        while delay > 0:
+            await asyncio.sleep(delay)
+            delay = self._get_delay(num_tokens)
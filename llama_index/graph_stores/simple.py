@@ -14,6 +14,7 @@ from llama_index.graph_stores.types import (
     DEFAULT_PERSIST_FNAME,
     GraphStore,
 )
+from llama_index.utils import atomic_write, is_same_path
 
 logger = logging.getLogger(__name__)
 
@@ -55,6 +56,8 @@ class SimpleGraphStore(GraphStore):
     """Simple Graph Store.
 
     In this graph store, triplets are stored within a simple, in-memory dictionary.
+    Persisting an unchanged store to the path it was loaded from or last
+    persisted to is skipped.
 
     Args:
         simple_graph_store_data_dict (Optional[dict]): data dict
@@ -71,6 +74,8 @@ class SimpleGraphStore(GraphStore):
         """Initialize params."""
         self._data = data or SimpleGraphStoreData()
         self._fs = fs or fsspec.filesystem("file")
+        # path the current data was loaded from or persisted to, if unchanged since
+        self._persist_path: Optional[str] = None
 
     @classmethod
     def from_persist_dir(
@@ -105,12 +110,14 @@ class SimpleGraphStore(GraphStore):
             self._data.graph_dict[subj] = []
         if (rel, obj) not in self._data.graph_dict[subj]:
             self._data.graph_dict[subj].append([rel, obj])
+            self._persist_path = None
 
     def delete(self, subj: str, rel: str, obj: str) -> None:
         """Delete triplet."""
         if subj in self._data.graph_dict:
             if (rel, obj) in self._data.graph_dict[subj]:
                 self._data.graph_dict[subj].remove([rel, obj])
+                self._persist_path = None
                 if len(self._data.graph_dict[subj]) == 0:
                     del self._data.graph_dict[subj]
 
@@ -121,12 +128,19 @@ class SimpleGraphStore(GraphStore):
     ) -> None:
         """Persist the SimpleGraphStore to a directory."""
         fs = fs or self._fs
+        if is_same_path(persist_path, self._persist_path, fs) and fs.exists(
+            persist_path
+        ):
+            logger.debug(f"Skipping persist of unchanged {__name__}.")
+            return
+
         dirpath = os.path.dirname(persist_path)
         if not fs.exists(dirpath):
             fs.makedirs(dirpath)
 
-        with fs.open(persist_path, "w") as f:
+        with atomic_write(persist_path, fs) as f:
             json.dump(self._data.to_dict(), f)
+        self._persist_path = persist_path
 
     @classmethod
     def from_persist_path(
@@ -145,7 +159,9 @@ class SimpleGraphStore(GraphStore):
         with fs.open(persist_path, "rb") as f:
             data_dict = json.load(f)
             data = SimpleGraphStoreData.from_dict(data_dict)
-        return cls(data)
+        graph_store = cls(data)
+        graph_store._persist_path = persist_path
+        return graph_store
 
     @classmethod
     def from_dict(cls, save_dict: dict) -> "SimpleGraphStore":
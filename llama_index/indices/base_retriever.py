@@ -20,6 +20,18 @@ class BaseRetriever(ABC):
             str_or_query_bundle = QueryBundle(str_or_query_bundle)
         return self._retrieve(str_or_query_bundle)
 
+    async def aretrieve(self, str_or_query_bundle: QueryType) -> List[NodeWithScore]:
+        """Asynchronously retrieve nodes given query.
+
+        Args:
+            str_or_query_bundle (QueryType): Either a query string or
+                a QueryBundle object.
+
+        """
+        if isinstance(str_or_query_bundle, str):
+            str_or_query_bundle = QueryBundle(str_or_query_bundle)
+        return await self._aretrieve(str_or_query_bundle)
+
     @abstractmethod
     def _retrieve(self, query_bundle: QueryBundle) -> List[NodeWithScore]:
         """Retrieve nodes given query.
@@ -28,3 +40,12 @@ class BaseRetriever(ABC):
 
         """
         pass
+
+    async def _aretrieve(self, query_bundle: QueryBundle) -> List[NodeWithScore]:
+        """Asynchronously retrieve nodes given query.
+
+        By default, this calls `_retrieve`. Retrievers reading from the
+        docstore should override it to await the async docstore methods.
+
+        """
+        return self._retrieve(query_bundle)
@@ -1,22 +1,32 @@
 """Common classes/functions for tree index operations."""
 
 
-import asyncio
+import json
 import logging
+import os
 from typing import Dict, List, Optional, Sequence, Tuple
 
-from llama_index.async_utils import run_async_tasks
+import fsspec
+
+from llama_index.async_utils import gather_with_concurrency, run_async_tasks
 from llama_index.callbacks.schema import CBEventType, EventPayload
 from llama_index.data_structs.data_structs import IndexGraph
 from llama_index.data_structs.node import Node
 from llama_index.storage.docstore import BaseDocumentStore
 from llama_index.storage.docstore.registry import get_default_docstore
+from llama_index.storage.index_store.utils import (
+    index_struct_to_json,
+    json_to_index_struct,
+)
 from llama_index.indices.service_context import ServiceContext
 from llama_index.indices.utils import get_sorted_node_list, truncate_text
 from llama_index.prompts.prompts import SummaryPrompt
+from llama_index.utils import atomic_write
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_TREE_BUILD_MAX_CONCURRENCY = 10
+
 
 class GPTTreeIndexBuilder:
     """GPT tree index builder.
@@ -24,6 +34,29 @@ class GPTTreeIndexBuilder:
     Helper class to build the tree-structured index,
     or to synthesize an answer.
 
+    The tree is built level by level: the nodes of a level are read from the
+    docstore in one bulk call, summarized (with at most `max_concurrency`
+    summaries in flight when `use_async`), and the summary nodes are written
+    to the docstore in one bulk call.
+
+    With a `checkpoint_path`, the index graph is checkpointed after every level,
+    and a build restarted with the same leaf nodes resumes after the last
+    checkpointed level. The checkpoint is removed once the build completes.
+    The docstore must be durable (or persisted) for the summary nodes of
+    checkpointed levels to be found on resume; if they are not, the tree is
+    built from scratch.
+
+    Args:
+        num_children (int): number of children of every summary node.
+        summary_prompt (SummaryPrompt): summary prompt.
+        service_context (ServiceContext): service context.
+        docstore (Optional[BaseDocumentStore]): docstore.
+        use_async (bool): whether to summarize the nodes of a level concurrently.
+        max_concurrency (Optional[int]): max number of concurrent summaries when
+            `use_async`. None means no limit.
+        checkpoint_path (Optional[str]): file to checkpoint the build in.
+        fs (Optional[fsspec.AbstractFileSystem]): filesystem of the checkpoint.
+
     """
 
     def __init__(
@@ -33,15 +66,25 @@ class GPTTreeIndexBuilder:
         service_context: ServiceContext,
         docstore: Optional[BaseDocumentStore] = None,
         use_async: bool = False,
+        max_concurrency: Optional[int] = DEFAULT_TREE_BUILD_MAX_CONCURRENCY,
+        checkpoint_path: Optional[str] = None,
+        fs: Optional[fsspec.AbstractFileSystem] = None,
     ) -> None:
         """Initialize with params."""
         if num_children < 2:
             raise ValueError("Invalid number of children.")
+        if max_concurrency is not None and max_concurrency <= 0:
+            raise ValueError("max_concurrency must be > 0")
         self.num_children = num_children
         self.summary_prompt = summary_prompt
         self._service_context = service_context
         self._use_async = use_async
+        self._max_concurrency = max_concurrency
         self._docstore = docstore or get_default_docstore()
+        self._checkpoint_path = checkpoint_path
+        self._fs = fs or fsspec.filesystem("file")
+        # doc hashes of the leaf nodes, to match checkpoints with
+        self._leaf_hashes: Optional[List[str]] = None
 
     @property
     def docstore(self) -> BaseDocumentStore:
@@ -63,21 +106,109 @@ class GPTTreeIndexBuilder:
         for node in nodes:
             index_graph.insert(node)
 
-        if build_tree:
-            return self.build_index_from_nodes(
-                index_graph, index_graph.all_nodes, index_graph.all_nodes, level=0
+        if not build_tree:
+            return index_graph
+
+        self._leaf_hashes = [node.get_doc_hash() for node in nodes]
+        checkpoint = self._load_checkpoint(nodes)
+        if checkpoint is not None:
+            index_graph, level = checkpoint
+            logger.info(f"> Resuming tree build after level {level}")
+            index_graph = self.build_index_from_nodes(
+                index_graph,
+                index_graph.root_nodes,
+                index_graph.all_nodes,
+                level=level + 1,
             )
         else:
-            return index_graph
+            index_graph = self.build_index_from_nodes(
+                index_graph, index_graph.all_nodes, index_graph.all_nodes, level=0
+            )
+        self._remove_checkpoint()
+        return index_graph
+
+    def _load_checkpoint(
+        self, nodes: Sequence[Node]
+    ) -> Optional[Tuple[IndexGraph, int]]:
+        """Load the index graph and level of the checkpoint, if any.
+
+        The leaf nodes of the checkpoint must have the same content as `nodes`,
+        and are replaced with `nodes` in the loaded index graph. Its summary
+        nodes must be in the docstore. Stale checkpoints are ignored, and
+        overwritten by the new build.
+
+        """
+        if self._checkpoint_path is None or not self._fs.exists(self._checkpoint_path):
+            return None
+        with self._fs.open(self._checkpoint_path, "r") as f:
+            checkpoint = json.load(f)
+        if checkpoint["leaf_hashes"] != self._leaf_hashes:
+            logger.warning(
+                f"> Checkpoint {self._checkpoint_path} was built from other nodes, "
+                "building from scratch"
+            )
+            return None
+
+        index_graph = json_to_index_struct(checkpoint["index_graph"])
+        assert isinstance(index_graph, IndexGraph)
+        # leaf nodes are at indices 0..len(nodes) - 1 (see `build_from_nodes`)
+        leaf_id_map = {
+            index_graph.all_nodes[i]: node.get_doc_id() for i, node in enumerate(nodes)
+        }
+        for i, node in enumerate(nodes):
+            index_graph.all_nodes[i] = node.get_doc_id()
+        index_graph.node_id_to_children_ids = {
+            leaf_id_map.get(node_id, node_id): [
+                leaf_id_map.get(child_id, child_id) for child_id in children_ids
+            ]
+            for node_id, children_ids in index_graph.node_id_to_children_ids.items()
+        }
+        index_graph.root_nodes = {
+            index: leaf_id_map.get(node_id, node_id)
+            for index, node_id in index_graph.root_nodes.items()
+        }
+
+        # summary nodes of checkpointed levels must be in the docstore
+        summary_ids = [
+            node_id
+            for index, node_id in index_graph.all_nodes.items()
+            if index >= len(nodes)
+        ]
+        try:
+            self._docstore.get_nodes(summary_ids)
+        except ValueError as e:
+            logger.warning(
+                f"> Summary nodes of checkpoint {self._checkpoint_path} are not in "
+                f"the docstore ({e}), building from scratch"
+            )
+            return None
+        return index_graph, checkpoint["level"]
+
+    def _save_checkpoint(self, index_graph: IndexGraph, level: int) -> None:
+        """Checkpoint the index graph after building a level."""
+        if self._checkpoint_path is None or self._leaf_hashes is None:
+            return
+        dirpath = os.path.dirname(self._checkpoint_path)
+        if dirpath and not self._fs.exists(dirpath):
+            self._fs.makedirs(dirpath)
+        checkpoint = {
+            "level": level,
+            "leaf_hashes": self._leaf_hashes,
+            "index_graph": index_struct_to_json(index_graph),
+        }
+        with atomic_write(self._checkpoint_path, self._fs) as f:
+            json.dump(checkpoint, f)
+
+    def _remove_checkpoint(self) -> None:
+        """Remove the checkpoint of a completed build."""
+        if self._checkpoint_path is not None and self._fs.exists(self._checkpoint_path):
+            self._fs.rm(self._checkpoint_path)
 
     def _prepare_node_and_text_chunks(
         self, cur_node_ids: Dict[int, str]
     ) -> Tuple[List[int], List[List[Node]], List[str]]:
         """Prepare node and text chunks."""
-        cur_nodes = {
-            index: self._docstore.get_node(node_id)
-            for index, node_id in cur_node_ids.items()
-        }
+        cur_nodes = self._docstore.get_node_dict(cur_node_ids)
         cur_node_list = get_sorted_node_list(cur_nodes)
         logger.info(
             f"> Building index from nodes: {len(cur_nodes) // self.num_children} chunks"
@@ -104,10 +235,11 @@ class GPTTreeIndexBuilder:
     ) -> Dict[int, str]:
         """Construct parent nodes.
 
-        Save nodes to docstore.
+        Save nodes to docstore, in one bulk write.
 
         """
         new_node_dict = {}
+        new_nodes = []
         for i, cur_nodes_chunk, new_summary in zip(
             indices, cur_nodes_chunks, summaries
         ):
@@ -121,7 +253,8 @@ class GPTTreeIndexBuilder:
             index_graph.insert(new_node, children_nodes=cur_nodes_chunk)
             index = index_graph.get_index(new_node)
             new_node_dict[index] = new_node.get_doc_id()
-            self._docstore.add_documents([new_node], allow_update=False)
+            new_nodes.append(new_node)
+        self._docstore.add_documents(new_nodes, allow_update=False)
         return new_node_dict
 
     def build_index_from_nodes(
@@ -150,7 +283,9 @@ class GPTTreeIndexBuilder:
                 )
                 for text_chunk in text_chunks
             ]
-            outputs: List[Tuple[str, str]] = run_async_tasks(tasks)
+            outputs: List[Tuple[str, str]] = run_async_tasks(
+                tasks, max_concurrency=self._max_concurrency
+            )
             summaries = [output[0] for output in outputs]
         else:
             summaries = [
@@ -174,6 +309,7 @@ class GPTTreeIndexBuilder:
         all_node_ids.update(new_node_dict)
 
         index_graph.root_nodes = new_node_dict
+        self._save_checkpoint(index_graph, level)
 
         if len(new_node_dict) <= self.num_children:
             return index_graph
@@ -207,7 +343,9 @@ class GPTTreeIndexBuilder:
             )
             for text_chunk in text_chunks
         ]
-        outputs: List[Tuple[str, str]] = await asyncio.gather(*tasks)
+        outputs: List[Tuple[str, str]] = await gather_with_concurrency(
+            tasks, max_concurrency=self._max_concurrency
+        )
         summaries = [output[0] for output in outputs]
         self._service_context.llama_logger.add_log(
             {"summaries": summaries, "level": level}
@@ -224,6 +362,7 @@ class GPTTreeIndexBuilder:
         all_node_ids.update(new_node_dict)
 
         index_graph.root_nodes = new_node_dict
+        self._save_checkpoint(index_graph, level)
 
         if len(new_node_dict) <= self.num_children:
             return index_graph
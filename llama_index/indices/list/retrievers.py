@@ -42,6 +42,17 @@ class ListIndexRetriever(BaseRetriever):
         nodes = self._index.docstore.get_nodes(node_ids)
         return [NodeWithScore(node) for node in nodes]
 
+    async def _aretrieve(
+        self,
+        query_bundle: QueryBundle,
+    ) -> List[NodeWithScore]:
+        """Asynchronously retrieve nodes."""
+        del query_bundle
+
+        node_ids = self._index.index_struct.nodes
+        nodes = await self._index.docstore.aget_nodes(node_ids)
+        return [NodeWithScore(node) for node in nodes]
+
 
 class ListIndexEmbeddingRetriever(BaseRetriever):
     """Embedding based retriever for ListIndex.
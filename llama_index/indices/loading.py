@@ -12,6 +12,7 @@ logger = logging.getLogger(__name__)
 def load_index_from_storage(
     storage_context: StorageContext,
     index_id: Optional[str] = None,
+    warm_up: bool = False,
     **kwargs: Any,
 ) -> BaseIndex:
     """Load index from storage context.
@@ -22,6 +23,8 @@ def load_index_from_storage(
         index_id (Optional[str]): ID of the index to load.
             Defaults to None, which assumes there's only a single index
             in the index store and load it.
+        warm_up (bool): load lazily loaded storage components right away,
+            instead of on first query.
         **kwargs: Additional keyword args to pass to the index constructors.
     """
     index_ids: Optional[Sequence[str]]
@@ -30,7 +33,9 @@ def load_index_from_storage(
     else:
         index_ids = [index_id]
 
-    indices = load_indices_from_storage(storage_context, index_ids=index_ids, **kwargs)
+    indices = load_indices_from_storage(
+        storage_context, index_ids=index_ids, warm_up=warm_up, **kwargs
+    )
 
     if len(indices) == 0:
         raise ValueError(
@@ -48,6 +53,7 @@ def load_index_from_storage(
 def load_indices_from_storage(
     storage_context: StorageContext,
     index_ids: Optional[Sequence[str]] = None,
+    warm_up: bool = False,
     **kwargs: Any,
 ) -> List[BaseIndex]:
     """Load multiple indices from storage context
@@ -57,6 +63,8 @@ def load_indices_from_storage(
             docstore, index store and vector store.
         index_id (Optional[Sequence[str]]): IDs of the indices to load.
             Defaults to None, which loads all indices in the index store.
+        warm_up (bool): load lazily loaded storage components right away,
+            instead of on first query.
         **kwargs: Additional keyword args to pass to the index constructors.
     """
     if index_ids is None:
@@ -79,6 +87,9 @@ def load_indices_from_storage(
             index_struct=index_struct, storage_context=storage_context, **kwargs
         )
         indices.append(index)
+
+    if warm_up:
+        storage_context.warm_up()
     return indices
 
 
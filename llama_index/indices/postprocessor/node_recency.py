@@ -4,6 +4,7 @@ from llama_index.indices.postprocessor.node import BasePydanticNodePostprocessor
 from llama_index.indices.query.schema import QueryBundle
 from llama_index.indices.service_context import ServiceContext
 from llama_index.data_structs.node import NodeWithScore
+from llama_index.embeddings.base import SimilarityMode
 from pydantic import Field
 from typing import Optional, List, Set
 import pandas as pd
@@ -162,6 +163,7 @@ class EmbeddingRecencyPostprocessor(BasePydanticNodePostprocessor):
             )
 
         _, text_embeddings = embed_model.get_queued_text_embeddings()
+        text_embeddings_np = np.asarray(text_embeddings, dtype=np.float32)
         node_ids_to_skip: Set[str] = set()
         for idx, node in enumerate(sorted_nodes):
             if node.node.get_doc_id() in node_ids_to_skip:
@@ -175,15 +177,14 @@ class EmbeddingRecencyPostprocessor(BasePydanticNodePostprocessor):
             )
             query_embedding = embed_model.get_query_embedding(query_text)
 
-            for idx2 in range(idx + 1, len(sorted_nodes)):
-                if sorted_nodes[idx2].node.get_doc_id() in node_ids_to_skip:
-                    continue
-                node2 = sorted_nodes[idx2]
-                if (
-                    np.dot(query_embedding, text_embeddings[idx2])
-                    > self.similarity_cutoff
-                ):
-                    node_ids_to_skip.add(node2.node.get_doc_id())
+            similarities = embed_model.similarity_batch(
+                query_embedding,
+                text_embeddings_np[idx + 1 :],
+                mode=SimilarityMode.DOT_PRODUCT,
+            )
+            for idx2 in np.flatnonzero(similarities > self.similarity_cutoff):
+                node2 = sorted_nodes[idx + 1 + idx2]
+                node_ids_to_skip.add(node2.node.get_doc_id())
 
         return [
             node
@@ -14,7 +14,7 @@ from llama_index.constants import DEFAULT_CONTEXT_WINDOW, DEFAULT_NUM_OUTPUTS
 from llama_index.langchain_helpers.text_splitter import TokenTextSplitter
 from llama_index.llm_predictor.base import LLMMetadata
 from llama_index.prompts.base import Prompt
-from llama_index.prompts.utils import get_empty_prompt_txt
+from llama_index.token_counter.token_count_cache import token_count_cache
 from llama_index.utils import globals_helper
 import logging
 
@@ -44,6 +44,8 @@ class PromptHelper:
         chunk_size_limit (Optional[int]):         Maximum chunk size to use.
         tokenizer (Optional[Callable[[str], List]]): Tokenizer to use.
         separator (str):                        Separator for text splitter
+        use_token_offsets (bool):               Cut text on token offsets when
+            truncating and repacking, see TokenTextSplitter
         max_input_size (int): deprecated, now renamed to context_window
         embedding_limit (int): deprecated, now consolidated with chunk_size_limit
         max_chunk_overlap (int): deprecated, now configured via chunk_overlap_ratio
@@ -58,6 +60,7 @@ class PromptHelper:
         chunk_size_limit: Optional[int] = None,
         tokenizer: Optional[Callable[[str], List]] = None,
         separator: str = " ",
+        use_token_offsets: bool = False,
         # Deprecated kwargs
         max_input_size: Optional[int] = None,
         embedding_limit: Optional[int] = None,
@@ -75,6 +78,7 @@ class PromptHelper:
         # TODO: make configurable
         self._tokenizer = tokenizer or globals_helper.tokenizer
         self._separator = separator
+        self._use_token_offsets = use_token_offsets
 
         self._handle_deprecated_kwargs(
             max_input_size, embedding_limit, max_chunk_overlap
@@ -117,6 +121,7 @@ class PromptHelper:
         chunk_size_limit: Optional[int] = None,
         tokenizer: Optional[Callable[[str], List]] = None,
         separator: str = " ",
+        use_token_offsets: bool = False,
         # Deprecated kwargs
         max_input_size: Optional[int] = None,
         embedding_limit: Optional[int] = None,
@@ -140,12 +145,17 @@ class PromptHelper:
             chunk_size_limit=chunk_size_limit,
             tokenizer=tokenizer,
             separator=separator,
+            use_token_offsets=use_token_offsets,
             # Deprecated kwargs
             max_input_size=max_input_size,
             embedding_limit=embedding_limit,
             max_chunk_overlap=max_chunk_overlap,
         )
 
+    def count_tokens(self, text: str) -> int:
+        """Count the tokens of text, with the tokenizer of the prompt helper."""
+        return token_count_cache.count_tokens(text, self._tokenizer)
+
     def _get_available_context_size(self, prompt: Prompt) -> int:
         """Get available context size.
 
@@ -154,14 +164,18 @@ class PromptHelper:
                 - input (partially filled prompt)
                 - output (room reserved for response)
         """
-        empty_prompt_txt = get_empty_prompt_txt(prompt)
-        prompt_tokens = self._tokenizer(empty_prompt_txt)
-        num_prompt_tokens = len(prompt_tokens)
+        num_prompt_tokens = token_count_cache.get_empty_prompt_num_tokens(
+            prompt, self._tokenizer
+        )
 
         return self.context_window - num_prompt_tokens - self.num_output
 
     def _get_available_chunk_size(
-        self, prompt: Prompt, num_chunks: int = 1, padding: int = 5
+        self,
+        prompt: Prompt,
+        num_chunks: int = 1,
+        padding: int = 5,
+        num_extra_tokens: int = 0,
     ) -> int:
         """Get available chunk size.
 
@@ -169,6 +183,7 @@ class PromptHelper:
             available context window = total context window
                 - input (partially filled prompt)
                 - output (room reserved for response)
+                - extra tokens (of other values to be filled into the prompt)
 
             available chunk size  = available context window  // number_chunks
                 - padding
@@ -177,7 +192,9 @@ class PromptHelper:
         - By default, we use padding of 5 (to save space for formatting needs).
         - The available chunk size is further clamped to chunk_size_limit if specified
         """
-        available_context_size = self._get_available_context_size(prompt)
+        available_context_size = (
+            self._get_available_context_size(prompt) - num_extra_tokens
+        )
 
         result = available_context_size // num_chunks
         result -= padding
@@ -188,12 +205,22 @@ class PromptHelper:
         return result
 
     def get_text_splitter_given_prompt(
-        self, prompt: Prompt, num_chunks: int = 1, padding: int = DEFAULT_PADDING
+        self,
+        prompt: Prompt,
+        num_chunks: int = 1,
+        padding: int = DEFAULT_PADDING,
+        num_extra_tokens: int = 0,
     ) -> TokenTextSplitter:
         """Get text splitter configured to maximally pack available context window,
         taking into account of given prompt, and desired number of chunks.
+
+        `num_extra_tokens` reserves room for other values that will be filled into
+        the prompt, besides the chunks (e.g. the existing answer of a refine
+        prompt), so that the prompt can be partially formatted without them.
         """
-        chunk_size = self._get_available_chunk_size(prompt, num_chunks, padding=padding)
+        chunk_size = self._get_available_chunk_size(
+            prompt, num_chunks, padding=padding, num_extra_tokens=num_extra_tokens
+        )
         if chunk_size == 0:
             raise ValueError("Got 0 as available chunk size.")
         chunk_overlap = int(self.chunk_overlap_ratio * chunk_size)
@@ -202,6 +229,7 @@ class PromptHelper:
             chunk_size=chunk_size,
             chunk_overlap=chunk_overlap,
             tokenizer=self._tokenizer,
+            use_token_offsets=self._use_token_offsets,
         )
         return text_splitter
 
@@ -217,14 +245,21 @@ class PromptHelper:
         return [text_splitter.truncate_text(chunk) for chunk in text_chunks]
 
     def repack(
-        self, prompt: Prompt, text_chunks: Sequence[str], padding: int = DEFAULT_PADDING
+        self,
+        prompt: Prompt,
+        text_chunks: Sequence[str],
+        padding: int = DEFAULT_PADDING,
+        num_extra_tokens: int = 0,
     ) -> List[str]:
         """Repack text chunks to fit available context window.
 
         This will combine text chunks into consolidated chunks
         that more fully "pack" the prompt template given the max_input_size.
+        See `get_text_splitter_given_prompt` for `num_extra_tokens`.
 
         """
-        text_splitter = self.get_text_splitter_given_prompt(prompt, padding=padding)
+        text_splitter = self.get_text_splitter_given_prompt(
+            prompt, padding=padding, num_extra_tokens=num_extra_tokens
+        )
         combined_str = "\n\n".join([c.strip() for c in text_chunks if c.strip()])
         return text_splitter.split_text(combined_str)
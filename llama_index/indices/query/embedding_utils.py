@@ -3,7 +3,7 @@ import heapq
 import math
 from typing import Any, Callable, List, Optional, Tuple
 
-from llama_index.embeddings.base import similarity as default_similarity_fn
+from llama_index.embeddings.base import similarity_batch
 import numpy as np
 from llama_index.vector_stores.types import VectorStoreQueryMode
 
@@ -16,12 +16,49 @@ def get_top_k_embeddings(
     embedding_ids: Optional[List] = None,
     similarity_cutoff: Optional[float] = None,
 ) -> Tuple[List[float], List]:
-    """Get top nodes by similarity to the query."""
+    """Get top nodes by similarity to the query.
+
+    Without a custom `similarity_fn`, cosine similarities are computed for all
+    embeddings at once with `similarity_batch`.
+
+    """
     if embedding_ids is None:
         embedding_ids = [i for i in range(len(embeddings))]
 
-    similarity_fn = similarity_fn or default_similarity_fn
+    if similarity_fn is not None:
+        return _get_top_k_embeddings_with_fn(
+            query_embedding,
+            embeddings,
+            similarity_fn,
+            similarity_top_k=similarity_top_k,
+            embedding_ids=embedding_ids,
+            similarity_cutoff=similarity_cutoff,
+        )
+
+    similarities = similarity_batch(query_embedding, embeddings)
+    candidates = np.arange(len(similarities))
+    if similarity_cutoff is not None:
+        candidates = candidates[similarities > similarity_cutoff]
+    if similarity_top_k and len(candidates) > similarity_top_k:
+        part = np.argpartition(-similarities[candidates], similarity_top_k - 1)
+        candidates = candidates[part[:similarity_top_k]]
+    candidates = candidates[np.argsort(-similarities[candidates], kind="stable")]
 
+    result_similarities = similarities[candidates].astype(float).tolist()
+    result_ids = [embedding_ids[i] for i in candidates]
+
+    return result_similarities, result_ids
+
+
+def _get_top_k_embeddings_with_fn(
+    query_embedding: List[float],
+    embeddings: List[List[float]],
+    similarity_fn: Callable[..., float],
+    similarity_top_k: Optional[int],
+    embedding_ids: List,
+    similarity_cutoff: Optional[float],
+) -> Tuple[List[float], List]:
+    """Get top nodes by similarity to the query, one embedding at a time."""
     similarity_heap: List[Tuple[float, Any]] = []
     for i, emb in enumerate(embeddings):
         similarity = similarity_fn(query_embedding, emb)
@@ -103,6 +140,7 @@ def get_top_k_mmr_embeddings(
     embedding_ids: Optional[List] = None,
     similarity_cutoff: Optional[float] = None,
     mmr_threshold: Optional[float] = None,
+    candidate_top_k: Optional[int] = None,
 ) -> Tuple[List[float], List]:
     """Get top nodes by similarity to the query,
     discount by their similarity to previous results.
@@ -110,53 +148,64 @@ def get_top_k_mmr_embeddings(
     A mmr_threshold of 0 will strongly avoid similarity to previous results.
     A mmr_threshold of 1 will check similarity the query and ignore previous results.
 
+    With the default (cosine) similarity, embeddings are normalized once and every
+    selection round is a single matrix-vector product. `candidate_top_k`
+    optionally restricts MMR to the candidates most similar to the query.
+
     """
     threshold = mmr_threshold or 0.5
-    similarity_fn = similarity_fn or default_similarity_fn
+    if len(embeddings) == 0:
+        return [], []
 
     if embedding_ids is None or embedding_ids == []:
         embedding_ids = [i for i in range(len(embeddings))]
-    full_embed_map = dict(zip(embedding_ids, range(len(embedding_ids))))
-    embed_map = full_embed_map.copy()
-    embed_similarity = {}
-    score: float = -math.inf
-    high_score_id = None
 
-    for i, emb in enumerate(embeddings):
-        similarity = similarity_fn(query_embedding, emb)
-        embed_similarity[embedding_ids[i]] = similarity
-        if similarity * threshold > score:
-            high_score_id = embedding_ids[i]
-            score = similarity * threshold
+    if similarity_fn is None:
+        embeddings_np = np.asarray(embeddings, dtype=np.float64)
+        norms = np.linalg.norm(embeddings_np, axis=1, keepdims=True)
+        embeddings_np = embeddings_np / norms
+        query_np = np.asarray(query_embedding, dtype=np.float64)
+        query_similarities = embeddings_np @ (query_np / np.linalg.norm(query_np))
+    else:
+        query_similarities = np.array(
+            [similarity_fn(query_embedding, emb) for emb in embeddings],
+            dtype=np.float64,
+        )
+
+    candidates = np.arange(len(embeddings))
+    if candidate_top_k is not None and candidate_top_k < len(candidates):
+        candidates = np.argpartition(-query_similarities, candidate_top_k - 1)
+        candidates = np.sort(candidates[:candidate_top_k])
+
+    if similarity_fn is None:
+        candidate_embeddings = embeddings_np[candidates]
+
+    def get_overlaps(idx: int) -> np.ndarray:
+        """Get similarity of every candidate with the given embedding."""
+        if similarity_fn is None:
+            return candidate_embeddings @ embeddings_np[idx]
+        return np.array(
+            [similarity_fn(embeddings[i], embeddings[idx]) for i in candidates],
+            dtype=np.float64,
+        )
 
     results: List[Tuple[Any, Any]] = []
 
-    embedding_length = len(embeddings or [])
-    similarity_top_k_count = similarity_top_k or embedding_length
-    while len(results) < min(similarity_top_k_count, embedding_length):
-        # Calculate the similarity score the for the leading one.
-        results.append((score, high_score_id))
-
-        # Reset so a new high scoring result can be found
-        del embed_map[high_score_id]
-        recent_embedding_id = high_score_id
-        score = -math.inf
-
-        # Iterate through results to find high score
-        for embed_id in embed_map.keys():
-            overlap_with_recent = similarity_fn(
-                embeddings[embed_map[embed_id]],
-                embeddings[full_embed_map[recent_embedding_id]],
-            )
-            if (
-                threshold * embed_similarity[embed_id]
-                - ((1 - threshold) * overlap_with_recent)
-                > score
-            ):
-                score = threshold * embed_similarity[embed_id] - (
-                    (1 - threshold) * overlap_with_recent
-                )
-                high_score_id = embed_id
+    similarity_top_k_count = similarity_top_k or len(candidates)
+    # selected candidates are masked with -inf, so argmax picks the first of the
+    # remaining candidates with the highest score
+    scores = threshold * query_similarities[candidates]
+    selected_mask = np.zeros(len(candidates), dtype=bool)
+    while len(results) < min(similarity_top_k_count, len(candidates)):
+        best = int(np.argmax(scores))
+        results.append((float(scores[best]), embedding_ids[candidates[best]]))
+
+        # discount by the similarity to the most recent result
+        scores = threshold * query_similarities[candidates] - (
+            1 - threshold
+        ) * get_overlaps(candidates[best])
+        selected_mask[best] = True
+        scores[selected_mask] = -math.inf
 
     result_similarities = [s for s, _ in results]
     result_ids = [n for _, n in results]
@@ -75,6 +75,8 @@ class ResponseSynthesizer:
         callback_manager: Optional[CallbackManager] = None,
         optimizer: Optional[BaseTokenUsageOptimizer] = None,
         verbose: bool = False,
+        parallel_merge: bool = False,
+        max_concurrency: Optional[int] = None,
     ) -> "ResponseSynthesizer":
         """Initialize response synthesizer from args.
 
@@ -92,6 +94,10 @@ class ResponseSynthesizer:
             callback_manager (Optional[CallbackManager]): A callback manager.
             optimizer (Optional[BaseTokenUsageOptimizer]): A token usage optimizer.
             verbose (bool): Whether to print debug statements.
+            parallel_merge (bool): Whether refine modes answer text chunks
+                concurrently, then merge the answers (async queries only).
+            max_concurrency (Optional[int]): Max number of concurrent LLM calls
+                with parallel_merge.
 
         """
         service_context = service_context or ServiceContext.from_defaults(
@@ -111,6 +117,8 @@ class ResponseSynthesizer:
                 response_mode,
                 use_async=use_async,
                 streaming=streaming,
+                parallel_merge=parallel_merge,
+                max_concurrency=max_concurrency,
             )
         return cls(
             response_builder,
@@ -1,4 +1,4 @@
-from typing import Any, Sequence
+from typing import Any, List, Optional, Sequence
 
 from llama_index.indices.response.refine import Refine
 from llama_index.indices.service_context import ServiceContext
@@ -14,12 +14,16 @@ class CompactAndRefine(Refine):
         text_qa_template: QuestionAnswerPrompt,
         refine_template: RefinePrompt,
         streaming: bool = False,
+        parallel_merge: bool = False,
+        max_concurrency: Optional[int] = None,
     ) -> None:
         super().__init__(
             service_context=service_context,
             text_qa_template=text_qa_template,
             refine_template=refine_template,
             streaming=streaming,
+            parallel_merge=parallel_merge,
+            max_concurrency=max_concurrency,
         )
 
     async def aget_response(
@@ -28,7 +32,12 @@ class CompactAndRefine(Refine):
         text_chunks: Sequence[str],
         **response_kwargs: Any,
     ) -> RESPONSE_TEXT_TYPE:
-        return self.get_response(query_str, text_chunks, **response_kwargs)
+        """Get compact response."""
+        new_texts = self._repack(query_str, text_chunks)
+        response = await super().aget_response(
+            query_str=query_str, text_chunks=new_texts, **response_kwargs
+        )
+        return response
 
     def get_response(
         self,
@@ -37,6 +46,14 @@ class CompactAndRefine(Refine):
         **response_kwargs: Any,
     ) -> RESPONSE_TEXT_TYPE:
         """Get compact response."""
+        new_texts = self._repack(query_str, text_chunks)
+        response = super().get_response(
+            query_str=query_str, text_chunks=new_texts, **response_kwargs
+        )
+        return response
+
+    def _repack(self, query_str: str, text_chunks: Sequence[str]) -> List[str]:
+        """Repack text chunks to fit the biggest of the prompts."""
         # use prompt helper to fix compact text_chunks under the prompt limitation
         # TODO: This is a temporary fix - reason it's temporary is that
         # the refine template does not account for size of previous answer.
@@ -44,8 +61,4 @@ class CompactAndRefine(Refine):
         refine_template = self._refine_template.partial_format(query_str=query_str)
 
         max_prompt = get_biggest_prompt([text_qa_template, refine_template])
-        new_texts = self._service_context.prompt_helper.repack(max_prompt, text_chunks)
-        response = super().get_response(
-            query_str=query_str, text_chunks=new_texts, **response_kwargs
-        )
-        return response
+        return self._service_context.prompt_helper.repack(max_prompt, text_chunks)
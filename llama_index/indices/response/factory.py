@@ -30,6 +30,8 @@ def get_response_builder(
     mode: ResponseMode = ResponseMode.COMPACT,
     use_async: bool = False,
     streaming: bool = False,
+    parallel_merge: bool = False,
+    max_concurrency: Optional[int] = None,
 ) -> BaseResponseBuilder:
     text_qa_template = text_qa_template or DEFAULT_TEXT_QA_PROMPT
     refine_template = refine_template or DEFAULT_REFINE_PROMPT_SEL
@@ -40,6 +42,8 @@ def get_response_builder(
             text_qa_template=text_qa_template,
             refine_template=refine_template,
             streaming=streaming,
+            parallel_merge=parallel_merge,
+            max_concurrency=max_concurrency,
         )
     elif mode == ResponseMode.COMPACT:
         return CompactAndRefine(
@@ -47,6 +51,8 @@ def get_response_builder(
             text_qa_template=text_qa_template,
             refine_template=refine_template,
             streaming=streaming,
+            parallel_merge=parallel_merge,
+            max_concurrency=max_concurrency,
         )
     elif mode == ResponseMode.TREE_SUMMARIZE:
         return TreeSummarize(
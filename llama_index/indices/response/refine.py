@@ -1,9 +1,13 @@
+import asyncio
 import logging
-from typing import Any, Generator, Optional, Sequence, cast
+from typing import Any, Generator, List, Optional, Sequence, Tuple, cast
 
+from llama_index.async_utils import gather_with_concurrency
+from llama_index.callbacks.schema import CBEventType, EventPayload
 from llama_index.indices.response.base_builder import BaseResponseBuilder
 from llama_index.indices.service_context import ServiceContext
 from llama_index.indices.utils import truncate_text
+from llama_index.prompts.base import Prompt
 from llama_index.prompts.prompts import QuestionAnswerPrompt, RefinePrompt
 from llama_index.response.utils import get_response_text
 from llama_index.token_counter.token_counter import llm_token_counter
@@ -13,16 +17,43 @@ logger = logging.getLogger(__name__)
 
 
 class Refine(BaseResponseBuilder):
+    """Refine a response over text chunks, one chunk at a time.
+
+    In `aget_response` (without streaming), the next text chunk is repacked
+    and tokenized in a worker thread while the LLM calls of the current chunk
+    are in flight. It is prepared speculatively, assuming that the current
+    answer keeps its length, and prepared again if the answer grew.
+    Chunk preparation is reported in `CHUNKING` callback events, next to the
+    `LLM` events of the predictor, so that the latency of both stages can be
+    traced.
+
+    Args:
+        service_context (ServiceContext): service context.
+        text_qa_template (QuestionAnswerPrompt): prompt of the first answer.
+        refine_template (RefinePrompt): prompt refining the answer.
+        streaming (bool): whether to stream the response.
+        parallel_merge (bool): in `aget_response`, answer every text chunk
+            independently and concurrently, then refine the first answer with
+            the others. Only suitable if chunks can be answered independently.
+        max_concurrency (Optional[int]): max number of concurrent LLM calls with
+            `parallel_merge`. None means no limit.
+
+    """
+
     def __init__(
         self,
         service_context: ServiceContext,
         text_qa_template: QuestionAnswerPrompt,
         refine_template: RefinePrompt,
         streaming: bool = False,
+        parallel_merge: bool = False,
+        max_concurrency: Optional[int] = None,
     ) -> None:
         super().__init__(service_context=service_context, streaming=streaming)
         self.text_qa_template = text_qa_template
         self._refine_template = refine_template
+        self._parallel_merge = parallel_merge
+        self._max_concurrency = max_concurrency
 
     @llm_token_counter("aget_response")
     async def aget_response(
@@ -31,7 +62,162 @@ class Refine(BaseResponseBuilder):
         text_chunks: Sequence[str],
         **response_kwargs: Any,
     ) -> RESPONSE_TEXT_TYPE:
-        return self.get_response(query_str, text_chunks, **response_kwargs)
+        if self._streaming:
+            return self.get_response(query_str, text_chunks, **response_kwargs)
+
+        prev_response_obj = cast(
+            Optional[RESPONSE_TEXT_TYPE], response_kwargs.get("prev_response", None)
+        )
+        if isinstance(prev_response_obj, Generator):
+            prev_response_obj = get_response_text(prev_response_obj)
+        if self._parallel_merge and prev_response_obj is None:
+            response = await self._aget_response_parallel(query_str, text_chunks)
+        else:
+            response = await self._aget_response_pipelined(
+                query_str, text_chunks, prev_response_obj
+            )
+        return response or "Empty Response"
+
+    def _prepare_chunk(
+        self, prompt: Prompt, text_chunk: str, num_extra_tokens: int
+    ) -> List[str]:
+        """Repack a text chunk for a prompt, reserving num_extra_tokens."""
+        callback_manager = self._service_context.callback_manager
+        event_id = callback_manager.on_event_start(
+            CBEventType.CHUNKING, payload={EventPayload.CHUNKS: [text_chunk]}
+        )
+        text_chunks = self._service_context.prompt_helper.repack(
+            prompt, [text_chunk], num_extra_tokens=num_extra_tokens
+        )
+        callback_manager.on_event_end(
+            CBEventType.CHUNKING,
+            payload={EventPayload.CHUNKS: text_chunks},
+            event_id=event_id,
+        )
+        return text_chunks
+
+    async def _aget_response_pipelined(
+        self,
+        query_str: str,
+        text_chunks: Sequence[str],
+        prev_response: Optional[str],
+    ) -> Optional[str]:
+        """Refine over text chunks, preparing the next chunk during LLM calls."""
+        # NOTE: templates are partially formatted once, without the existing
+        # answer, so that their token counts are computed once (see
+        # `PromptHelper`). Tokens of the existing answer are reserved separately.
+        text_qa_template = self.text_qa_template.partial_format(query_str=query_str)
+        refine_template = self._refine_template.partial_format(query_str=query_str)
+        llm_predictor = self._service_context.llm_predictor
+        prompt_helper = self._service_context.prompt_helper
+        loop = asyncio.get_running_loop()
+
+        response = prev_response
+        num_response_tokens = (
+            prompt_helper.count_tokens(response) if response is not None else 0
+        )
+        # next chunk prepared in the background, with the answer tokens assumed
+        next_chunk: Optional[Tuple[asyncio.Future, int]] = None
+        for i, text_chunk in enumerate(text_chunks):
+            if next_chunk is None:
+                prompt = text_qa_template if response is None else refine_template
+                cur_text_chunks = self._prepare_chunk(
+                    prompt, text_chunk, num_response_tokens
+                )
+            else:
+                future, num_assumed_tokens = next_chunk
+                cur_text_chunks = await future
+                if num_response_tokens > num_assumed_tokens:
+                    logger.debug("> Answer grew, preparing refine context again")
+                    cur_text_chunks = self._prepare_chunk(
+                        refine_template, text_chunk, num_response_tokens
+                    )
+
+            next_chunk = None
+            if i + 1 < len(text_chunks):
+                future = loop.run_in_executor(
+                    None,
+                    self._prepare_chunk,
+                    refine_template,
+                    text_chunks[i + 1],
+                    num_response_tokens,
+                )
+                next_chunk = (future, num_response_tokens)
+
+            packed_for_qa = response is None
+            for cur_text_chunk in cur_text_chunks:
+                if response is None:
+                    response, formatted_prompt = await llm_predictor.apredict(
+                        text_qa_template, context_str=cur_text_chunk
+                    )
+                    self._log_prompt_and_response(
+                        formatted_prompt, response, log_prefix="Initial"
+                    )
+                elif packed_for_qa:
+                    # sub-chunks packed for the QA prompt may not fit in the
+                    # refine prompt with the answer: repack them, as in
+                    # `_give_response_single`
+                    for refine_chunk in self._prepare_chunk(
+                        refine_template,
+                        cur_text_chunk,
+                        prompt_helper.count_tokens(response),
+                    ):
+                        response = await self._arefine_chunk(
+                            refine_template, response, refine_chunk
+                        )
+                else:
+                    response = await self._arefine_chunk(
+                        refine_template, response, cur_text_chunk
+                    )
+            if response is not None:
+                num_response_tokens = prompt_helper.count_tokens(response)
+        return response
+
+    async def _arefine_chunk(
+        self, refine_template: Prompt, response: str, text_chunk: str
+    ) -> str:
+        """Refine the answer with a text chunk already packed for the prompt."""
+        logger.debug(f"> Refine context: {truncate_text(text_chunk, 50)}")
+        response, formatted_prompt = await self._service_context.llm_predictor.apredict(
+            refine_template,
+            existing_answer=response,
+            context_msg=text_chunk,
+        )
+        self._log_prompt_and_response(formatted_prompt, response, log_prefix="Refined")
+        return response
+
+    async def _aget_response_parallel(
+        self, query_str: str, text_chunks: Sequence[str]
+    ) -> Optional[str]:
+        """Answer text chunks concurrently, then merge the answers."""
+        text_qa_template = self.text_qa_template.partial_format(query_str=query_str)
+        cur_text_chunks = [
+            cur_text_chunk
+            for text_chunk in text_chunks
+            for cur_text_chunk in self._prepare_chunk(text_qa_template, text_chunk, 0)
+        ]
+        tasks = [
+            self._service_context.llm_predictor.apredict(
+                text_qa_template, context_str=cur_text_chunk
+            )
+            for cur_text_chunk in cur_text_chunks
+        ]
+        outputs: List[Tuple[str, str]] = await gather_with_concurrency(
+            tasks, max_concurrency=self._max_concurrency
+        )
+        for response, formatted_prompt in outputs:
+            self._log_prompt_and_response(
+                formatted_prompt, response, log_prefix="Initial"
+            )
+
+        responses = [response for response, _ in outputs if response]
+        if len(responses) <= 1:
+            return responses[0] if responses else None
+        # NOTE: other answers are repacked together, to merge them in as few
+        # refine calls as possible
+        return await self._aget_response_pipelined(
+            query_str, ["\n".join(responses[1:])], responses[0]
+        )
 
     @llm_token_counter("get_response")
     def get_response(
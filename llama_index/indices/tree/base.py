@@ -8,7 +8,10 @@ from llama_index.data_structs.data_structs import IndexGraph
 from llama_index.data_structs.node import Node
 from llama_index.indices.base import BaseIndex
 from llama_index.indices.base_retriever import BaseRetriever
-from llama_index.indices.common_tree.base import GPTTreeIndexBuilder
+from llama_index.indices.common_tree.base import (
+    DEFAULT_TREE_BUILD_MAX_CONCURRENCY,
+    GPTTreeIndexBuilder,
+)
 from llama_index.indices.service_context import ServiceContext
 from llama_index.indices.tree.inserter import TreeIndexInserter
 from llama_index.prompts.default_prompts import (
@@ -51,6 +54,13 @@ class TreeIndex(BaseIndex[IndexGraph]):
             (see :ref:`Prompt-Templates`).
         num_children (int): The number of children each node should have.
         build_tree (bool): Whether to build the tree during index construction.
+        use_async (bool): Whether to summarize the nodes of a tree level
+            concurrently.
+        max_concurrency (Optional[int]): Max number of concurrent summaries
+            with `use_async`. None means no limit.
+        checkpoint_path (Optional[str]): File to checkpoint the tree build in
+            after every level, to resume an interrupted build from
+            (see `GPTTreeIndexBuilder`).
 
     """
 
@@ -66,6 +76,8 @@ class TreeIndex(BaseIndex[IndexGraph]):
         num_children: int = 10,
         build_tree: bool = True,
         use_async: bool = False,
+        max_concurrency: Optional[int] = DEFAULT_TREE_BUILD_MAX_CONCURRENCY,
+        checkpoint_path: Optional[str] = None,
         **kwargs: Any,
     ) -> None:
         """Initialize params."""
@@ -75,6 +87,8 @@ class TreeIndex(BaseIndex[IndexGraph]):
         self.insert_prompt: TreeInsertPrompt = insert_prompt or DEFAULT_INSERT_PROMPT
         self.build_tree = build_tree
         self._use_async = use_async
+        self._max_concurrency = max_concurrency
+        self._checkpoint_path = checkpoint_path
         super().__init__(
             nodes=nodes,
             index_struct=index_struct,
@@ -126,6 +140,8 @@ class TreeIndex(BaseIndex[IndexGraph]):
             service_context=self._service_context,
             use_async=self._use_async,
             docstore=self._docstore,
+            max_concurrency=self._max_concurrency,
+            checkpoint_path=self._checkpoint_path,
         )
         index_graph = index_builder.build_from_nodes(nodes, build_tree=self.build_tree)
         return index_graph
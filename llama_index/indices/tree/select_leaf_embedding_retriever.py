@@ -86,18 +86,17 @@ class TreeSelectLeafEmbeddingRetriever(TreeSelectLeafRetriever):
                     query_bundle.embedding_strs
                 )
             )
-        similarities = []
         for node in nodes:
             if node.embedding is None:
                 node.embedding = self._service_context.embed_model.get_text_embedding(
                     node.get_text()
                 )
 
-            similarity = self._service_context.embed_model.similarity(
-                query_bundle.embedding, node.embedding
-            )
-            similarities.append(similarity)
-        return similarities
+        similarities = self._service_context.embed_model.similarity_batch(
+            query_bundle.embedding,
+            [cast(List[float], node.embedding) for node in nodes],
+        )
+        return similarities.astype(float).tolist()
 
     def _get_most_similar_nodes(
         self, nodes: List[Node], query_bundle: QueryBundle
@@ -4,19 +4,27 @@ An index that that is built on top of an existing vector store.
 
 """
 
-from typing import Any, Dict, List, Optional, Sequence, Tuple
+import json
+import os
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
+
+import fsspec
 
 from llama_index.async_utils import run_async_tasks
-from llama_index.data_structs.data_structs import IndexDict
+from llama_index.data_structs.data_structs import IndexDict, IndexStruct
 from llama_index.data_structs.node import ImageNode, IndexNode, Node
 from llama_index.indices.base import BaseIndex
 from llama_index.indices.base_retriever import BaseRetriever
 from llama_index.indices.service_context import ServiceContext
+from llama_index.readers.schema.base import Document
 from llama_index.storage.docstore.types import RefDocInfo
 from llama_index.storage.storage_context import StorageContext
 from llama_index.token_counter.token_counter import llm_token_counter
+from llama_index.utils import iter_batch
 from llama_index.vector_stores.types import NodeWithEmbedding, VectorStore
 
+DEFAULT_STREAM_WINDOW_SIZE = 1000
+
 
 class VectorStoreIndex(BaseIndex[IndexDict]):
     """Vector Store Index.
@@ -160,19 +168,7 @@ class VectorStoreIndex(BaseIndex[IndexDict]):
         embedding_results = await self._aget_node_embedding_results(nodes)
         new_ids = self._vector_store.add(embedding_results)
 
-        # if the vector store doesn't store text, we need to add the nodes to the
-        # index struct and document store
-        if not self._vector_store.stores_text or self._store_nodes_override:
-            for result, new_id in zip(embedding_results, new_ids):
-                index_struct.add_node(result.node, text_id=new_id)
-                self._docstore.add_documents([result.node], allow_update=True)
-        else:
-            # NOTE: if the vector store keeps text,
-            # we only need to add image and index nodes
-            for result, new_id in zip(embedding_results, new_ids):
-                if isinstance(result.node, (ImageNode, IndexNode)):
-                    index_struct.add_node(result.node, text_id=new_id)
-                    self._docstore.add_documents([result.node], allow_update=True)
+        self._add_embedding_results_to_index(index_struct, embedding_results, new_ids)
 
     def _add_nodes_to_index(
         self,
@@ -185,20 +181,28 @@ class VectorStoreIndex(BaseIndex[IndexDict]):
 
         embedding_results = self._get_node_embedding_results(nodes)
         new_ids = self._vector_store.add(embedding_results)
+        self._add_embedding_results_to_index(index_struct, embedding_results, new_ids)
 
-        if not self._vector_store.stores_text or self._store_nodes_override:
-            # NOTE: if the vector store doesn't store text,
-            # we need to add the nodes to the index struct and document store
-            for result, new_id in zip(embedding_results, new_ids):
-                index_struct.add_node(result.node, text_id=new_id)
-                self._docstore.add_documents([result.node], allow_update=True)
-        else:
+    def _add_embedding_results_to_index(
+        self,
+        index_struct: IndexDict,
+        embedding_results: List[NodeWithEmbedding],
+        new_ids: List[str],
+    ) -> None:
+        """Add nodes added to the vector store to the index struct and docstore."""
+        nodes_to_store = []
+        for result, new_id in zip(embedding_results, new_ids):
             # NOTE: if the vector store keeps text,
             # we only need to add image and index nodes
-            for result, new_id in zip(embedding_results, new_ids):
-                if isinstance(result.node, (ImageNode, IndexNode)):
-                    index_struct.add_node(result.node, text_id=new_id)
-                    self._docstore.add_documents([result.node], allow_update=True)
+            if (
+                not self._vector_store.stores_text
+                or self._store_nodes_override
+                or isinstance(result.node, (ImageNode, IndexNode))
+            ):
+                index_struct.add_node(result.node, text_id=new_id)
+                nodes_to_store.append(result.node)
+        if nodes_to_store:
+            self._docstore.add_documents(nodes_to_store, allow_update=True)
 
     def _build_index_from_nodes(self, nodes: Sequence[Node]) -> IndexDict:
         """Build index from nodes."""
@@ -235,6 +239,144 @@ class VectorStoreIndex(BaseIndex[IndexDict]):
         self._insert(nodes, **insert_kwargs)
         self._storage_context.index_store.add_index_struct(self._index_struct)
 
+    @classmethod
+    def from_documents_stream(
+        cls,
+        documents: Iterable[Union[Document, Node]],
+        storage_context: Optional[StorageContext] = None,
+        service_context: Optional[ServiceContext] = None,
+        window_size: int = DEFAULT_STREAM_WINDOW_SIZE,
+        checkpoint_path: Optional[str] = None,
+        fs: Optional[fsspec.AbstractFileSystem] = None,
+        **kwargs: Any,
+    ) -> "VectorStoreIndex":
+        """Build index from a stream of documents (or nodes), window by window.
+
+        See `insert_stream`. If `checkpoint_path` points to the checkpoint of an
+        interrupted build, the index it refers to is loaded from the index store
+        of `storage_context` and the build resumes where it stopped.
+
+        """
+        storage_context = storage_context or StorageContext.from_defaults()
+        service_context = service_context or ServiceContext.from_defaults()
+        fs = fs or fsspec.filesystem("file")
+
+        index_struct: Optional[IndexStruct] = None
+        if checkpoint_path is not None and fs.exists(checkpoint_path):
+            index_id, _ = _load_stream_checkpoint(checkpoint_path, fs)
+            index_struct = storage_context.index_store.get_index_struct(index_id)
+        if isinstance(index_struct, IndexDict):
+            index = cls(
+                index_struct=index_struct,
+                storage_context=storage_context,
+                service_context=service_context,
+                **kwargs,
+            )
+        else:
+            index = cls(
+                nodes=[],
+                storage_context=storage_context,
+                service_context=service_context,
+                **kwargs,
+            )
+        index.insert_stream(
+            documents, window_size=window_size, checkpoint_path=checkpoint_path, fs=fs
+        )
+        return index
+
+    def insert_stream(
+        self,
+        documents: Iterable[Union[Document, Node]],
+        window_size: int = DEFAULT_STREAM_WINDOW_SIZE,
+        checkpoint_path: Optional[str] = None,
+        fs: Optional[fsspec.AbstractFileSystem] = None,
+    ) -> None:
+        """Insert a stream of documents (or nodes), window by window.
+
+        Documents are consumed `window_size` at a time: each window is parsed,
+        embedded, added to the vector store and written to the docstore before
+        the next one is read, so memory stays bounded by the window size.
+
+        Args:
+            documents (Iterable[Union[Document, Node]]): documents or nodes.
+            window_size (int): number of documents (or nodes) per window.
+            checkpoint_path (Optional[str]): file in which the ids of the
+                documents (or nodes) of inserted windows are recorded, along
+                with the index struct. On resume, the documents (or nodes)
+                recorded before the run started are skipped. Documents of the
+                first window after a resume are deleted from the index before
+                being re-inserted, since that window may have been partially
+                inserted; nodes are re-inserted with the same ids. The
+                checkpoint is removed once the stream is fully consumed. The
+                vector store, docstore and index store must be durable (or
+                persisted) for the build to be resumable.
+            fs (Optional[fsspec.AbstractFileSystem]): filesystem of the
+                checkpoint file.
+
+        """
+        if window_size <= 0:
+            raise ValueError("window_size must be > 0")
+        fs = fs or fsspec.filesystem("file")
+        # NOTE: only ids recorded by previous runs are skipped: a document's
+        # nodes may span several windows of the current run
+        skipped_ids: Set[str] = set()
+        resumed = False
+        if checkpoint_path is not None and fs.exists(checkpoint_path):
+            index_id, skipped_ids = _load_stream_checkpoint(checkpoint_path, fs)
+            if index_id != self.index_id:
+                raise ValueError(
+                    f"Checkpoint {checkpoint_path} belongs to index {index_id}."
+                )
+            resumed = True
+
+        with self._service_context.callback_manager.as_trace("insert_stream"):
+            for window in iter_batch(documents, window_size):
+                window = [
+                    doc for doc in window if _get_stream_id(doc) not in skipped_ids
+                ]
+                if not window:
+                    continue
+                if resumed:
+                    # clean up the window that was interrupted
+                    for doc in window:
+                        if isinstance(doc, Document):
+                            self.delete_ref_doc(
+                                doc.get_doc_id(), delete_from_docstore=True
+                            )
+                    resumed = False
+
+                self._insert_window(window)
+                if checkpoint_path is not None:
+                    # the index struct must be stored before the window is
+                    # recorded as inserted
+                    self._storage_context.index_store.add_index_struct(
+                        self._index_struct
+                    )
+                    _append_stream_checkpoint(
+                        checkpoint_path,
+                        self.index_id,
+                        [_get_stream_id(doc) for doc in window],
+                        fs,
+                    )
+        self._storage_context.index_store.add_index_struct(self._index_struct)
+        # the stream was fully consumed, so the build is not resumed again
+        if checkpoint_path is not None and fs.exists(checkpoint_path):
+            fs.rm(checkpoint_path)
+
+    def _insert_window(self, window: Sequence[Union[Document, Node]]) -> None:
+        """Parse and insert a window of documents (or nodes)."""
+        documents = [doc for doc in window if isinstance(doc, Document)]
+        nodes = [doc for doc in window if isinstance(doc, Node)]
+        for doc in documents:
+            self._docstore.set_document_hash(doc.get_doc_id(), doc.get_doc_hash())
+        nodes.extend(
+            self._service_context.node_parser.get_nodes_from_documents(documents)
+        )
+        if self._use_async:
+            run_async_tasks([self._async_add_nodes_to_index(self._index_struct, nodes)])
+        else:
+            self._add_nodes_to_index(self._index_struct, nodes)
+
     def _delete_node(self, doc_id: str, **delete_kwargs: Any) -> None:
         pass
 
@@ -302,4 +444,44 @@ class VectorStoreIndex(BaseIndex[IndexDict]):
             )
 
 
+def _get_stream_id(doc: Union[Document, Node]) -> str:
+    """Get id of a streamed document or node."""
+    return doc.get_doc_id()
+
+
+def _load_stream_checkpoint(
+    checkpoint_path: str, fs: fsspec.AbstractFileSystem
+) -> Tuple[str, Set[str]]:
+    """Load index id and ids of inserted documents from a checkpoint file."""
+    index_id = ""
+    ids: Set[str] = set()
+    with fs.open(checkpoint_path, "r") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # the last record may have been cut by a crash
+                break
+            index_id = record["index_id"]
+            ids.update(record["ids"])
+    return index_id, ids
+
+
+def _append_stream_checkpoint(
+    checkpoint_path: str,
+    index_id: str,
+    ids: List[str],
+    fs: fsspec.AbstractFileSystem,
+) -> None:
+    """Record ids of inserted documents (or nodes) in a checkpoint file."""
+    dirpath = os.path.dirname(checkpoint_path)
+    if dirpath and not fs.exists(dirpath):
+        fs.makedirs(dirpath)
+    record = {"index_id": index_id, "ids": ids}
+    with fs.open(checkpoint_path, "a") as f:
+        f.write(json.dumps(record) + "\n")
+
+
 GPTVectorStoreIndex = VectorStoreIndex
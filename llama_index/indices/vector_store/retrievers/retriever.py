@@ -15,6 +15,7 @@ from llama_index.vector_stores.types import (
     MetadataFilters,
     VectorStoreQuery,
     VectorStoreQueryMode,
+    VectorStoreQueryResult,
 )
 
 
@@ -64,6 +65,48 @@ class VectorIndexRetriever(BaseRetriever):
         self,
         query_bundle: QueryBundle,
     ) -> List[NodeWithScore]:
+        query_result = self._vector_store.query(
+            self._build_vector_store_query(query_bundle), **self._kwargs
+        )
+
+        if query_result.nodes is None:
+            # NOTE: vector store does not keep text and returns node indices.
+            # Need to recover all nodes from docstore
+            query_result.nodes = self._docstore.get_nodes(
+                self._get_node_ids(query_result)
+            )
+        else:
+            # NOTE: vector store keeps text, returns nodes.
+            # Only need to recover image or index nodes from docstore
+            for i in self._get_nodes_to_recover(query_result):
+                node_id = query_result.nodes[i].get_doc_id()
+                if self._docstore.document_exists(node_id):
+                    query_result.nodes[i] = self._docstore.get_node(node_id)
+
+        return self._build_node_list_from_query_result(query_result)
+
+    @llm_token_counter("retrieve")
+    async def _aretrieve(
+        self,
+        query_bundle: QueryBundle,
+    ) -> List[NodeWithScore]:
+        query_result = self._vector_store.query(
+            self._build_vector_store_query(query_bundle), **self._kwargs
+        )
+
+        if query_result.nodes is None:
+            query_result.nodes = await self._docstore.aget_nodes(
+                self._get_node_ids(query_result)
+            )
+        else:
+            for i in self._get_nodes_to_recover(query_result):
+                node_id = query_result.nodes[i].get_doc_id()
+                if await self._docstore.adocument_exists(node_id):
+                    query_result.nodes[i] = await self._docstore.aget_node(node_id)
+
+        return self._build_node_list_from_query_result(query_result)
+
+    def _build_vector_store_query(self, query_bundle: QueryBundle) -> VectorStoreQuery:
         if self._vector_store.is_embedding_query:
             if query_bundle.embedding is None:
                 query_bundle.embedding = (
@@ -72,7 +115,7 @@ class VectorIndexRetriever(BaseRetriever):
                     )
                 )
 
-        query = VectorStoreQuery(
+        return VectorStoreQuery(
             query_embedding=query_bundle.embedding,
             similarity_top_k=self._similarity_top_k,
             doc_ids=self._doc_ids,
@@ -81,35 +124,32 @@ class VectorIndexRetriever(BaseRetriever):
             alpha=self._alpha,
             filters=self._filters,
         )
-        query_result = self._vector_store.query(query, **self._kwargs)
-
-        if query_result.nodes is None:
-            # NOTE: vector store does not keep text and returns node indices.
-            # Need to recover all nodes from docstore
-            if query_result.ids is None:
-                raise ValueError(
-                    "Vector store query result should return at "
-                    "least one of nodes or ids."
-                )
-            assert isinstance(self._index.index_struct, IndexDict)
-            node_ids = [
-                self._index.index_struct.nodes_dict[idx] for idx in query_result.ids
-            ]
-            nodes = self._docstore.get_nodes(node_ids)
-            query_result.nodes = nodes
-        else:
-            # NOTE: vector store keeps text, returns nodes.
-            # Only need to recover image or index nodes from docstore
-            for i in range(len(query_result.nodes)):
-                if (not self._vector_store.stores_text) or query_result.nodes[
-                    i
-                ].get_origin_type() != NodeType.TEXT:
-                    node_id = query_result.nodes[i].get_doc_id()
-                    if node_id in self._docstore.docs:
-                        query_result.nodes[i] = self._docstore.get_node(node_id)
 
+    def _get_node_ids(self, query_result: VectorStoreQueryResult) -> List[str]:
+        if query_result.ids is None:
+            raise ValueError(
+                "Vector store query result should return at "
+                "least one of nodes or ids."
+            )
+        assert isinstance(self._index.index_struct, IndexDict)
+        return [self._index.index_struct.nodes_dict[idx] for idx in query_result.ids]
+
+    def _get_nodes_to_recover(self, query_result: VectorStoreQueryResult) -> List[int]:
+        """Get positions of the result nodes to recover from the docstore."""
+        assert query_result.nodes is not None
+        return [
+            i
+            for i, node in enumerate(query_result.nodes)
+            if (not self._vector_store.stores_text)
+            or node.get_origin_type() != NodeType.TEXT
+        ]
+
+    def _build_node_list_from_query_result(
+        self, query_result: VectorStoreQueryResult
+    ) -> List[NodeWithScore]:
         log_vector_store_query_result(query_result)
 
+        assert query_result.nodes is not None
         node_with_scores: List[NodeWithScore] = []
         for ind, node in enumerate(query_result.nodes):
             score: Optional[float] = None
@@ -1,12 +1,20 @@
 """Text splitter implementations."""
+import bisect
+import re
 from dataclasses import dataclass
-from typing import Callable, List, Optional
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
 
 from llama_index.constants import DEFAULT_CHUNK_OVERLAP, DEFAULT_CHUNK_SIZE
 from llama_index.bridge.langchain import TextSplitter
 
 from llama_index.callbacks.base import CallbackManager
 from llama_index.callbacks.schema import CBEventType, EventPayload
+from llama_index.token_counter.token_count_cache import (
+    count_tokens,
+    get_tiktoken_encoding,
+)
 from llama_index.utils import globals_helper
 
 
@@ -24,7 +32,18 @@ class TextSplit:
 
 
 class TokenTextSplitter(TextSplitter):
-    """Implementation of splitting text that looks at word tokens."""
+    """Implementation of splitting text that looks at word tokens.
+
+    By default, text is split on `separator` and the splits are packed into
+    chunks using their token counts, with each split tokenized only once.
+
+    With `use_token_offsets=True`, the whole text is instead tokenized once, and
+    chunks (and their overlaps) are cut on the token -> character offsets of
+    that tokenization, at the last separator that fits in the chunk size. This
+    is faster on long texts, but chunk boundaries can differ slightly from the
+    default mode. Requires a tiktoken tokenizer (the default on Python >= 3.9).
+
+    """
 
     def __init__(
         self,
@@ -34,6 +53,7 @@ class TokenTextSplitter(TextSplitter):
         tokenizer: Optional[Callable] = None,
         backup_separators: Optional[List[str]] = ["\n"],
         callback_manager: Optional[CallbackManager] = None,
+        use_token_offsets: bool = False,
     ):
         """Initialize with parameters."""
         if chunk_overlap > chunk_size:
@@ -47,6 +67,9 @@ class TokenTextSplitter(TextSplitter):
         self.tokenizer = tokenizer or globals_helper.tokenizer
         self._backup_separators = backup_separators
         self.callback_manager = callback_manager or CallbackManager([])
+        if use_token_offsets and get_tiktoken_encoding(self.tokenizer) is None:
+            raise ValueError("use_token_offsets requires a tiktoken tokenizer.")
+        self._use_token_offsets = use_token_offsets
 
     def _reduce_chunk_size(
         self, start_idx: int, cur_idx: int, splits: List[str]
@@ -78,11 +101,26 @@ class TokenTextSplitter(TextSplitter):
         (via backup separators if specified, or force chunking).
 
         """
-        new_splits = []
+        new_splits, _ = self._preprocess_splits_with_num_tokens(splits, chunk_size)
+        return new_splits
+
+    def _preprocess_splits_with_num_tokens(
+        self, splits: List[str], chunk_size: int
+    ) -> Tuple[List[str], List[int]]:
+        """Process splits (see `_preprocess_splits`), and count their tokens.
+
+        Returns:
+            Tuple[List[str], List[int]]: the new splits, and the number of tokens
+                of every new split.
+
+        """
+        new_splits: List[str] = []
+        new_num_tokens: List[int] = []
         for split in splits:
-            num_cur_tokens = len(self.tokenizer(split))
+            num_cur_tokens = count_tokens(split, self.tokenizer)
             if num_cur_tokens <= chunk_size:
                 new_splits.append(split)
+                new_num_tokens.append(num_cur_tokens)
             else:
                 cur_splits = [split]
                 if self._backup_separators:
@@ -93,28 +131,28 @@ class TokenTextSplitter(TextSplitter):
                 else:
                     cur_splits = [split]
 
-                cur_splits2 = []
                 for cur_split in cur_splits:
-                    num_cur_tokens = len(self.tokenizer(cur_split))
+                    num_cur_tokens = count_tokens(cur_split, self.tokenizer)
                     if num_cur_tokens <= chunk_size:
-                        cur_splits2.extend([cur_split])
+                        new_splits.append(cur_split)
+                        new_num_tokens.append(num_cur_tokens)
                     else:
                         # split cur_split according to chunk size of the token numbers
-                        cur_split_chunks = []
                         end_idx = len(cur_split)
-                        while len(self.tokenizer(cur_split[0:end_idx])) > chunk_size:
+                        while num_cur_tokens > chunk_size:
                             for i in range(1, end_idx):
                                 tmp_split = cur_split[0 : end_idx - i]
-                                if len(self.tokenizer(tmp_split)) <= chunk_size:
-                                    cur_split_chunks.append(tmp_split)
+                                num_tmp_tokens = len(self.tokenizer(tmp_split))
+                                if num_tmp_tokens <= chunk_size:
+                                    new_splits.append(tmp_split)
+                                    new_num_tokens.append(num_tmp_tokens)
                                     cur_split = cur_split[end_idx - i : end_idx]
                                     end_idx = len(cur_split)
                                     break
-                        cur_split_chunks.append(cur_split)
-                        cur_splits2.extend(cur_split_chunks)
-
-                new_splits.extend(cur_splits2)
-        return new_splits
+                            num_cur_tokens = len(self.tokenizer(cur_split[0:end_idx]))
+                        new_splits.append(cur_split)
+                        new_num_tokens.append(num_cur_tokens)
+        return new_splits, new_num_tokens
 
     def _postprocess_splits(self, docs: List[TextSplit]) -> List[TextSplit]:
         """Post-process splits."""
@@ -126,6 +164,129 @@ class TokenTextSplitter(TextSplitter):
             new_docs.append(doc)
         return new_docs
 
+    def _get_token_offsets(self, text: str) -> List[int]:
+        """Tokenize text once, and get the character offset of every token.
+
+        Returns:
+            List[int]: start offsets of the tokens, followed by len(text).
+
+        """
+        encoding = get_tiktoken_encoding(self.tokenizer)
+        assert encoding is not None
+        tokens = self.tokenizer(text)
+        if len(tokens) == 0:
+            return [len(text)]
+        # NOTE: vectorized version of encoding.decode_with_offsets: the offset of
+        # a token is the number of characters started in the bytes before it
+        # (minus one if the token starts in the middle of a character)
+        token_bytes = encoding.decode_tokens_bytes(tokens)
+        data = np.frombuffer(b"".join(token_bytes), dtype=np.uint8)
+        is_char_start = (data & 0xC0) != 0x80
+        num_chars_before = np.concatenate([[0], np.cumsum(is_char_start)])
+        byte_offsets = np.cumsum([0] + [len(b) for b in token_bytes[:-1]])
+        offsets = num_chars_before[byte_offsets] - ~is_char_start[byte_offsets]
+        return offsets.tolist() + [len(text)]
+
+    def _get_separator_boundaries(self, text: str, offsets: List[int]) -> List[int]:
+        """Get indices of the tokens starting at (or right after) a separator."""
+        separator_offsets = []
+        for match in re.finditer(re.escape(self._separator), text):
+            separator_offsets.extend([match.start(), match.end()])
+        is_boundary = np.isin(offsets[1:-1], separator_offsets)
+        return (np.flatnonzero(is_boundary) + 1).tolist()
+
+    def _strip_separators(self, text: str, start: int, end: int) -> Tuple[int, int]:
+        """Move character offsets start/end past separators at the chunk edges."""
+        sep_len = len(self._separator)
+        while start < end and text.startswith(self._separator, start):
+            start += sep_len
+        while end > start and text.endswith(self._separator, start, end):
+            end -= sep_len
+        return start, end
+
+    def _get_first_word_overhead(
+        self, text: str, offsets: List[int], boundaries: List[int], start: int
+    ) -> int:
+        """Get the number of tokens the first word of a chunk starting at token
+        `start` gains when the separator before it is stripped (e.g. " foo" is
+        a single token, but "foo" may not be)."""
+        char_start, _ = self._strip_separators(text, offsets[start], len(text))
+        if char_start == offsets[start]:
+            return 0
+        boundary_idx = bisect.bisect_right(boundaries, start)
+        end = (
+            boundaries[boundary_idx]
+            if boundary_idx < len(boundaries)
+            else len(offsets) - 1
+        )
+        first_word = text[char_start : offsets[end]]
+        return max(count_tokens(first_word, self.tokenizer) - (end - start), 0)
+
+    def _fit_chunk(
+        self, text: str, offsets: List[int], start: int, end: int, chunk_size: int
+    ) -> Tuple[int, int, int]:
+        """Move the end token of a chunk back until the chunk fits chunk_size.
+
+        Offsets of tokens starting in the middle of a (multi-byte) character are
+        rounded down to the character, so the chunk text may re-encode to more
+        tokens than end - start.
+
+        Returns:
+            Tuple[int, int, int]: end token, and character offsets of the chunk.
+
+        """
+        while True:
+            char_start, char_end = self._strip_separators(
+                text, offsets[start], offsets[end]
+            )
+            if (
+                end - start <= 1
+                or count_tokens(text[char_start:char_end], self.tokenizer) <= chunk_size
+            ):
+                return end, char_start, char_end
+            end -= 1
+
+    def _split_with_token_offsets(self, text: str, chunk_size: int) -> List[TextSplit]:
+        """Split text into chunks, cutting on the offsets of its tokens."""
+        offsets = self._get_token_offsets(text)
+        boundaries = self._get_separator_boundaries(text, offsets)
+        num_tokens = len(offsets) - 1
+
+        docs: List[TextSplit] = []
+        start = 0
+        prev_char_end = 0
+        while start < num_tokens:
+            end = min(
+                start
+                + chunk_size
+                - self._get_first_word_overhead(text, offsets, boundaries, start),
+                num_tokens,
+            )
+            if end < num_tokens:
+                # cut at the last separator in the chunk, if any
+                boundary_idx = bisect.bisect_right(boundaries, end) - 1
+                if boundary_idx >= 0 and boundaries[boundary_idx] > start:
+                    end = boundaries[boundary_idx]
+
+            end, char_start, char_end = self._fit_chunk(
+                text, offsets, start, end, chunk_size
+            )
+            overlap = max(prev_char_end - char_start, 0) if docs else 0
+            docs.append(TextSplit(text[char_start:char_end], overlap))
+            prev_char_end = char_end
+            if end == num_tokens:
+                break
+
+            # start the next chunk at the first separator within the overlap
+            next_start = end
+            boundary_idx = bisect.bisect_left(
+                boundaries, max(end - self._chunk_overlap, start + 1)
+            )
+            if boundary_idx < len(boundaries) and boundaries[boundary_idx] < end:
+                next_start = boundaries[boundary_idx]
+            start = next_start
+        return docs
+
     def split_text(self, text: str, extra_info_str: Optional[str] = None) -> List[str]:
         """Split incoming text and return chunks."""
         event_id = self.callback_manager.on_event_start(
@@ -154,7 +315,7 @@ class TokenTextSplitter(TextSplitter):
         #       This reduces the effective chunk size that we can have
         if extra_info_str is not None:
             # NOTE: extra 2 newline chars for formatting when prepending in query
-            num_extra_tokens = len(self.tokenizer(f"{extra_info_str}\n\n")) + 1
+            num_extra_tokens = count_tokens(f"{extra_info_str}\n\n", self.tokenizer) + 1
             effective_chunk_size = self._chunk_size - num_extra_tokens
 
             if effective_chunk_size <= 0:
@@ -164,9 +325,36 @@ class TokenTextSplitter(TextSplitter):
         else:
             effective_chunk_size = self._chunk_size
 
+        if self._use_token_offsets:
+            docs = self._split_with_token_offsets(text, effective_chunk_size)
+        else:
+            docs = self._split_with_num_tokens(text, effective_chunk_size)
+
+        # run postprocessing to remove blank spaces
+        docs = self._postprocess_splits(docs)
+        self.callback_manager.on_event_end(
+            CBEventType.CHUNKING,
+            payload={EventPayload.CHUNKS: [x.text_chunk for x in docs]},
+            event_id=event_id,
+        )
+        return docs
+
+    def _split_with_num_tokens(
+        self, text: str, effective_chunk_size: int
+    ) -> List[TextSplit]:
+        """Split text on the separator, and pack splits into chunks."""
         # First we naively split the large input into a bunch of smaller ones.
-        splits = text.split(self._separator)
-        splits = self._preprocess_splits(splits, effective_chunk_size)
+        splits, split_num_tokens = self._preprocess_splits_with_num_tokens(
+            text.split(self._separator), effective_chunk_size
+        )
+        # NOTE: every split is tokenized once, token counts of single splits are
+        # looked up from split_num_tokens below
+        split_num_tokens = [max(num_tokens, 1) for num_tokens in split_num_tokens]
+        # split_offsets[i] is the number of characters in splits[:i]
+        split_offsets = [0]
+        for split in splits:
+            split_offsets.append(split_offsets[-1] + len(split))
+
         # We now want to combine these smaller pieces into medium size
         # chunks to send to the LLM.
         docs: List[TextSplit] = []
@@ -176,8 +364,7 @@ class TokenTextSplitter(TextSplitter):
         cur_total = 0
         prev_idx = 0  # store the previous end index
         while cur_idx < len(splits):
-            cur_token = splits[cur_idx]
-            num_cur_tokens = max(len(self.tokenizer(cur_token)), 1)
+            num_cur_tokens = split_num_tokens[cur_idx]
             if num_cur_tokens > effective_chunk_size:
                 raise ValueError(
                     "A single term is larger than the allowed chunk size.\n"
@@ -196,7 +383,7 @@ class TokenTextSplitter(TextSplitter):
                 overlap = 0
                 # after first round, check if last chunk ended after this chunk begins
                 if prev_idx > 0 and prev_idx > start_idx:
-                    overlap = sum([len(splits[i]) for i in range(start_idx, prev_idx)])
+                    overlap = split_offsets[prev_idx] - split_offsets[start_idx]
 
                 docs.append(
                     TextSplit(self._separator.join(splits[start_idx:cur_idx]), overlap)
@@ -209,10 +396,7 @@ class TokenTextSplitter(TextSplitter):
                 # we need to enforce that start_idx <= cur_idx, otherwise
                 # start_idx has a chance of going out of bounds.
                 while cur_total > self._chunk_overlap and start_idx < cur_idx:
-                    # # call tokenizer on entire overlap
-                    # cur_total = self.tokenizer()
-                    cur_num_tokens = max(len(self.tokenizer(splits[start_idx])), 1)
-                    cur_total -= cur_num_tokens
+                    cur_total -= split_num_tokens[start_idx]
                     start_idx += 1
                 # NOTE: This is a hack, make more general
                 if start_idx == cur_idx:
@@ -220,44 +404,49 @@ class TokenTextSplitter(TextSplitter):
             # Build up the current_doc with term d, and update the total counter with
             # the number of the number of tokens in d, wrt self.tokenizer
 
-            # we reassign cur_token and num_cur_tokens, because cur_idx
-            # may have changed
-            cur_token = splits[cur_idx]
-            num_cur_tokens = max(len(self.tokenizer(cur_token)), 1)
-
-            cur_total += num_cur_tokens
+            # NOTE: cur_idx may have changed
+            cur_total += split_num_tokens[cur_idx]
             cur_idx += 1
         overlap = 0
         # after first round, check if last chunk ended after this chunk begins
         if prev_idx > start_idx:
-            overlap = sum([len(splits[i]) for i in range(start_idx, prev_idx)]) + len(
-                range(start_idx, prev_idx)
+            overlap = (
+                split_offsets[prev_idx]
+                - split_offsets[start_idx]
+                + prev_idx
+                - start_idx
             )
         docs.append(TextSplit(self._separator.join(splits[start_idx:cur_idx]), overlap))
-
-        # run postprocessing to remove blank spaces
-        docs = self._postprocess_splits(docs)
-        self.callback_manager.on_event_end(
-            CBEventType.CHUNKING,
-            payload={EventPayload.CHUNKS: [x.text_chunk for x in docs]},
-            event_id=event_id,
-        )
         return docs
 
     def truncate_text(self, text: str) -> str:
         """Truncate text in order to fit the underlying chunk size."""
         if text == "":
             return ""
+        if self._use_token_offsets:
+            offsets = self._get_token_offsets(text)
+            if len(offsets) - 1 <= self._chunk_size:
+                return text
+            end = self._chunk_size
+            boundaries = self._get_separator_boundaries(text, offsets)
+            boundary_idx = bisect.bisect_right(boundaries, end) - 1
+            if boundary_idx >= 0:
+                end = boundaries[boundary_idx]
+            _, char_start, char_end = self._fit_chunk(
+                text, offsets, 0, end, self._chunk_size
+            )
+            return text[char_start:char_end]
+
         # First we naively split the large input into a bunch of smaller ones.
-        splits = text.split(self._separator)
-        splits = self._preprocess_splits(splits, self._chunk_size)
+        splits, split_num_tokens = self._preprocess_splits_with_num_tokens(
+            text.split(self._separator), self._chunk_size
+        )
 
         start_idx = 0
         cur_idx = 0
         cur_total = 0
         while cur_idx < len(splits):
-            cur_token = splits[cur_idx]
-            num_cur_tokens = max(len(self.tokenizer(cur_token)), 1)
+            num_cur_tokens = max(split_num_tokens[cur_idx], 1)
             if cur_total + num_cur_tokens > self._chunk_size:
                 cur_idx = self._reduce_chunk_size(start_idx, cur_idx, splits)
                 break
@@ -355,7 +544,7 @@ class SentenceSplitter(TextSplitter):
         #       This reduces the effective chunk size that we can have
         if extra_info_str is not None:
             # NOTE: extra 2 newline chars for formatting when prepending in query
-            num_extra_tokens = len(self.tokenizer(f"{extra_info_str}\n\n")) + 1
+            num_extra_tokens = count_tokens(f"{extra_info_str}\n\n", self.tokenizer) + 1
             effective_chunk_size = self._chunk_size - num_extra_tokens
 
             if effective_chunk_size <= 0:
@@ -393,7 +582,7 @@ class SentenceSplitter(TextSplitter):
 
         new_splits: List[Split] = []
         for split in splits:
-            split_len = len(self.tokenizer(split))
+            split_len = count_tokens(split, self.tokenizer)
             if split_len <= effective_chunk_size:
                 new_splits.append(Split(split, True))
             else:
@@ -406,7 +595,7 @@ class SentenceSplitter(TextSplitter):
                 else:
                     splits2 = [split]
                 for split2 in splits2:
-                    if len(self.tokenizer(split2)) <= effective_chunk_size:
+                    if count_tokens(split2, self.tokenizer) <= effective_chunk_size:
                         new_splits.append(Split(split2, False))
                     else:
                         splits3 = split2.split(self._separator)
@@ -418,7 +607,7 @@ class SentenceSplitter(TextSplitter):
         cur_tokens = 0
         while len(new_splits) > 0:
             cur_token = new_splits[0]
-            cur_len = len(self.tokenizer(cur_token.text))
+            cur_len = count_tokens(cur_token.text, self.tokenizer)
             if cur_len > effective_chunk_size:
                 raise ValueError("Single token exceed chunk size")
             if cur_tokens + cur_len > effective_chunk_size:
@@ -22,9 +22,9 @@ from llama_index.constants import (
 from llama_index.langchain_helpers.streaming import StreamingGeneratorCallbackHandler
 from llama_index.llm_predictor.openai_utils import openai_modelname_to_contextsize
 from llama_index.prompts.base import Prompt
+from llama_index.token_counter.token_count_cache import count_tokens
 from llama_index.utils import (
     ErrorToRetry,
-    globals_helper,
     retry_on_exceptions_with_backoff,
 )
 
@@ -297,8 +297,7 @@ class LLMPredictor(BaseLLMPredictor):
         return self._total_tokens_used
 
     def _count_tokens(self, text: str) -> int:
-        tokens = globals_helper.tokenizer(text)
-        return len(tokens)
+        return count_tokens(text)
 
     @property
     def last_token_usage(self) -> int:
@@ -12,7 +12,7 @@ from llama_index.llm_predictor.vellum.types import (
     VellumCompiledPrompt,
     VellumRegisteredPrompt,
 )
-from llama_index.utils import globals_helper
+from llama_index.token_counter.token_count_cache import count_tokens
 
 
 class VellumPredictor(BaseLLMPredictor):
@@ -227,5 +227,4 @@ class VellumPredictor(BaseLLMPredictor):
         # This is considered an approximation of the number of tokens used.
         # As a future improvement, Vellum will make it possible to get back the
         # exact number of tokens used via API.
-        tokens = globals_helper.tokenizer(text)
-        return len(tokens)
+        return count_tokens(text)
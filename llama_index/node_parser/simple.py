@@ -1,5 +1,8 @@
 """Simple node parser."""
-from typing import List, Optional, Sequence
+import copy
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Deque, Generator, Iterable, List, Optional, Sequence, Tuple
 
 from llama_index.callbacks.base import CallbackManager
 from llama_index.callbacks.schema import CBEventType, EventPayload
@@ -9,6 +12,29 @@ from llama_index.langchain_helpers.text_splitter import TextSplitter, TokenTextS
 from llama_index.node_parser.interface import NodeParser
 from llama_index.node_parser.node_utils import get_nodes_from_document
 from llama_index.readers.schema.base import Document
+from llama_index.utils import iter_batch
+
+DEFAULT_PARSING_BATCH_SIZE = 100
+
+
+def _get_nodes_from_documents_batch(
+    documents: Sequence[Document],
+    text_splitter: TextSplitter,
+    include_extra_info: bool,
+    include_prev_next_rel: bool,
+) -> List[Node]:
+    """Parse a batch of documents into nodes (in a worker process)."""
+    all_nodes: List[Node] = []
+    for document in documents:
+        all_nodes.extend(
+            get_nodes_from_document(
+                document,
+                text_splitter,
+                include_extra_info,
+                include_prev_next_rel=include_prev_next_rel,
+            )
+        )
+    return all_nodes
 
 
 class SimpleNodeParser(NodeParser):
@@ -16,10 +42,19 @@ class SimpleNodeParser(NodeParser):
 
     Splits a document into Nodes using a TextSplitter.
 
+    With `num_workers > 1`, documents are split in batches of `batch_size` by a
+    pool of worker processes. The output (order of nodes, prev/next
+    relationships) is the same as in serial mode, but chunking events of the
+    text splitter are not reported to its callback manager. The text splitter
+    (and its tokenizer) must be picklable.
+
     Args:
         text_splitter (Optional[TextSplitter]): text splitter
         include_extra_info (bool): whether to include extra info in nodes
         include_prev_next_rel (bool): whether to include prev/next relationships
+        num_workers (Optional[int]): number of worker processes.
+            Defaults to parsing documents in the current process.
+        batch_size (int): number of documents sent to a worker at a time
 
     """
 
@@ -29,14 +64,20 @@ class SimpleNodeParser(NodeParser):
         include_extra_info: bool = True,
         include_prev_next_rel: bool = True,
         callback_manager: Optional[CallbackManager] = None,
+        num_workers: Optional[int] = None,
+        batch_size: int = DEFAULT_PARSING_BATCH_SIZE,
     ) -> None:
         """Init params."""
+        if batch_size <= 0:
+            raise ValueError("batch_size must be > 0")
         self.callback_manager = callback_manager or CallbackManager([])
         self._text_splitter = text_splitter or TokenTextSplitter(
             callback_manager=self.callback_manager
         )
         self._include_extra_info = include_extra_info
         self._include_prev_next_rel = include_prev_next_rel
+        self._num_workers = num_workers
+        self._batch_size = batch_size
 
     @classmethod
     def from_defaults(
@@ -46,6 +87,8 @@ class SimpleNodeParser(NodeParser):
         include_extra_info: bool = True,
         include_prev_next_rel: bool = True,
         callback_manager: Optional[CallbackManager] = None,
+        num_workers: Optional[int] = None,
+        batch_size: int = DEFAULT_PARSING_BATCH_SIZE,
     ) -> "SimpleNodeParser":
         callback_manager = callback_manager or CallbackManager([])
         chunk_size = chunk_size or DEFAULT_CHUNK_SIZE
@@ -61,8 +104,81 @@ class SimpleNodeParser(NodeParser):
             include_extra_info=include_extra_info,
             include_prev_next_rel=include_prev_next_rel,
             callback_manager=callback_manager,
+            num_workers=num_workers,
+            batch_size=batch_size,
         )
 
+    def _iter_node_batches(
+        self, documents: Iterable[Document]
+    ) -> Generator[Tuple[List[Document], List[Node]], None, None]:
+        """Parse documents batch by batch, yielding each batch with its nodes."""
+        if self._num_workers is None or self._num_workers <= 1:
+            for batch in iter_batch(documents, self._batch_size):
+                yield batch, _get_nodes_from_documents_batch(
+                    batch,
+                    self._text_splitter,
+                    self._include_extra_info,
+                    self._include_prev_next_rel,
+                )
+            return
+
+        # chunking events from worker processes would not reach the handlers
+        text_splitter = copy.copy(self._text_splitter)
+        if hasattr(text_splitter, "callback_manager"):
+            text_splitter.callback_manager = CallbackManager([])
+
+        # bound the number of batches in flight, so that a document stream is
+        # not read (and parsed) much ahead of its consumer
+        max_pending = 2 * self._num_workers
+        pending: Deque[Tuple[List[Document], Future]] = deque()
+        with ProcessPoolExecutor(max_workers=self._num_workers) as executor:
+            try:
+                for batch in iter_batch(documents, self._batch_size):
+                    if len(pending) >= max_pending:
+                        done_batch, future = pending.popleft()
+                        yield done_batch, future.result()
+                    future = executor.submit(
+                        _get_nodes_from_documents_batch,
+                        batch,
+                        text_splitter,
+                        self._include_extra_info,
+                        self._include_prev_next_rel,
+                    )
+                    pending.append((batch, future))
+                while pending:
+                    done_batch, future = pending.popleft()
+                    yield done_batch, future.result()
+            finally:
+                # e.g. the consumer stopped early
+                for _, future in pending:
+                    future.cancel()
+
+    def iter_nodes_from_documents(
+        self,
+        documents: Iterable[Document],
+    ) -> Generator[Node, None, None]:
+        """Parse documents into nodes lazily.
+
+        Nodes are yielded in order as soon as their batch of documents is
+        parsed, so they can be consumed (e.g. embedded) while later documents are
+        still parsed. `documents` can be any iterable, e.g. a generator reading
+        documents. A parsing event is reported for every batch.
+
+        Args:
+            documents (Iterable[Document]): documents to parse
+
+        """
+        for batch, nodes in self._iter_node_batches(documents):
+            event_id = self.callback_manager.on_event_start(
+                CBEventType.NODE_PARSING, payload={EventPayload.DOCUMENTS: batch}
+            )
+            self.callback_manager.on_event_end(
+                CBEventType.NODE_PARSING,
+                payload={EventPayload.NODES: nodes},
+                event_id=event_id,
+            )
+            yield from nodes
+
     def get_nodes_from_documents(
         self,
         documents: Sequence[Document],
@@ -78,13 +194,7 @@ class SimpleNodeParser(NodeParser):
             CBEventType.NODE_PARSING, payload={EventPayload.DOCUMENTS: documents}
         )
         all_nodes: List[Node] = []
-        for document in documents:
-            nodes = get_nodes_from_document(
-                document,
-                self._text_splitter,
-                self._include_extra_info,
-                include_prev_next_rel=self._include_prev_next_rel,
-            )
+        for _, nodes in self._iter_node_batches(documents):
             all_nodes.extend(nodes)
         self.callback_manager.on_event_end(
             CBEventType.NODE_PARSING,
@@ -1,7 +1,9 @@
 """Optimization."""
 
 from llama_index.optimization.optimizer import SentenceEmbeddingOptimizer
+from llama_index.optimization.sentence_embedding_cache import SentenceEmbeddingCache
 
 __all__ = [
     "SentenceEmbeddingOptimizer",
+    "SentenceEmbeddingCache",
 ]
@@ -1,16 +1,32 @@
 """Optimization related classes and functions."""
 import logging
 from abc import abstractmethod
-from typing import Callable, List, Optional
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, cast
 
+import numpy as np
+
+from llama_index.data_structs.node import Node
 from llama_index.embeddings.base import BaseEmbedding
+from llama_index.embeddings.cache import _get_model_name
 from llama_index.embeddings.openai import OpenAIEmbedding
-from llama_index.indices.query.embedding_utils import get_top_k_embeddings
 from llama_index.indices.query.schema import QueryBundle
+from llama_index.optimization.sentence_embedding_cache import (
+    SentenceEmbeddingCache,
+    SentenceEmbeddings,
+    get_sentence_boundaries,
+)
+from llama_index.token_counter.token_count_cache import count_tokens
 
 logger = logging.getLogger(__name__)
 
 
+def _get_tokenizer_name(tokenizer_fn: Callable[[str], List[str]]) -> str:
+    """Get a name identifying a sentence tokenizer function."""
+    module = getattr(tokenizer_fn, "__module__", None)
+    name = getattr(tokenizer_fn, "__qualname__", type(tokenizer_fn).__qualname__)
+    return f"{module}.{name}" if module else name
+
+
 class BaseTokenUsageOptimizer:
     """Base class for optimizers that should be overwritten."""
 
@@ -29,6 +45,8 @@ class SentenceEmbeddingOptimizer(BaseTokenUsageOptimizer):
         percentile_cutoff: Optional[float] = None,
         threshold_cutoff: Optional[float] = None,
         tokenizer_fn: Optional[Callable[[str], List[str]]] = None,
+        sentence_cache: Optional[SentenceEmbeddingCache] = None,
+        token_budget: Optional[int] = None,
     ):
         """Optimizer class that is passed into BaseGPTIndexQuery.
 
@@ -46,6 +64,16 @@ class SentenceEmbeddingOptimizer(BaseTokenUsageOptimizer):
                         these cutoffs can also be used together.
                     )
 
+        To avoid re-embedding the same sentences on every query, pass a
+        `sentence_cache=SentenceEmbeddingCache()`: sentence boundaries and
+        embeddings of every text are then cached on first use, and can be
+        precomputed at index time with `optimizer.precompute(nodes)`, and
+        persisted with `sentence_cache.persist(persist_path)`.
+
+        Set `token_budget` to limit the number of tokens of the optimized text:
+        the most similar sentences (after cutoffs) that fit in the budget are
+        kept, in their original order.
+
         query_engine = index.as_query_engine(
             optimizer=optimizer
         )
@@ -54,6 +82,8 @@ class SentenceEmbeddingOptimizer(BaseTokenUsageOptimizer):
         self.embed_model = embed_model or OpenAIEmbedding()
         self._percentile_cutoff = percentile_cutoff
         self._threshold_cutoff = threshold_cutoff
+        self._sentence_cache = sentence_cache
+        self._token_budget = token_budget
 
         if tokenizer_fn is None:
             import nltk.data
@@ -64,32 +94,121 @@ class SentenceEmbeddingOptimizer(BaseTokenUsageOptimizer):
                 nltk.download("punkt")
             tokenizer = nltk.data.load("tokenizers/punkt/english.pickle")
             tokenizer_fn = tokenizer.tokenize
+            tokenizer_name = "nltk:tokenizers/punkt/english.pickle"
+        else:
+            tokenizer_name = _get_tokenizer_name(tokenizer_fn)
         self._tokenizer_fn = tokenizer_fn
+        # cached sentence embeddings depend on both the model and the tokenizer
+        self._cache_namespace = f"{_get_model_name(self.embed_model)}\0{tokenizer_name}"
+
+    def precompute(self, nodes: Sequence[Node]) -> None:
+        """Precompute the sentence embeddings of nodes into the sentence cache.
+
+        Can be called at index time, so that queries on these nodes don't need
+        to embed any sentence. Sentences of all nodes are embedded in batches.
+
+        """
+        if self._sentence_cache is None:
+            raise ValueError("precompute requires a sentence_cache.")
+        self._get_sentence_embeddings([node.get_text() for node in nodes])
+
+    def _get_sentence_embeddings(
+        self, texts: List[str]
+    ) -> List[Tuple[List[str], np.ndarray, np.ndarray]]:
+        """Get the sentences of texts, with their embeddings and embedding norms.
+
+        Sentence embeddings are read from the sentence cache if possible. The
+        sentences of all other texts are embedded together, in batches.
+
+        """
+        results: List[Optional[Tuple[List[str], np.ndarray, np.ndarray]]] = []
+        # index of text in texts -> its sentences, not found in the cache
+        text_sentences: Dict[int, List[str]] = {}
+        for i, text in enumerate(texts):
+            cached = None
+            if self._sentence_cache is not None:
+                cached = self._sentence_cache.get(text, self._cache_namespace)
+            if cached is not None:
+                results.append(
+                    (cached.get_sentences(text), cached.embeddings, cached.norms)
+                )
+            else:
+                results.append(None)
+                text_sentences[i] = self._tokenizer_fn(text)
+
+        for i, sentences in text_sentences.items():
+            for j, sentence in enumerate(sentences):
+                self.embed_model.queue_text_for_embedding(f"{i}_{j}", sentence)
+        queued_ids, queued_embeddings = self.embed_model.get_queued_text_embeddings()
+        embeddings_by_id = dict(zip(queued_ids, queued_embeddings))
+
+        for i, sentences in text_sentences.items():
+            embeddings = np.array(
+                [embeddings_by_id[f"{i}_{j}"] for j in range(len(sentences))],
+                dtype=np.float32,
+            )
+            boundaries = None
+            if self._sentence_cache is not None:
+                boundaries = get_sentence_boundaries(texts[i], sentences)
+                if boundaries is None:
+                    logger.debug("> [optimize] Sentences not found in text, not cached")
+            sentence_embeddings = SentenceEmbeddings(
+                boundaries=boundaries or [], embeddings=embeddings
+            )
+            if self._sentence_cache is not None and boundaries is not None:
+                self._sentence_cache.put(
+                    texts[i], sentence_embeddings, self._cache_namespace
+                )
+            results[i] = (
+                sentences,
+                sentence_embeddings.embeddings,
+                sentence_embeddings.norms,
+            )
+        return cast(List[Tuple[List[str], np.ndarray, np.ndarray]], results)
+
+    def _select_sentences(
+        self, sentences: List[str], similarities: np.ndarray
+    ) -> List[int]:
+        """Select sentences by similarity, cutoffs and token budget.
+
+        Without a token budget, returns the indices of selected sentences from
+        the most to the least similar. With a token budget, the most similar
+        sentences that fit in the budget are kept, in their original order.
+
+        """
+        candidates = np.arange(len(sentences))
+        if self._threshold_cutoff is not None:
+            candidates = candidates[similarities > self._threshold_cutoff]
+        candidates = candidates[np.argsort(-similarities[candidates], kind="stable")]
+        if self._percentile_cutoff is not None:
+            num_top_k = int(len(sentences) * self._percentile_cutoff)
+            if num_top_k:
+                candidates = candidates[:num_top_k]
+        top_idxs = candidates.tolist()
+
+        if self._token_budget is not None:
+            selected_idxs = []
+            num_tokens = 0
+            for i in top_idxs:
+                num_sentence_tokens = count_tokens(sentences[i])
+                if num_tokens + num_sentence_tokens <= self._token_budget:
+                    selected_idxs.append(i)
+                    num_tokens += num_sentence_tokens
+            top_idxs = sorted(selected_idxs)
+        return top_idxs
 
     def optimize(self, query_bundle: QueryBundle, text: str) -> str:
         """Optimize a text chunk given the query by shortening the input text."""
-        split_text = self._tokenizer_fn(text)
-
         start_embed_token_ct = self.embed_model.total_tokens_used
         if query_bundle.embedding is None:
             query_bundle.embedding = self.embed_model.get_agg_embedding_from_queries(
                 query_bundle.embedding_strs
             )
-        text_embeddings = self.embed_model._get_text_embeddings(split_text)
-        num_top_k = None
-        threshold = None
-        if self._percentile_cutoff is not None:
-            num_top_k = int(len(split_text) * self._percentile_cutoff)
-        if self._threshold_cutoff is not None:
-            threshold = self._threshold_cutoff
-        top_similarities, top_idxs = get_top_k_embeddings(
-            query_embedding=query_bundle.embedding,
-            embeddings=text_embeddings,
-            similarity_fn=self.embed_model.similarity,
-            similarity_top_k=num_top_k,
-            embedding_ids=list(range(len(text_embeddings))),
-            similarity_cutoff=threshold,
+        split_text, embeddings, norms = self._get_sentence_embeddings([text])[0]
+        similarities = self.embed_model.similarity_batch(
+            query_bundle.embedding, embeddings, norms=norms
         )
+        top_idxs = self._select_sentences(split_text, similarities)
         net_embed_tokens = self.embed_model.total_tokens_used - start_embed_token_ct
         logger.info(
             f"> [optimize] Total embedding token usage: " f"{net_embed_tokens} tokens"
@@ -100,6 +219,6 @@ class SentenceEmbeddingOptimizer(BaseTokenUsageOptimizer):
 
         logger.debug(f"> Top {len(top_idxs)} sentences with scores:\n")
         if logger.isEnabledFor(logging.DEBUG):
-            for i in range(len(top_idxs)):
-                logger.debug(f"{i}. {top_sentences[i]} ({top_similarities[i]})")
+            for i in top_idxs:
+                logger.debug(f"{i}. {split_text[i]} ({similarities[i]})")
         return " ".join(top_sentences)
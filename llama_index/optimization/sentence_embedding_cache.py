@@ -0,0 +1,197 @@
+"""Cache of sentence boundaries and sentence embeddings of texts."""
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+import fsspec
+import numpy as np
+
+from llama_index.embeddings.base import embedding_norms
+from llama_index.utils import atomic_write
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SENTENCE_CACHE_MAX_SIZE = 1000
+
+
+def _get_text_key(text: str, namespace: str) -> str:
+    """Get the cache key of a text in a namespace, stable across processes."""
+    return hashlib.sha256(f"{namespace}\0{text}".encode("utf-8")).hexdigest()
+
+
+def get_sentence_boundaries(
+    text: str, sentences: List[str]
+) -> Optional[List[Tuple[int, int]]]:
+    """Get the (start, end) character offsets of sentences in text.
+
+    Returns None if the sentences are not substrings of text, in order (e.g. if
+    the sentence tokenizer normalizes whitespace).
+
+    """
+    boundaries = []
+    pos = 0
+    for sentence in sentences:
+        start = text.find(sentence, pos)
+        if start == -1:
+            return None
+        pos = start + len(sentence)
+        boundaries.append((start, pos))
+    return boundaries
+
+
+@dataclass
+class SentenceEmbeddings:
+    """Sentence boundaries and sentence embeddings of a text.
+
+    Args:
+        boundaries (List[Tuple[int, int]]): (start, end) character offsets of
+            every sentence.
+        embeddings (np.ndarray): float32 embeddings of the sentences, of shape
+            (number of sentences, dim).
+
+    """
+
+    boundaries: List[Tuple[int, int]]
+    embeddings: np.ndarray
+    norms: np.ndarray = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Precompute embedding norms, for cosine similarities."""
+        self.embeddings = np.asarray(self.embeddings, dtype=np.float32)
+        if self.embeddings.size == 0:
+            # no sentences
+            self.embeddings = self.embeddings.reshape(0, 0)
+        self.norms = embedding_norms(self.embeddings)
+
+    def get_sentences(self, text: str) -> List[str]:
+        """Get the sentences of text."""
+        return [text[start:end] for start, end in self.boundaries]
+
+    def to_dict(self) -> dict:
+        """Convert to a JSON serializable dict."""
+        return {
+            "boundaries": [list(boundary) for boundary in self.boundaries],
+            "embeddings": self.embeddings.tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SentenceEmbeddings":
+        """Load from a dict created with `to_dict`."""
+        return cls(
+            boundaries=[(start, end) for start, end in data["boundaries"]],
+            embeddings=np.array(data["embeddings"], dtype=np.float32),
+        )
+
+
+class SentenceEmbeddingCache:
+    """Bounded LRU cache of the sentence embeddings of texts.
+
+    Texts are keyed by a sha256 hash of a namespace and the text. Only sentence
+    boundaries and embeddings are stored, not the texts themselves.
+
+    Cached embeddings are only valid for the embedding model and sentence
+    tokenizer they were computed with, so `SentenceEmbeddingOptimizer` uses
+    their names as namespace: a cache can be shared between optimizers using
+    different ones.
+
+    Args:
+        max_size (Optional[int]): max number of cached texts. Defaults to
+            DEFAULT_SENTENCE_CACHE_MAX_SIZE, None means no limit.
+
+    """
+
+    def __init__(
+        self,
+        max_size: Optional[int] = DEFAULT_SENTENCE_CACHE_MAX_SIZE,
+    ) -> None:
+        """Init params."""
+        if max_size is not None and max_size <= 0:
+            raise ValueError("max_size must be > 0")
+        self._max_size = max_size
+        self._cache: "OrderedDict[str, SentenceEmbeddings]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+    def __len__(self) -> int:
+        """Get the number of cached texts."""
+        return len(self._cache)
+
+    @property
+    def cache_hits(self) -> int:
+        """Get the number of lookups served from the cache so far."""
+        return self._cache_hits
+
+    @property
+    def cache_misses(self) -> int:
+        """Get the number of lookups not served from the cache so far."""
+        return self._cache_misses
+
+    def get(self, text: str, namespace: str = "") -> Optional[SentenceEmbeddings]:
+        """Get the cached sentence embeddings of text in namespace, if any."""
+        key = _get_text_key(text, namespace)
+        with self._lock:
+            sentence_embeddings = self._cache.get(key, None)
+            if sentence_embeddings is None:
+                self._cache_misses += 1
+                return None
+            self._cache.move_to_end(key)
+            self._cache_hits += 1
+            return sentence_embeddings
+
+    def put(
+        self,
+        text: str,
+        sentence_embeddings: SentenceEmbeddings,
+        namespace: str = "",
+    ) -> None:
+        """Cache the sentence embeddings of text in namespace."""
+        key = _get_text_key(text, namespace)
+        with self._lock:
+            self._cache[key] = sentence_embeddings
+            self._cache.move_to_end(key)
+            if self._max_size is not None and len(self._cache) > self._max_size:
+                self._cache.popitem(last=False)
+
+    def clear(self) -> None:
+        """Clear the cache."""
+        with self._lock:
+            self._cache.clear()
+
+    def persist(
+        self, persist_path: str, fs: Optional[fsspec.AbstractFileSystem] = None
+    ) -> None:
+        """Persist the cache to a JSON file."""
+        fs = fs or fsspec.filesystem("file")
+        dirpath = os.path.dirname(persist_path)
+        if not fs.exists(dirpath):
+            fs.makedirs(dirpath)
+
+        with self._lock:
+            data = {key: value.to_dict() for key, value in self._cache.items()}
+        with atomic_write(persist_path, fs) as f:
+            json.dump(data, f)
+
+    @classmethod
+    def from_persist_path(
+        cls,
+        persist_path: str,
+        max_size: Optional[int] = DEFAULT_SENTENCE_CACHE_MAX_SIZE,
+        fs: Optional[fsspec.AbstractFileSystem] = None,
+    ) -> "SentenceEmbeddingCache":
+        """Load a SentenceEmbeddingCache from a persist path."""
+        fs = fs or fsspec.filesystem("file")
+        logger.debug(f"Loading {__name__} from {persist_path}.")
+        with fs.open(persist_path, "rb") as f:
+            data_dict = json.load(f)
+        cache = cls(max_size=max_size)
+        for key, value in data_dict.items():
+            cache._cache[key] = SentenceEmbeddings.from_dict(value)
+            if max_size is not None and len(cache._cache) > max_size:
+                cache._cache.popitem(last=False)
+        return cache
@@ -58,6 +58,8 @@ class RetrieverQueryEngine(BaseQueryEngine):
         use_async: bool = False,
         streaming: bool = False,
         optimizer: Optional[BaseTokenUsageOptimizer] = None,
+        parallel_merge: bool = False,
+        max_concurrency: Optional[int] = None,
         # class-specific args
         **kwargs: Any,
     ) -> "RetrieverQueryEngine":
@@ -79,6 +81,10 @@ class RetrieverQueryEngine(BaseQueryEngine):
             streaming (bool): Whether to use streaming.
             optimizer (Optional[BaseTokenUsageOptimizer]): A BaseTokenUsageOptimizer
                 object.
+            parallel_merge (bool): Whether refine modes answer text chunks
+                concurrently, then merge the answers (async queries only).
+            max_concurrency (Optional[int]): Max number of concurrent LLM calls
+                with parallel_merge.
 
         """
         response_synthesizer = ResponseSynthesizer.from_args(
@@ -93,6 +99,8 @@ class RetrieverQueryEngine(BaseQueryEngine):
             optimizer=optimizer,
             node_postprocessors=node_postprocessors,
             verbose=verbose,
+            parallel_merge=parallel_merge,
+            max_concurrency=max_concurrency,
         )
 
         callback_manager = (
@@ -108,6 +116,9 @@ class RetrieverQueryEngine(BaseQueryEngine):
     def retrieve(self, query_bundle: QueryBundle) -> List[NodeWithScore]:
         return self._retriever.retrieve(query_bundle)
 
+    async def aretrieve(self, query_bundle: QueryBundle) -> List[NodeWithScore]:
+        return await self._retriever.aretrieve(query_bundle)
+
     def synthesize(
         self,
         query_bundle: QueryBundle,
@@ -165,7 +176,7 @@ class RetrieverQueryEngine(BaseQueryEngine):
         )
 
         retrieve_id = self.callback_manager.on_event_start(CBEventType.RETRIEVE)
-        nodes = self._retriever.retrieve(query_bundle)
+        nodes = await self._retriever.aretrieve(query_bundle)
         self.callback_manager.on_event_end(
             CBEventType.RETRIEVE,
             payload={EventPayload.NODES: nodes},
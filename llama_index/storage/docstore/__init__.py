@@ -2,6 +2,8 @@ from llama_index.storage.docstore.types import BaseDocumentStore
 from llama_index.storage.docstore.simple_docstore import SimpleDocumentStore
 from llama_index.storage.docstore.mongo_docstore import MongoDocumentStore
 from llama_index.storage.docstore.keyval_docstore import KVDocumentStore
+from llama_index.storage.docstore.sqlite_docstore import SQLiteDocumentStore
+from llama_index.storage.docstore.cached_docstore import CachedDocumentStore
 
 # alias for backwards compatibility
 from llama_index.storage.docstore.simple_docstore import DocumentStore
@@ -13,4 +15,6 @@ __all__ = [
     "SimpleDocumentStore",
     "MongoDocumentStore",
     "KVDocumentStore",
+    "SQLiteDocumentStore",
+    "CachedDocumentStore",
 ]
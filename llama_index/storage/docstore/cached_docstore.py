@@ -0,0 +1,305 @@
+"""Caching document store."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import fsspec
+
+from llama_index.callbacks.base import CallbackManager
+from llama_index.callbacks.schema import CBEventType, EventPayload
+from llama_index.data_structs.node import Node
+from llama_index.schema import BaseDocument
+from llama_index.storage.docstore.types import (
+    DEFAULT_PERSIST_PATH,
+    BaseDocumentStore,
+    RefDocInfo,
+)
+
+DEFAULT_CACHE_MAX_SIZE = 10000
+
+
+class CachedDocumentStore(BaseDocumentStore):
+    """Document store wrapper caching deserialized documents in memory.
+
+    Reads are served from a bounded LRU cache of `BaseDocument` objects, so hot
+    nodes are neither fetched from a remote store (e.g. `MongoDocumentStore`)
+    nor deserialized again on every query. Writes and deletes go to the wrapped
+    store, and invalidate the cached documents they touch both before and after
+    the wrapped write, so that reads racing with the write do not leave stale
+    documents in the cache.
+
+    NOTE: cached documents are shared between reads, and should not be
+    modified in place.
+
+    Cache hits and misses are counted in `cache_hits` and `cache_misses`, and
+    reported in the payload of `DOCSTORE` callback events.
+
+    Args:
+        docstore (BaseDocumentStore): document store to wrap.
+        max_size (int): max number of cached documents.
+        ttl (Optional[float]): time to live of cached documents, in seconds.
+            Defaults to no expiry.
+        callback_manager (Optional[CallbackManager]): callback manager.
+        clock (Callable[[], float]): time function used for expiry.
+
+    """
+
+    def __init__(
+        self,
+        docstore: BaseDocumentStore,
+        max_size: int = DEFAULT_CACHE_MAX_SIZE,
+        ttl: Optional[float] = None,
+        callback_manager: Optional[CallbackManager] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Init params."""
+        if max_size <= 0:
+            raise ValueError("max_size must be > 0")
+        self._docstore = docstore
+        self._max_size = max_size
+        self._ttl = ttl
+        self.callback_manager = callback_manager or CallbackManager([])
+        self._clock = clock
+        # doc_id -> (doc, expiry time)
+        self._cache: "OrderedDict[str, Tuple[BaseDocument, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+    @property
+    def docstore(self) -> BaseDocumentStore:
+        """Get wrapped document store."""
+        return self._docstore
+
+    @property
+    def cache_hits(self) -> int:
+        """Get the number of documents served from the cache so far."""
+        return self._cache_hits
+
+    @property
+    def cache_misses(self) -> int:
+        """Get the number of documents read from the wrapped store so far."""
+        return self._cache_misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Get the fraction of document reads served from the cache."""
+        total = self._cache_hits + self._cache_misses
+        return self._cache_hits / total if total > 0 else 0.0
+
+    def clear_cache(self) -> None:
+        """Drop all cached documents."""
+        with self._lock:
+            self._cache.clear()
+
+    def _lookup(self, doc_ids: List[str]) -> Tuple[Dict[str, BaseDocument], List[str]]:
+        """Look up documents in the cache.
+
+        Returns:
+            Tuple[Dict[str, BaseDocument], List[str]]: cached documents by id,
+                and the (deduplicated) ids missing from the cache.
+
+        """
+        cached: Dict[str, BaseDocument] = {}
+        misses: List[str] = []
+        now = self._clock()
+        with self._lock:
+            for doc_id in dict.fromkeys(doc_ids):
+                entry = self._cache.get(doc_id, None)
+                if entry is not None and entry[1] <= now:
+                    del self._cache[doc_id]
+                    entry = None
+                if entry is None:
+                    misses.append(doc_id)
+                else:
+                    self._cache.move_to_end(doc_id)
+                    cached[doc_id] = entry[0]
+            self._cache_hits += len(cached)
+            self._cache_misses += len(misses)
+        return cached, misses
+
+    def _put(self, docs: Sequence[BaseDocument]) -> None:
+        """Add documents to the cache."""
+        expiry = self._clock() + self._ttl if self._ttl is not None else float("inf")
+        with self._lock:
+            for doc in docs:
+                self._cache[doc.get_doc_id()] = (doc, expiry)
+                self._cache.move_to_end(doc.get_doc_id())
+            while len(self._cache) > self._max_size:
+                self._cache.popitem(last=False)
+
+    def _invalidate(self, doc_ids: Sequence[str]) -> None:
+        """Remove documents from the cache."""
+        with self._lock:
+            for doc_id in doc_ids:
+                self._cache.pop(doc_id, None)
+
+    def _on_read(self, hits: int, misses: int) -> None:
+        """Report cache hits and misses of a read."""
+        event_id = self.callback_manager.on_event_start(CBEventType.DOCSTORE)
+        self.callback_manager.on_event_end(
+            CBEventType.DOCSTORE,
+            payload={
+                EventPayload.CACHE_HITS: hits,
+                EventPayload.CACHE_MISSES: misses,
+            },
+            event_id=event_id,
+        )
+
+    def _get_nodes_from_docs(
+        self,
+        node_ids: List[str],
+        cached: Dict[str, BaseDocument],
+        fetched: List[Node],
+    ) -> List[Node]:
+        """Assemble nodes in the order of node_ids, and cache fetched nodes."""
+        self._put(fetched)
+        docs = {**cached, **{node.get_doc_id(): node for node in fetched}}
+        nodes = []
+        for node_id in node_ids:
+            doc = docs[node_id]
+            if not isinstance(doc, Node):
+                raise ValueError(f"Document {node_id} is not a Node.")
+            nodes.append(doc)
+        return nodes
+
+    # ===== Save/load =====
+    def persist(
+        self,
+        persist_path: str = DEFAULT_PERSIST_PATH,
+        fs: Optional[fsspec.AbstractFileSystem] = None,
+    ) -> None:
+        """Persist the wrapped docstore."""
+        self._docstore.persist(persist_path=persist_path, fs=fs)
+
+    # ===== Main interface =====
+    @property
+    def docs(self) -> Dict[str, BaseDocument]:
+        """Get all documents, from the wrapped store."""
+        return self._docstore.docs
+
+    def add_documents(
+        self, docs: Sequence[BaseDocument], allow_update: bool = True
+    ) -> None:
+        """Add documents to the wrapped store."""
+        doc_ids = [doc.get_doc_id() for doc in docs]
+        self._invalidate(doc_ids)
+        self._docstore.add_documents(docs, allow_update=allow_update)
+        self._invalidate(doc_ids)
+
+    def get_document(
+        self, doc_id: str, raise_error: bool = True
+    ) -> Optional[BaseDocument]:
+        """Get a document, from the cache if possible."""
+        cached, misses = self._lookup([doc_id])
+        self._on_read(len(cached), len(misses))
+        if doc_id in cached:
+            return cached[doc_id]
+
+        doc = self._docstore.get_document(doc_id, raise_error=raise_error)
+        if doc is not None:
+            self._put([doc])
+        return doc
+
+    def delete_document(self, doc_id: str, raise_error: bool = True) -> None:
+        """Delete a document from the wrapped store."""
+        self._invalidate([doc_id])
+        self._docstore.delete_document(doc_id, raise_error=raise_error)
+        self._invalidate([doc_id])
+
+    def document_exists(self, doc_id: str) -> bool:
+        """Check if document exists."""
+        with self._lock:
+            entry = self._cache.get(doc_id, None)
+            if entry is not None:
+                if entry[1] > self._clock():
+                    return True
+                del self._cache[doc_id]
+        return self._docstore.document_exists(doc_id)
+
+    # ===== Hash =====
+    def set_document_hash(self, doc_id: str, doc_hash: str) -> None:
+        self._docstore.set_document_hash(doc_id, doc_hash)
+
+    def get_document_hash(self, doc_id: str) -> Optional[str]:
+        return self._docstore.get_document_hash(doc_id)
+
+    # ==== Ref Docs =====
+    def get_all_ref_doc_info(self) -> Optional[Dict[str, RefDocInfo]]:
+        return self._docstore.get_all_ref_doc_info()
+
+    def get_ref_doc_info(self, ref_doc_id: str) -> Optional[RefDocInfo]:
+        return self._docstore.get_ref_doc_info(ref_doc_id)
+
+    def delete_ref_doc(self, ref_doc_id: str, raise_error: bool = True) -> None:
+        """Delete a ref_doc and all it's associated nodes."""
+        ref_doc_info = self._docstore.get_ref_doc_info(ref_doc_id)
+        doc_ids = ref_doc_info.doc_ids if ref_doc_info is not None else []
+        self._invalidate(doc_ids)
+        self._docstore.delete_ref_doc(ref_doc_id, raise_error=raise_error)
+        self._invalidate(doc_ids)
+
+    # ===== Nodes =====
+    def get_nodes(self, node_ids: List[str], raise_error: bool = True) -> List[Node]:
+        """Get nodes, reading only the nodes missing from the cache.
+
+        Args:
+            node_ids (List[str]): node ids
+            raise_error (bool): raise error if node_id not found
+
+        """
+        cached, misses = self._lookup(node_ids)
+        self._on_read(len(cached), len(misses))
+        fetched = (
+            self._docstore.get_nodes(misses, raise_error=raise_error) if misses else []
+        )
+        return self._get_nodes_from_docs(node_ids, cached, fetched)
+
+    def get_node_dict(self, node_id_dict: Dict[int, str]) -> Dict[int, Node]:
+        """Get node dict given a mapping of index to node ids.
+
+        Args:
+            node_id_dict (Dict[int, str]): mapping of index to node ids
+
+        """
+        nodes = self.get_nodes(list(node_id_dict.values()))
+        return dict(zip(node_id_dict.keys(), nodes))
+
+    # ===== Async interface =====
+    async def aadd_documents(
+        self, docs: Sequence[BaseDocument], allow_update: bool = True
+    ) -> None:
+        """Asynchronously add documents to the wrapped store."""
+        doc_ids = [doc.get_doc_id() for doc in docs]
+        self._invalidate(doc_ids)
+        await self._docstore.aadd_documents(docs, allow_update=allow_update)
+        self._invalidate(doc_ids)
+
+    async def adelete_ref_doc(self, ref_doc_id: str, raise_error: bool = True) -> None:
+        """Asynchronously delete a ref_doc and all it's associated nodes."""
+        ref_doc_info = await self._docstore.aget_ref_doc_info(ref_doc_id)
+        doc_ids = ref_doc_info.doc_ids if ref_doc_info is not None else []
+        self._invalidate(doc_ids)
+        await self._docstore.adelete_ref_doc(ref_doc_id, raise_error=raise_error)
+        self._invalidate(doc_ids)
+
+    async def aget_nodes(
+        self, node_ids: List[str], raise_error: bool = True
+    ) -> List[Node]:
+        """Asynchronously get nodes, reading only the nodes missing from the cache.
+
+        Args:
+            node_ids (List[str]): node ids
+            raise_error (bool): raise error if node_id not found
+
+        """
+        cached, misses = self._lookup(node_ids)
+        self._on_read(len(cached), len(misses))
+        fetched = (
+            await self._docstore.aget_nodes(misses, raise_error=raise_error)
+            if misses
+            else []
+        )
+        return self._get_nodes_from_docs(node_ids, cached, fetched)
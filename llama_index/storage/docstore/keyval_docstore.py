@@ -1,6 +1,8 @@
 """Document store."""
 
-from typing import Dict, Optional, Sequence
+import asyncio
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 from llama_index.data_structs.node import Node
 from llama_index.schema import BaseDocument
@@ -65,52 +67,104 @@ class KVDocumentStore(BaseDocumentStore):
         json_dict = self._kvstore.get_all(collection=self._node_collection)
         return {key: json_to_doc(json) for key, json in json_dict.items()}
 
-    def add_documents(
-        self, docs: Sequence[BaseDocument], allow_update: bool = True
+    def _validate_docs(
+        self,
+        docs: Sequence[BaseDocument],
+        existing_doc_ids: Optional[Iterable[str]] = None,
     ) -> None:
-        """Add a document to the store.
+        """Check that docs can be added to the store.
 
         Args:
-            docs (List[BaseDocument]): documents
-            allow_update (bool): allow update of docstore from document
+            docs (Sequence[BaseDocument]): documents
+            existing_doc_ids (Optional[Iterable[str]]): ids of docs already in the
+                store, if updates are not allowed
 
         """
         for doc in docs:
             if doc.is_doc_id_none:
                 raise ValueError("doc_id not set")
 
-            # NOTE: doc could already exist in the store, but we overwrite it
-            if not allow_update and self.document_exists(doc.get_doc_id()):
+        if existing_doc_ids is None:
+            return
+        seen = set(existing_doc_ids)
+        for doc in docs:
+            if doc.get_doc_id() in seen:
                 raise ValueError(
                     f"doc_id {doc.get_doc_id()} already exists. "
                     "Set allow_update to True to overwrite."
                 )
+            seen.add(doc.get_doc_id())
+
+    def _get_kv_pairs(
+        self, docs: Sequence[BaseDocument]
+    ) -> Tuple[List[Tuple[str, dict]], List[Tuple[str, dict]], Dict[str, List[Node]]]:
+        """Get node data and metadata to write, and nodes grouped by ref_doc_id."""
+        node_kv_pairs = []
+        metadata_kv_pairs = []
+        ref_doc_nodes: Dict[str, List[Node]] = defaultdict(list)
+        for doc in docs:
             node_key = doc.get_doc_id()
-            data = doc_to_json(doc)
-            self._kvstore.put(node_key, data, collection=self._node_collection)
+            node_kv_pairs.append((node_key, doc_to_json(doc)))
 
-            # update doc_collection if needed
             metadata = {"doc_hash": doc.get_doc_hash()}
             if isinstance(doc, Node) and doc.ref_doc_id is not None:
-                ref_doc_info = self.get_ref_doc_info(doc.ref_doc_id) or RefDocInfo()
-                ref_doc_info.doc_ids.append(doc.get_doc_id())
-                if not ref_doc_info.extra_info:
-                    ref_doc_info.extra_info = doc.extra_info or {}
-                self._kvstore.put(
-                    doc.ref_doc_id,
-                    ref_doc_info.to_dict(),
-                    collection=self._ref_doc_collection,
-                )
-
+                ref_doc_nodes[doc.ref_doc_id].append(doc)
                 # update metadata with map
                 metadata["ref_doc_id"] = doc.ref_doc_id
-                self._kvstore.put(
-                    node_key, metadata, collection=self._metadata_collection
-                )
-            else:
-                self._kvstore.put(
-                    node_key, metadata, collection=self._metadata_collection
-                )
+            metadata_kv_pairs.append((node_key, metadata))
+        return node_kv_pairs, metadata_kv_pairs, ref_doc_nodes
+
+    def _merge_ref_doc_info(
+        self,
+        ref_doc_nodes: Dict[str, List[Node]],
+        ref_doc_jsons: Dict[str, dict],
+    ) -> List[Tuple[str, dict]]:
+        """Merge new nodes into the stored RefDocInfo of each ref doc."""
+        ref_doc_kv_pairs = []
+        for ref_doc_id, nodes in ref_doc_nodes.items():
+            ref_doc_json = ref_doc_jsons.get(ref_doc_id, None)
+            ref_doc_info = RefDocInfo(**ref_doc_json) if ref_doc_json else RefDocInfo()
+            # NOTE: re-added nodes are only listed once
+            doc_ids = set(ref_doc_info.doc_ids)
+            for node in nodes:
+                if node.get_doc_id() not in doc_ids:
+                    ref_doc_info.doc_ids.append(node.get_doc_id())
+                    doc_ids.add(node.get_doc_id())
+                if not ref_doc_info.extra_info:
+                    ref_doc_info.extra_info = node.extra_info or {}
+            ref_doc_kv_pairs.append((ref_doc_id, ref_doc_info.to_dict()))
+        return ref_doc_kv_pairs
+
+    def add_documents(
+        self, docs: Sequence[BaseDocument], allow_update: bool = True
+    ) -> None:
+        """Add a document to the store.
+
+        Node data and metadata are written in bulk, and the RefDocInfo of every
+        ref doc is read and written once per call.
+
+        Args:
+            docs (List[BaseDocument]): documents
+            allow_update (bool): allow update of docstore from document
+
+        """
+        # NOTE: doc could already exist in the store, but we overwrite it
+        existing_doc_ids = None
+        if not allow_update:
+            existing_doc_ids = self._kvstore.get_many(
+                [doc.get_doc_id() for doc in docs], collection=self._node_collection
+            ).keys()
+        self._validate_docs(docs, existing_doc_ids)
+
+        node_kv_pairs, metadata_kv_pairs, ref_doc_nodes = self._get_kv_pairs(docs)
+        ref_doc_jsons = self._kvstore.get_many(
+            list(ref_doc_nodes), collection=self._ref_doc_collection
+        )
+        ref_doc_kv_pairs = self._merge_ref_doc_info(ref_doc_nodes, ref_doc_jsons)
+
+        self._kvstore.put_all(node_kv_pairs, collection=self._node_collection)
+        self._kvstore.put_all(metadata_kv_pairs, collection=self._metadata_collection)
+        self._kvstore.put_all(ref_doc_kv_pairs, collection=self._ref_doc_collection)
 
     def get_document(
         self, doc_id: str, raise_error: bool = True
@@ -130,6 +184,42 @@ class KVDocumentStore(BaseDocumentStore):
                 return None
         return json_to_doc(json)
 
+    def get_nodes(self, node_ids: List[str], raise_error: bool = True) -> List[Node]:
+        """Get nodes from docstore, with a single bulk read.
+
+        Args:
+            node_ids (List[str]): node ids
+            raise_error (bool): raise error if node_id not found
+
+        """
+        json_dict = self._kvstore.get_many(node_ids, collection=self._node_collection)
+        return self._json_to_nodes(node_ids, json_dict, raise_error=raise_error)
+
+    def _json_to_nodes(
+        self, node_ids: List[str], json_dict: Dict[str, dict], raise_error: bool
+    ) -> List[Node]:
+        """Parse nodes of a bulk read, in the order of node_ids."""
+        nodes = []
+        for node_id in node_ids:
+            json = json_dict.get(node_id, None)
+            if json is None and raise_error:
+                raise ValueError(f"doc_id {node_id} not found.")
+            doc = json_to_doc(json) if json is not None else None
+            if not isinstance(doc, Node):
+                raise ValueError(f"Document {node_id} is not a Node.")
+            nodes.append(doc)
+        return nodes
+
+    def get_node_dict(self, node_id_dict: Dict[int, str]) -> Dict[int, Node]:
+        """Get node dict from docstore given a mapping of index to node ids.
+
+        Args:
+            node_id_dict (Dict[int, str]): mapping of index to node ids
+
+        """
+        nodes = self.get_nodes(list(node_id_dict.values()))
+        return dict(zip(node_id_dict.keys(), nodes))
+
     def get_ref_doc_info(self, ref_doc_id: str) -> Optional[RefDocInfo]:
         """Get the RefDocInfo for a given ref_doc_id."""
         ref_doc_info = self._kvstore.get(
@@ -206,8 +296,12 @@ class KVDocumentStore(BaseDocumentStore):
             else:
                 return
 
-        for doc_id in ref_doc_info.doc_ids:
-            self.delete_document(doc_id, raise_error=False, remove_ref_doc_node=False)
+        self._kvstore.delete_many(
+            ref_doc_info.doc_ids, collection=self._node_collection
+        )
+        self._kvstore.delete_many(
+            ref_doc_info.doc_ids, collection=self._metadata_collection
+        )
 
         self._kvstore.delete(ref_doc_id, collection=self._metadata_collection)
         self._kvstore.delete(ref_doc_id, collection=self._ref_doc_collection)
@@ -224,3 +318,114 @@ class KVDocumentStore(BaseDocumentStore):
             return metadata.get("doc_hash", None)
         else:
             return None
+
+    # ===== Async interface =====
+    async def aadd_documents(
+        self, docs: Sequence[BaseDocument], allow_update: bool = True
+    ) -> None:
+        """Asynchronously add documents to the store.
+
+        Args:
+            docs (List[BaseDocument]): documents
+            allow_update (bool): allow update of docstore from document
+
+        """
+        existing_doc_ids = None
+        if not allow_update:
+            existing = await self._kvstore.aget_many(
+                [doc.get_doc_id() for doc in docs], collection=self._node_collection
+            )
+            existing_doc_ids = existing.keys()
+        self._validate_docs(docs, existing_doc_ids)
+
+        node_kv_pairs, metadata_kv_pairs, ref_doc_nodes = self._get_kv_pairs(docs)
+        ref_doc_jsons = await self._kvstore.aget_many(
+            list(ref_doc_nodes), collection=self._ref_doc_collection
+        )
+        ref_doc_kv_pairs = self._merge_ref_doc_info(ref_doc_nodes, ref_doc_jsons)
+
+        await asyncio.gather(
+            self._kvstore.aput_all(node_kv_pairs, collection=self._node_collection),
+            self._kvstore.aput_all(
+                metadata_kv_pairs, collection=self._metadata_collection
+            ),
+            self._kvstore.aput_all(
+                ref_doc_kv_pairs, collection=self._ref_doc_collection
+            ),
+        )
+
+    async def aget_document(
+        self, doc_id: str, raise_error: bool = True
+    ) -> Optional[BaseDocument]:
+        """Asynchronously get a document from the store.
+
+        Args:
+            doc_id (str): document id
+            raise_error (bool): raise error if doc_id not found
+
+        """
+        json = await self._kvstore.aget(doc_id, collection=self._node_collection)
+        if json is None:
+            if raise_error:
+                raise ValueError(f"doc_id {doc_id} not found.")
+            else:
+                return None
+        return json_to_doc(json)
+
+    async def aget_nodes(
+        self, node_ids: List[str], raise_error: bool = True
+    ) -> List[Node]:
+        """Asynchronously get nodes from docstore, with a single bulk read.
+
+        Args:
+            node_ids (List[str]): node ids
+            raise_error (bool): raise error if node_id not found
+
+        """
+        json_dict = await self._kvstore.aget_many(
+            node_ids, collection=self._node_collection
+        )
+        return self._json_to_nodes(node_ids, json_dict, raise_error=raise_error)
+
+    async def aget_ref_doc_info(self, ref_doc_id: str) -> Optional[RefDocInfo]:
+        """Asynchronously get the RefDocInfo for a given ref_doc_id."""
+        ref_doc_info = await self._kvstore.aget(
+            ref_doc_id, collection=self._ref_doc_collection
+        )
+        if not ref_doc_info:
+            return None
+        return RefDocInfo(**ref_doc_info)
+
+    async def adocument_exists(self, doc_id: str) -> bool:
+        """Asynchronously check if document exists."""
+        return await self._kvstore.aget(doc_id, self._node_collection) is not None
+
+    async def adelete_ref_doc(self, ref_doc_id: str, raise_error: bool = True) -> None:
+        """Asynchronously delete a ref_doc and all it's associated nodes."""
+        ref_doc_info = await self.aget_ref_doc_info(ref_doc_id)
+        if ref_doc_info is None:
+            if raise_error:
+                raise ValueError(f"ref_doc_id {ref_doc_id} not found.")
+            else:
+                return
+
+        await asyncio.gather(
+            self._kvstore.adelete_many(
+                ref_doc_info.doc_ids, collection=self._node_collection
+            ),
+            self._kvstore.adelete_many(
+                [*ref_doc_info.doc_ids, ref_doc_id],
+                collection=self._metadata_collection,
+            ),
+            self._kvstore.adelete(ref_doc_id, collection=self._ref_doc_collection),
+        )
+
+    async def aget_document_hash(self, doc_id: str) -> Optional[str]:
+        """Asynchronously get the stored hash for a document, if it exists."""
+        metadata = await self._kvstore.aget(
+            doc_id, collection=self._metadata_collection
+        )
+        if metadata is not None:
+            return metadata.get("doc_hash", None)
+        else:
+            return None
@@ -0,0 +1,32 @@
+from typing import Optional
+
+from llama_index.storage.docstore.keyval_docstore import KVDocumentStore
+from llama_index.storage.kvstore.sqlite_kvstore import SQLiteKVStore
+
+
+class SQLiteDocumentStore(KVDocumentStore):
+    """SQLite Document (Node) store.
+
+    A local persistent store for Document and Node objects: documents are
+    read and written per key, without loading the whole store.
+
+    Args:
+        sqlite_kvstore (SQLiteKVStore): SQLite key-value store
+        namespace (str): namespace for the docstore
+
+    """
+
+    def __init__(
+        self,
+        sqlite_kvstore: SQLiteKVStore,
+        namespace: Optional[str] = None,
+    ) -> None:
+        """Init a SQLiteDocumentStore."""
+        super().__init__(sqlite_kvstore, namespace=namespace)
+
+    @classmethod
+    def from_db_path(
+        cls, db_path: str, namespace: Optional[str] = None
+    ) -> "SQLiteDocumentStore":
+        """Load a SQLiteDocumentStore from a SQLite database file."""
+        return cls(SQLiteKVStore(db_path), namespace=namespace)
@@ -1,4 +1,5 @@
 import os
+
 import fsspec
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
@@ -7,6 +8,7 @@ from typing import Any, Dict, List, Optional, Sequence
 from llama_index.data_structs.node import Node
 
 from llama_index.schema import BaseDocument
+from llama_index.storage.kvstore.types import run_in_thread
 
 
 DEFAULT_PERSIST_FNAME = "docstore.json"
@@ -44,6 +46,17 @@ class BaseDocumentStore(ABC):
     ) -> None:
         ...
 
+    async def aadd_documents(
+        self, docs: Sequence[BaseDocument], allow_update: bool = True
+    ) -> None:
+        """Asynchronously add documents to the store.
+
+        By default, this runs `add_documents` in a thread, so that remote
+        backends do not block the event loop.
+
+        """
+        await run_in_thread(self.add_documents, docs, allow_update=allow_update)
+
     @abstractmethod
     def get_document(
         self, doc_id: str, raise_error: bool = True
@@ -81,6 +94,38 @@ class BaseDocumentStore(ABC):
     def delete_ref_doc(self, ref_doc_id: str, raise_error: bool = True) -> None:
         """Delete a ref_doc and all it's associated nodes."""
 
+    # ===== Async interface =====
+    # NOTE: by default, async methods run their sync counterpart in a thread.
+    async def aget_document(
+        self, doc_id: str, raise_error: bool = True
+    ) -> Optional[BaseDocument]:
+        """Asynchronously get a document from the store."""
+        return await run_in_thread(self.get_document, doc_id, raise_error=raise_error)
+
+    async def adelete_document(self, doc_id: str, raise_error: bool = True) -> None:
+        """Asynchronously delete a document from the store."""
+        await run_in_thread(self.delete_document, doc_id, raise_error=raise_error)
+
+    async def adocument_exists(self, doc_id: str) -> bool:
+        """Asynchronously check if document exists."""
+        return await run_in_thread(self.document_exists, doc_id)
+
+    async def aget_document_hash(self, doc_id: str) -> Optional[str]:
+        """Asynchronously get the stored hash for a document, if it exists."""
+        return await run_in_thread(self.get_document_hash, doc_id)
+
+    async def aget_ref_doc_info(self, ref_doc_id: str) -> Optional[RefDocInfo]:
+        """Asynchronously get the RefDocInfo for a given ref_doc_id."""
+        return await run_in_thread(self.get_ref_doc_info, ref_doc_id)
+
+    async def adelete_ref_doc(self, ref_doc_id: str, raise_error: bool = True) -> None:
+        """Asynchronously delete a ref_doc and all it's associated nodes.
+
+        By default, this runs `delete_ref_doc` in a thread.
+
+        """
+        await run_in_thread(self.delete_ref_doc, ref_doc_id, raise_error=raise_error)
+
     # ===== Nodes =====
     def get_nodes(self, node_ids: List[str], raise_error: bool = True) -> List[Node]:
         """Get nodes from docstore.
@@ -112,6 +157,38 @@ class BaseDocumentStore(ABC):
             node_id_dict (Dict[int, str]): mapping of index to node ids
 
         """
-        return {
-            index: self.get_node(node_id) for index, node_id in node_id_dict.items()
-        }
+        nodes = self.get_nodes(list(node_id_dict.values()))
+        return dict(zip(node_id_dict.keys(), nodes))
+
+    async def aget_nodes(
+        self, node_ids: List[str], raise_error: bool = True
+    ) -> List[Node]:
+        """Asynchronously get nodes from docstore.
+
+        Args:
+            node_ids (List[str]): node ids
+            raise_error (bool): raise error if node_id not found
+
+        """
+        return await run_in_thread(self.get_nodes, node_ids, raise_error=raise_error)
+
+    async def aget_node(self, node_id: str, raise_error: bool = True) -> Node:
+        """Asynchronously get node from docstore.
+
+        Args:
+            node_id (str): node id
+            raise_error (bool): raise error if node_id not found
+
+        """
+        nodes = await self.aget_nodes([node_id], raise_error=raise_error)
+        return nodes[0]
+
+    async def aget_node_dict(self, node_id_dict: Dict[int, str]) -> Dict[int, Node]:
+        """Asynchronously get node dict from docstore.
+
+        Args:
+            node_id_dict (Dict[int, str]): mapping of index to node ids
+
+        """
+        nodes = await self.aget_nodes(list(node_id_dict.values()))
+        return dict(zip(node_id_dict.keys(), nodes))
@@ -1,29 +1,104 @@
+from dataclasses import fields
+from typing import Any, Dict, Tuple, Type
+
+import numpy as np
+
 from llama_index.constants import DATA_KEY, TYPE_KEY
-from llama_index.data_structs.node import ImageNode, IndexNode, Node
+from llama_index.data_structs.node import (
+    DocumentRelationship,
+    ImageNode,
+    IndexNode,
+    Node,
+)
 from llama_index.readers.schema.base import Document
 from llama_index.schema import BaseDocument
 
+MSGPACK_IMPORT_ERROR_MSG = (
+    "`msgpack` package not found, please run `pip install msgpack`"
+)
+
+_DOC_TYPES: Tuple[Type[BaseDocument], ...] = (Document, Node, ImageNode, IndexNode)
+_DOC_CLASSES: Dict[str, Type[BaseDocument]] = {
+    cls.get_type(): cls for cls in _DOC_TYPES
+}
+# NOTE: field names are resolved once, instead of on every (de)serialization
+# by dataclasses_json
+_DOC_FIELDS: Dict[str, Tuple[str, ...]] = {
+    doc_type: tuple(field.name for field in fields(cls))
+    for doc_type, cls in _DOC_CLASSES.items()
+}
+
+
+def _copy_value(val: Any) -> Any:
+    """Copy nested containers, so that stored data does not alias documents."""
+    if isinstance(val, dict):
+        return {key: _copy_value(v) for key, v in val.items()}
+    if isinstance(val, list):
+        return [_copy_value(v) for v in val]
+    return val
+
 
 def doc_to_json(doc: BaseDocument) -> dict:
+    doc_type = doc.get_type()
+    doc_fields = _DOC_FIELDS.get(doc_type, None)
+    if doc_fields is None or type(doc) is not _DOC_CLASSES[doc_type]:
+        # e.g. subclasses with extra fields
+        data = doc.to_dict()
+    else:
+        data = {name: _copy_value(getattr(doc, name)) for name in doc_fields}
     return {
-        DATA_KEY: doc.to_dict(),
-        TYPE_KEY: doc.get_type(),
+        DATA_KEY: data,
+        TYPE_KEY: doc_type,
     }
 
 
 def json_to_doc(doc_dict: dict) -> BaseDocument:
     doc_type = doc_dict[TYPE_KEY]
     data_dict = doc_dict[DATA_KEY]
-    doc: BaseDocument
-    if doc_type == Document.get_type():
-        doc = Document.from_dict(data_dict)
-    elif doc_type == Node.get_type():
-        doc = Node.from_dict(data_dict)
-    elif doc_type == ImageNode.get_type():
-        doc = ImageNode.from_dict(data_dict)
-    elif doc_type == IndexNode.get_type():
-        doc = IndexNode.from_dict(data_dict)
-    else:
+    if doc_type not in _DOC_CLASSES:
         raise ValueError(f"Unknown doc type: {doc_type}")
 
-    return doc
+    kwargs = {
+        name: _copy_value(data_dict[name])
+        for name in _DOC_FIELDS[doc_type]
+        if name in data_dict
+    }
+    if "relationships" in kwargs:
+        kwargs["relationships"] = {
+            DocumentRelationship(key): val
+            for key, val in kwargs["relationships"].items()
+        }
+    return _DOC_CLASSES[doc_type](**kwargs)
+
+
+def doc_to_bytes(doc: BaseDocument) -> bytes:
+    """Serialize a document to msgpack.
+
+    The embedding is stored as packed little-endian float32 bytes, which is
+    several times smaller than JSON floats but lossy for float64 embeddings.
+
+    """
+    try:
+        import msgpack
+    except ImportError:
+        raise ImportError(MSGPACK_IMPORT_ERROR_MSG)
+
+    doc_dict = doc_to_json(doc)
+    embedding = doc_dict[DATA_KEY].get("embedding", None)
+    if embedding is not None:
+        doc_dict[DATA_KEY]["embedding"] = np.asarray(embedding, dtype="<f4").tobytes()
+    return msgpack.packb(doc_dict)
+
+
+def bytes_to_doc(data: bytes) -> BaseDocument:
+    """Deserialize a document serialized with `doc_to_bytes`."""
+    try:
+        import msgpack
+    except ImportError:
+        raise ImportError(MSGPACK_IMPORT_ERROR_MSG)
+
+    doc_dict = msgpack.unpackb(data)
+    embedding = doc_dict[DATA_KEY].get("embedding", None)
+    if embedding is not None:
+        doc_dict[DATA_KEY]["embedding"] = np.frombuffer(embedding, dtype="<f4").tolist()
+    return json_to_doc(doc_dict)
@@ -73,3 +73,52 @@ class KVIndexStore(BaseIndexStore):
         """
         jsons = self._kvstore.get_all(collection=self._collection)
         return [json_to_index_struct(json) for json in jsons.values()]
+
+    async def aadd_index_struct(self, index_struct: IndexStruct) -> None:
+        """Asynchronously add an index struct.
+
+        Args:
+            index_struct (IndexStruct): index struct
+
+        """
+        key = index_struct.index_id
+        data = index_struct_to_json(index_struct)
+        await self._kvstore.aput(key, data, collection=self._collection)
+
+    async def adelete_index_struct(self, key: str) -> None:
+        """Asynchronously delete an index struct.
+
+        Args:
+            key (str): index struct key
+
+        """
+        await self._kvstore.adelete(key, collection=self._collection)
+
+    async def aget_index_struct(
+        self, struct_id: Optional[str] = None
+    ) -> Optional[IndexStruct]:
+        """Asynchronously get an index struct.
+
+        Args:
+            struct_id (Optional[str]): index struct id
+
+        """
+        if struct_id is None:
+            structs = await self.aindex_structs()
+            assert len(structs) == 1
+            return structs[0]
+        else:
+            json = await self._kvstore.aget(struct_id, collection=self._collection)
+            if json is None:
+                return None
+            return json_to_index_struct(json)
+
+    async def aindex_structs(self) -> List[IndexStruct]:
+        """Asynchronously get all index structs.
+
+        Returns:
+            List[IndexStruct]: index structs
+
+        """
+        jsons = await self._kvstore.aget_all(collection=self._collection)
+        return [json_to_index_struct(json) for json in jsons.values()]
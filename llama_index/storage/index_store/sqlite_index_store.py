@@ -0,0 +1,29 @@
+from typing import Optional
+
+from llama_index.storage.index_store.keyval_index_store import KVIndexStore
+from llama_index.storage.kvstore.sqlite_kvstore import SQLiteKVStore
+
+
+class SQLiteIndexStore(KVIndexStore):
+    """SQLite Index store.
+
+    Args:
+        sqlite_kvstore (SQLiteKVStore): SQLite key-value store
+        namespace (str): namespace for the index store
+
+    """
+
+    def __init__(
+        self,
+        sqlite_kvstore: SQLiteKVStore,
+        namespace: Optional[str] = None,
+    ) -> None:
+        """Init a SQLiteIndexStore."""
+        super().__init__(sqlite_kvstore, namespace=namespace)
+
+    @classmethod
+    def from_db_path(
+        cls, db_path: str, namespace: Optional[str] = None
+    ) -> "SQLiteIndexStore":
+        """Load a SQLiteIndexStore from a SQLite database file."""
+        return cls(SQLiteKVStore(db_path), namespace=namespace)
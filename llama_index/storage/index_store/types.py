@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from typing import List, Optional
 
 from llama_index.data_structs.data_structs import IndexStruct
+from llama_index.storage.kvstore.types import run_in_thread
 import os
 import fsspec
 
@@ -29,6 +30,22 @@ class BaseIndexStore(ABC):
     ) -> Optional[IndexStruct]:
         pass
 
+    # ===== Async interface =====
+    # NOTE: by default, async methods run their sync counterpart in a thread.
+    async def aindex_structs(self) -> List[IndexStruct]:
+        return await run_in_thread(self.index_structs)
+
+    async def aadd_index_struct(self, index_struct: IndexStruct) -> None:
+        await run_in_thread(self.add_index_struct, index_struct)
+
+    async def adelete_index_struct(self, key: str) -> None:
+        await run_in_thread(self.delete_index_struct, key)
+
+    async def aget_index_struct(
+        self, struct_id: Optional[str] = None
+    ) -> Optional[IndexStruct]:
+        return await run_in_thread(self.get_index_struct, struct_id)
+
     def persist(
         self,
         persist_path: str = DEFAULT_PERSIST_PATH,
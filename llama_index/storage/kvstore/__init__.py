@@ -1,4 +1,6 @@
 from llama_index.storage.kvstore.simple_kvstore import SimpleKVStore
 from llama_index.storage.kvstore.mongodb_kvstore import MongoDBKVStore
+from llama_index.storage.kvstore.lru_kvstore import LRUKVStore
+from llama_index.storage.kvstore.sqlite_kvstore import SQLiteKVStore
 
-__all__ = ["SimpleKVStore", "MongoDBKVStore"]
+__all__ = ["SimpleKVStore", "MongoDBKVStore", "LRUKVStore", "SQLiteKVStore"]
@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+import time
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
 
 from llama_index.storage.kvstore.types import DEFAULT_COLLECTION, BaseKVStore
 
 IMPORT_ERROR_MSG = "`boto3` package not found, please run `pip install boto3`"
+# max number of keys of a BatchGetItem request
+BATCH_GET_MAX_KEYS = 100
+# retry schedule for keys left unprocessed by a BatchGetItem request
+BATCH_GET_MAX_TRIES = 10
+BATCH_GET_MIN_BACKOFF_SECS = 0.5
+BATCH_GET_MAX_BACKOFF_SECS = 60.0
 
 
 def parse_schema(table: Any) -> Tuple[str, str]:
@@ -99,6 +106,26 @@ class DynamoDBKVStore(BaseKVStore):
         item[self._key_range] = key
         self._table.put_item(Item=item)
 
+    def put_all(
+        self,
+        kv_pairs: Sequence[Tuple[str, dict]],
+        collection: str = DEFAULT_COLLECTION,
+    ) -> None:
+        """Put key-value pairs into the store with batched writes.
+
+        Args:
+            kv_pairs (Sequence[Tuple[str, dict]]): key-value pairs
+            collection (str): collection name
+        """
+        with self._table.batch_writer(
+            overwrite_by_pkeys=[self._key_hash, self._key_range]
+        ) as batch:
+            for key, val in kv_pairs:
+                item = {k: convert_float_to_decimal(v) for k, v in val.items()}
+                item[self._key_hash] = collection
+                item[self._key_range] = key
+                batch.put_item(Item=item)
+
     def get(self, key: str, collection: str = DEFAULT_COLLECTION) -> Optional[dict]:
         """Get a value from the store.
 
@@ -118,6 +145,53 @@ class DynamoDBKVStore(BaseKVStore):
                 if k not in {self._key_hash, self._key_range}
             }
 
+    def get_many(
+        self, keys: Sequence[str], collection: str = DEFAULT_COLLECTION
+    ) -> Dict[str, dict]:
+        """Get values of the given keys with batched reads.
+
+        Keys left unprocessed by DynamoDB (e.g. when throttled) are retried
+        with exponential backoff, up to ``BATCH_GET_MAX_TRIES`` requests per batch.
+
+        Args:
+            keys (Sequence[str]): keys
+            collection (str): collection name
+        """
+        result = {}
+        unique_keys = list(dict.fromkeys(keys))
+        for start in range(0, len(unique_keys), BATCH_GET_MAX_KEYS):
+            request_items: Optional[Dict[str, Any]] = {
+                self._table.name: {
+                    "Keys": [
+                        {self._key_hash: collection, self._key_range: key}
+                        for key in unique_keys[start : start + BATCH_GET_MAX_KEYS]
+                    ]
+                }
+            }
+            backoff_secs = BATCH_GET_MIN_BACKOFF_SECS
+            tries = 0
+            while request_items:
+                if tries >= BATCH_GET_MAX_TRIES:
+                    raise ValueError(
+                        f"Keys still unprocessed after {tries} BatchGetItem "
+                        "requests."
+                    )
+                if tries > 0:
+                    time.sleep(backoff_secs)
+                    backoff_secs = min(backoff_secs * 2, BATCH_GET_MAX_BACKOFF_SECS)
+                tries += 1
+                resp = self._table.meta.client.batch_get_item(
+                    RequestItems=request_items
+                )
+                for item in resp.get("Responses", {}).get(self._table.name, []):
+                    item.pop(self._key_hash)
+                    key = item.pop(self._key_range)
+                    result[key] = {
+                        k: convert_decimal_to_int_or_float(v) for k, v in item.items()
+                    }
+                request_items = resp.get("UnprocessedKeys")
+        return result
+
     def get_all(self, collection: str = DEFAULT_COLLECTION) -> Dict[str, dict]:
         """Get all values from the store.
 
@@ -161,3 +235,20 @@ class DynamoDBKVStore(BaseKVStore):
             return False
         else:
             return len(item) > 0
+
+    def delete_many(
+        self, keys: Sequence[str], collection: str = DEFAULT_COLLECTION
+    ) -> None:
+        """Delete values of the given keys with batched writes.
+
+        Args:
+            keys (Sequence[str]): keys
+            collection (str): collection name
+        """
+        with self._table.batch_writer(
+            overwrite_by_pkeys=[self._key_hash, self._key_range]
+        ) as batch:
+            for key in keys:
+                batch.delete_item(
+                    Key={self._key_hash: collection, self._key_range: key}
+                )
@@ -0,0 +1,61 @@
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from llama_index.storage.kvstore.types import DEFAULT_COLLECTION, BaseKVStore
+
+DEFAULT_MAX_SIZE = 100000
+
+
+class LRUKVStore(BaseKVStore):
+    """Bounded in-memory Key-Value store.
+
+    Every collection keeps at most `max_size` values; once full, the least
+    recently used value is evicted. Operations are guarded by a lock, since
+    async methods run in a thread pool.
+
+    Args:
+        max_size (int): max number of values per collection
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        """Init a LRUKVStore."""
+        if max_size <= 0:
+            raise ValueError("max_size must be > 0")
+        self._max_size = max_size
+        self._data: Dict[str, "OrderedDict[str, dict]"] = {}
+        self._lock = threading.Lock()
+
+    def put(self, key: str, val: dict, collection: str = DEFAULT_COLLECTION) -> None:
+        """Put a key-value pair into the store."""
+        val = val.copy()
+        with self._lock:
+            collection_data = self._data.setdefault(collection, OrderedDict())
+            collection_data[key] = val
+            collection_data.move_to_end(key)
+            if len(collection_data) > self._max_size:
+                collection_data.popitem(last=False)
+
+    def get(self, key: str, collection: str = DEFAULT_COLLECTION) -> Optional[dict]:
+        """Get a value from the store."""
+        with self._lock:
+            collection_data = self._data.get(collection, None)
+            if collection_data is None or key not in collection_data:
+                return None
+            collection_data.move_to_end(key)
+            val = collection_data[key]
+        return val.copy()
+
+    def get_all(self, collection: str = DEFAULT_COLLECTION) -> Dict[str, dict]:
+        """Get all values from the store."""
+        with self._lock:
+            return dict(self._data.get(collection, {}))
+
+    def delete(self, key: str, collection: str = DEFAULT_COLLECTION) -> bool:
+        """Delete a value from the store."""
+        with self._lock:
+            try:
+                self._data[collection].pop(key)
+                return True
+            except KeyError:
+                return False
@@ -1,8 +1,18 @@
-from typing import Any, Dict, Optional, cast
+from typing import Any, Dict, Optional, Sequence, Tuple, cast
 from llama_index.storage.kvstore.types import DEFAULT_COLLECTION, BaseKVStore
 
 
 IMPORT_ERROR_MSG = "`pymongo` package not found, please run `pip install pymongo`"
+MOTOR_IMPORT_ERROR_MSG = "`motor` package not found, please run `pip install motor`"
+
+
+def _get_async_mongo_client(*args: Any) -> Any:
+    """Get a motor client."""
+    try:
+        from motor.motor_asyncio import AsyncIOMotorClient
+    except ImportError:
+        raise ImportError(MOTOR_IMPORT_ERROR_MSG)
+    return AsyncIOMotorClient(*args)
 
 
 class MongoDBKVStore(BaseKVStore):
@@ -14,6 +24,8 @@ class MongoDBKVStore(BaseKVStore):
         host (Optional[str]): MongoDB host
         port (Optional[int]): MongoDB port
         db_name (Optional[str]): MongoDB database name
+        async_mongo_client (Optional[Any]): async (motor) MongoDB client used by
+            async methods. If not set, async methods run in a thread pool.
 
     """
 
@@ -24,6 +36,7 @@ class MongoDBKVStore(BaseKVStore):
         host: Optional[str] = None,
         port: Optional[int] = None,
         db_name: Optional[str] = None,
+        async_mongo_client: Optional[Any] = None,
     ) -> None:
         """Init a MongoDBKVStore."""
         try:
@@ -39,18 +52,27 @@ class MongoDBKVStore(BaseKVStore):
 
         self._db_name = db_name or "db_docstore"
         self._db = self._client[self._db_name]
+        self._adb = (
+            async_mongo_client[self._db_name]
+            if async_mongo_client is not None
+            else None
+        )
 
     @classmethod
     def from_uri(
         cls,
         uri: str,
         db_name: Optional[str] = None,
+        use_motor: bool = False,
     ) -> "MongoDBKVStore":
         """Load a MongoDBKVStore from a MongoDB URI.
 
         Args:
             uri (str): MongoDB URI
             db_name (Optional[str]): MongoDB database name
+            use_motor (bool): whether to create a motor client for async
+                methods. Requires `motor`. Defaults to False, in which case
+                async methods run in a thread pool.
 
         """
         try:
@@ -63,6 +85,7 @@ class MongoDBKVStore(BaseKVStore):
             mongo_client=mongo_client,
             db_name=db_name,
             uri=uri,
+            async_mongo_client=_get_async_mongo_client(uri) if use_motor else None,
         )
 
     @classmethod
@@ -71,6 +94,7 @@ class MongoDBKVStore(BaseKVStore):
         host: str,
         port: int,
         db_name: Optional[str] = None,
+        use_motor: bool = False,
     ) -> "MongoDBKVStore":
         """Load a MongoDBKVStore from a MongoDB host and port.
 
@@ -78,6 +102,9 @@ class MongoDBKVStore(BaseKVStore):
             host (str): MongoDB host
             port (int): MongoDB port
             db_name (Optional[str]): MongoDB database name
+            use_motor (bool): whether to create a motor client for async
+                methods. Requires `motor`. Defaults to False, in which case
+                async methods run in a thread pool.
 
         """
         try:
@@ -91,6 +118,9 @@ class MongoDBKVStore(BaseKVStore):
             db_name=db_name,
             host=host,
             port=port,
+            async_mongo_client=(
+                _get_async_mongo_client(host, port) if use_motor else None
+            ),
         )
 
     def put(
@@ -153,3 +183,186 @@ class MongoDBKVStore(BaseKVStore):
         """
         result = self._db[collection].delete_one({"_id": key})
         return result.deleted_count > 0
+
+    def put_all(
+        self,
+        kv_pairs: Sequence[Tuple[str, dict]],
+        collection: str = DEFAULT_COLLECTION,
+    ) -> None:
+        """Put key-value pairs into the store with a single bulk write.
+
+        Args:
+            kv_pairs (Sequence[Tuple[str, dict]]): key-value pairs
+            collection (str): collection name
+
+        """
+        from pymongo import ReplaceOne
+
+        if not kv_pairs:
+            return
+        # NOTE: unordered writes, so only keep the last value of every key
+        requests = [
+            ReplaceOne({"_id": key}, {**val, "_id": key}, upsert=True)
+            for key, val in dict(kv_pairs).items()
+        ]
+        self._db[collection].bulk_write(requests, ordered=False)
+
+    def get_many(
+        self, keys: Sequence[str], collection: str = DEFAULT_COLLECTION
+    ) -> Dict[str, dict]:
+        """Get values of the given keys with a single query.
+
+        Args:
+            keys (Sequence[str]): keys
+            collection (str): collection name
+
+        """
+        if not keys:
+            return {}
+        output = {}
+        for result in self._db[collection].find({"_id": {"$in": list(keys)}}):
+            key = result.pop("_id")
+            output[key] = result
+        return output
+
+    def delete_many(
+        self, keys: Sequence[str], collection: str = DEFAULT_COLLECTION
+    ) -> None:
+        """Delete values of the given keys with a single query.
+
+        Args:
+            keys (Sequence[str]): keys
+            collection (str): collection name
+
+        """
+        if not keys:
+            return
+        self._db[collection].delete_many({"_id": {"$in": list(keys)}})
+
+    async def aput(
+        self,
+        key: str,
+        val: dict,
+        collection: str = DEFAULT_COLLECTION,
+    ) -> None:
+        """Asynchronously put a key-value pair into the store.
+
+        Args:
+            key (str): key
+            val (dict): value
+            collection (str): collection name
+
+        """
+        if self._adb is None:
+            return await super().aput(key, val, collection=collection)
+        await self._adb[collection].replace_one(
+            {"_id": key},
+            {**val, "_id": key},
+            upsert=True,
+        )
+
+    async def aget(
+        self, key: str, collection: str = DEFAULT_COLLECTION
+    ) -> Optional[dict]:
+        """Asynchronously get a value from the store.
+
+        Args:
+            key (str): key
+            collection (str): collection name
+
+        """
+        if self._adb is None:
+            return await super().aget(key, collection=collection)
+        result = await self._adb[collection].find_one({"_id": key})
+        if result is not None:
+            result.pop("_id")
+            return result
+        return None
+
+    async def aget_all(self, collection: str = DEFAULT_COLLECTION) -> Dict[str, dict]:
+        """Asynchronously get all values from the store.
+
+        Args:
+            collection (str): collection name
+
+        """
+        if self._adb is None:
+            return await super().aget_all(collection=collection)
+        output = {}
+        async for result in self._adb[collection].find():
+            key = result.pop("_id")
+            output[key] = result
+        return output
+
+    async def adelete(self, key: str, collection: str = DEFAULT_COLLECTION) -> bool:
+        """Asynchronously delete a value from the store.
+
+        Args:
+            key (str): key
+            collection (str): collection name
+
+        """
+        if self._adb is None:
+            return await super().adelete(key, collection=collection)
+        result = await self._adb[collection].delete_one({"_id": key})
+        return result.deleted_count > 0
+
+    async def aput_all(
+        self,
+        kv_pairs: Sequence[Tuple[str, dict]],
+        collection: str = DEFAULT_COLLECTION,
+    ) -> None:
+        """Asynchronously put key-value pairs into the store with a bulk write.
+
+        Args:
+            kv_pairs (Sequence[Tuple[str, dict]]): key-value pairs
+            collection (str): collection name
+
+        """
+        if self._adb is None:
+            return await super().aput_all(kv_pairs, collection=collection)
+        from pymongo import ReplaceOne
+
+        if not kv_pairs:
+            return
+        requests = [
+            ReplaceOne({"_id": key}, {**val, "_id": key}, upsert=True)
+            for key, val in dict(kv_pairs).items()
+        ]
+        await self._adb[collection].bulk_write(requests, ordered=False)
+
+    async def aget_many(
+        self, keys: Sequence[str], collection: str = DEFAULT_COLLECTION
+    ) -> Dict[str, dict]:
+        """Asynchronously get values of the given keys with a single query.
+
+        Args:
+            keys (Sequence[str]): keys
+            collection (str): collection name
+
+        """
+        if self._adb is None:
+            return await super().aget_many(keys, collection=collection)
+        if not keys:
+            return {}
+        output = {}
+        async for result in self._adb[collection].find({"_id": {"$in": list(keys)}}):
+            key = result.pop("_id")
+            output[key] = result
+        return output
+
+    async def adelete_many(
+        self, keys: Sequence[str], collection: str = DEFAULT_COLLECTION
+    ) -> None:
+        """Asynchronously delete values of the given keys with a single query.
+
+        Args:
+            keys (Sequence[str]): keys
+            collection (str): collection name
+
+        """
+        if self._adb is None:
+            return await super().adelete_many(keys, collection=collection)
+        if not keys:
+            return
+        await self._adb[collection].delete_many({"_id": {"$in": list(keys)}})
@@ -1,11 +1,31 @@
+import hashlib
 import json
 import os
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import PurePath
-from typing import Any, Dict, Optional
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
 
 from llama_index.storage.kvstore.types import DEFAULT_COLLECTION, BaseKVStore
 
 IMPORT_ERROR_MSG = "`boto3` package not found, please run `pip install boto3`"
+DEFAULT_MAX_WORKERS = 16
+# max number of keys of a DeleteObjects request
+DELETE_OBJECTS_MAX_KEYS = 1000
+SHARD_PREFIX = "shard_"
+
+T = TypeVar("T")
+R = TypeVar("R")
 
 
 class S3DBKVStore(BaseKVStore):
@@ -15,15 +35,28 @@ class S3DBKVStore(BaseKVStore):
     The KV data is further divided into collections, which are subfolders in the path.
     Each key-value pair is stored as a JSON file.
 
+    With `num_shards` set, keys are instead packed into `num_shards` JSON objects
+    per collection (by hash of the key), which cuts the number of objects and
+    requests by orders of magnitude for large collections. Writes to a shard are
+    read-modify-write, so the packed layout assumes a single writer; prefer the
+    bulk `put_all` / `delete_many` methods, which rewrite every shard once.
+
+    Reads, bulk writes and `get_all` fan out over a bounded thread pool.
+
     Args:
         s3_bucket (Any): boto3 S3 Bucket instance
         path (Optional[str]): path to folder in S3 bucket where KV data is stored
+        max_workers (int): number of threads used by bulk reads and writes
+        num_shards (Optional[int]): number of packed objects per collection.
+            Defaults to one object per key.
     """
 
     def __init__(
         self,
         bucket: Any,
         path: Optional[str] = "./",
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        num_shards: Optional[int] = None,
     ) -> None:
         """Init a S3DBKVStore."""
         try:
@@ -31,20 +64,29 @@ class S3DBKVStore(BaseKVStore):
         except ImportError:
             raise ImportError(IMPORT_ERROR_MSG)
 
+        if num_shards is not None and num_shards <= 0:
+            raise ValueError("num_shards must be > 0")
+
         self._bucket = bucket
+        # NOTE: boto3 clients are thread-safe, unlike resources
+        self._client = bucket.meta.client
         self._path = path or "./"
+        self._max_workers = max_workers
+        self._num_shards = num_shards
 
     @classmethod
     def from_s3_location(
         cls,
         bucket_name: str,
         path: Optional[str] = None,
+        num_shards: Optional[int] = None,
     ) -> "S3DBKVStore":
         """Load a S3DBKVStore from a S3 URI.
 
         Args:
             bucket_name (str): S3 bucket name
             path (Optional[str]): path to folder in S3 bucket where KV data is stored
+            num_shards (Optional[int]): number of packed objects per collection
         """
         try:
             import boto3
@@ -56,11 +98,89 @@ class S3DBKVStore(BaseKVStore):
         return cls(
             bucket,
             path=path,
+            num_shards=num_shards,
         )
 
     def _get_object_key(self, collection: str, key: str) -> str:
         return str(PurePath(f"{self._path}/{collection}/{key}.json"))
 
+    def _get_collection_prefix(self, collection: str) -> str:
+        # NOTE: trailing slash, so that collection "a" does not match "ab"
+        return str(PurePath(f"{self._path}/{collection}")) + "/"
+
+    def _get_shard_key(self, collection: str, key: str) -> str:
+        assert self._num_shards is not None
+        digest = hashlib.md5(key.encode()).hexdigest()
+        shard = int(digest, 16) % self._num_shards
+        return self._get_object_key(collection, f"{SHARD_PREFIX}{shard:05d}")
+
+    def _map(self, fn: Callable[[T], R], items: Iterable[T]) -> List[R]:
+        """Map a function over items with the thread pool."""
+        items = list(items)
+        if len(items) <= 1:
+            return [fn(item) for item in items]
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            return list(executor.map(fn, items))
+
+    def _put_object(self, obj_key: str, val: dict) -> None:
+        self._client.put_object(
+            Bucket=self._bucket.name,
+            Key=obj_key,
+            Body=json.dumps(val),
+        )
+
+    def _get_object(self, obj_key: str) -> Optional[dict]:
+        """Get an object with a single GET, or None if it does not exist."""
+        try:
+            obj = self._client.get_object(Bucket=self._bucket.name, Key=obj_key)
+        except self._client.exceptions.NoSuchKey:
+            return None
+        return json.loads(obj["Body"].read())
+
+    def _object_exists(self, obj_key: str) -> bool:
+        from botocore.exceptions import ClientError
+
+        try:
+            self._client.head_object(Bucket=self._bucket.name, Key=obj_key)
+        except ClientError as e:
+            if e.response["Error"]["Code"] in ("404", "NoSuchKey"):
+                return False
+            raise
+        return True
+
+    def _list_object_keys(self, collection: str) -> List[str]:
+        prefix = self._get_collection_prefix(collection)
+        return [obj.key for obj in self._bucket.objects.filter(Prefix=prefix)]
+
+    def _update_shards(
+        self, collection: str, updates: Dict[str, Dict[str, Optional[dict]]]
+    ) -> None:
+        """Apply updates (None deletes a key) to shards, one rewrite per shard."""
+
+        def update_shard(item: Tuple[str, Dict[str, Optional[dict]]]) -> None:
+            shard_key, shard_updates = item
+            shard = self._get_object(shard_key) or {}
+            changed = False
+            for key, val in shard_updates.items():
+                if val is not None:
+                    shard[key] = val
+                    changed = True
+                elif key in shard:
+                    del shard[key]
+                    changed = True
+            if changed:
+                self._put_object(shard_key, shard)
+
+        self._map(update_shard, updates.items())
+
+    def _group_by_shard(
+        self, collection: str, kv_pairs: Iterable[Tuple[str, Optional[dict]]]
+    ) -> Dict[str, Dict[str, Optional[dict]]]:
+        updates: Dict[str, Dict[str, Optional[dict]]] = defaultdict(dict)
+        for key, val in kv_pairs:
+            updates[self._get_shard_key(collection, key)][key] = val
+        return updates
+
     def put(
         self,
         key: str,
@@ -75,11 +195,10 @@ class S3DBKVStore(BaseKVStore):
             collection (str): collection name
 
         """
-        obj_key = self._get_object_key(collection, key)
-        self._bucket.put_object(
-            Key=obj_key,
-            Body=json.dumps(val),
-        )
+        if self._num_shards is not None:
+            self.put_all([(key, val)], collection=collection)
+            return
+        self._put_object(self._get_object_key(collection, key), val)
 
     def get(self, key: str, collection: str = DEFAULT_COLLECTION) -> Optional[dict]:
         """Get a value from the store.
@@ -89,29 +208,39 @@ class S3DBKVStore(BaseKVStore):
             collection (str): collection name
 
         """
-        obj_key = self._get_object_key(collection, key)
-        try:
-            obj = list(self._bucket.objects.filter(Prefix=obj_key).limit(1))[0]
-        except IndexError:
-            return None
-        body = obj.get()["Body"].read()
-        return json.loads(body)
+        if self._num_shards is not None:
+            shard = self._get_object(self._get_shard_key(collection, key)) or {}
+            return shard.get(key, None)
+        return self._get_object(self._get_object_key(collection, key))
 
     def get_all(self, collection: str = DEFAULT_COLLECTION) -> Dict[str, dict]:
         """Get all values from the store.
 
+        Lists the collection once, then downloads objects in parallel.
+
         Args:
             collection (str): collection name
 
         """
-        collection_path = str(PurePath(f"{self._path}/{collection}/"))
+        obj_keys = self._list_object_keys(collection)
+        if self._num_shards is not None:
+            # skip stray objects under the collection prefix
+            obj_keys = [
+                obj_key
+                for obj_key in obj_keys
+                if os.path.split(obj_key)[-1].startswith(SHARD_PREFIX)
+            ]
+        vals = self._map(self._get_object, obj_keys)
         collection_kv_dict = {}
-        for obj in self._bucket.objects.filter(Prefix=collection_path):
-            body = obj.get()["Body"].read()
-            json_filename = os.path.split(obj.key)[-1]
-            key = os.path.splitext(json_filename)[0]
-            value = json.loads(body)
-            collection_kv_dict[key] = value
+        for obj_key, val in zip(obj_keys, vals):
+            if val is None:
+                continue
+            if self._num_shards is not None:
+                collection_kv_dict.update(val)
+            else:
+                json_filename = os.path.split(obj_key)[-1]
+                key = os.path.splitext(json_filename)[0]
+                collection_kv_dict[key] = val
         return collection_kv_dict
 
     def delete(self, key: str, collection: str = DEFAULT_COLLECTION) -> bool:
@@ -122,10 +251,99 @@ class S3DBKVStore(BaseKVStore):
             collection (str): collection name
 
         """
+        if self._num_shards is not None:
+            shard_key = self._get_shard_key(collection, key)
+            shard = self._get_object(shard_key) or {}
+            if key not in shard:
+                return False
+            del shard[key]
+            self._put_object(shard_key, shard)
+            return True
+
         obj_key = self._get_object_key(collection, key)
-        matched_objs = list(self._bucket.objects.filter(Prefix=obj_key).limit(1))
-        if len(matched_objs) == 0:
+        if not self._object_exists(obj_key):
             return False
-        obj = matched_objs[0]
-        obj.delete()
+        self._client.delete_object(Bucket=self._bucket.name, Key=obj_key)
         return True
+
+    def put_all(
+        self,
+        kv_pairs: Sequence[Tuple[str, dict]],
+        collection: str = DEFAULT_COLLECTION,
+    ) -> None:
+        """Put key-value pairs into the store, in parallel.
+
+        With packed shards, every shard is rewritten once.
+
+        Args:
+            kv_pairs (Sequence[Tuple[str, dict]]): key-value pairs
+            collection (str): collection name
+
+        """
+        if self._num_shards is not None:
+            self._update_shards(collection, self._group_by_shard(collection, kv_pairs))
+            return
+        self._map(
+            lambda kv: self._put_object(self._get_object_key(collection, kv[0]), kv[1]),
+            dict(kv_pairs).items(),
+        )
+
+    def get_many(
+        self, keys: Sequence[str], collection: str = DEFAULT_COLLECTION
+    ) -> Dict[str, dict]:
+        """Get values of the given keys, in parallel.
+
+        With packed shards, every shard is downloaded once.
+
+        Args:
+            keys (Sequence[str]): keys
+            collection (str): collection name
+
+        """
+        unique_keys = list(dict.fromkeys(keys))
+        if self._num_shards is not None:
+            shard_keys = list(
+                dict.fromkeys(self._get_shard_key(collection, key) for key in keys)
+            )
+            shards = dict(zip(shard_keys, self._map(self._get_object, shard_keys)))
+            result = {}
+            for key in unique_keys:
+                shard = shards[self._get_shard_key(collection, key)] or {}
+                if key in shard:
+                    result[key] = shard[key]
+            return result
+
+        vals = self._map(
+            lambda key: self._get_object(self._get_object_key(collection, key)),
+            unique_keys,
+        )
+        return {key: val for key, val in zip(unique_keys, vals) if val is not None}
+
+    def delete_many(
+        self, keys: Sequence[str], collection: str = DEFAULT_COLLECTION
+    ) -> None:
+        """Delete values of the given keys with DeleteObjects requests.
+
+        Args:
+            keys (Sequence[str]): keys
+            collection (str): collection name
+
+        """
+        if self._num_shards is not None:
+            self._update_shards(
+                collection,
+                self._group_by_shard(collection, ((key, None) for key in keys)),
+            )
+            return
+
+        obj_keys = [self._get_object_key(collection, key) for key in keys]
+        for start in range(0, len(obj_keys), DELETE_OBJECTS_MAX_KEYS):
+            self._bucket.delete_objects(
+                Delete={
+                    "Objects": [
+                        {"Key": obj_key}
+                        for obj_key in obj_keys[start : start + DELETE_OBJECTS_MAX_KEYS]
+                    ],
+                    "Quiet": True,
+                }
+            )
@@ -1,11 +1,12 @@
 import json
 import logging
 import os
-from typing import Dict, Optional
+from typing import Dict, Optional, Sequence, Tuple
 
 import fsspec
 
 from llama_index.storage.kvstore.types import DEFAULT_COLLECTION, BaseInMemoryKVStore
+from llama_index.utils import atomic_write, is_same_path
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +16,10 @@ DATA_TYPE = Dict[str, Dict[str, dict]]
 class SimpleKVStore(BaseInMemoryKVStore):
     """Simple in-memory Key-Value store.
 
+    The store tracks whether it changed since it was loaded or last persisted,
+    and skips persisting an unchanged store to the same path again. In-place
+    changes to returned values are not tracked.
+
     Args:
         data (Optional[DATA_TYPE]): data to initialize the store with
     """
@@ -25,12 +30,15 @@ class SimpleKVStore(BaseInMemoryKVStore):
     ) -> None:
         """Init a SimpleKVStore."""
         self._data: DATA_TYPE = data or {}
+        # path the current data was loaded from or persisted to, if unchanged since
+        self._persist_path: Optional[str] = None
 
     def put(self, key: str, val: dict, collection: str = DEFAULT_COLLECTION) -> None:
         """Put a key-value pair into the store."""
         if collection not in self._data:
             self._data[collection] = {}
         self._data[collection][key] = val.copy()
+        self._persist_path = None
 
     def get(self, key: str, collection: str = DEFAULT_COLLECTION) -> Optional[dict]:
         """Get a value from the store."""
@@ -49,21 +57,57 @@ class SimpleKVStore(BaseInMemoryKVStore):
         """Delete a value from the store."""
         try:
             self._data[collection].pop(key)
+            self._persist_path = None
             return True
         except KeyError:
             return False
 
+    def put_all(
+        self,
+        kv_pairs: Sequence[Tuple[str, dict]],
+        collection: str = DEFAULT_COLLECTION,
+    ) -> None:
+        """Put key-value pairs into the store."""
+        collection_data = self._data.setdefault(collection, {})
+        collection_data.update((key, val.copy()) for key, val in kv_pairs)
+        self._persist_path = None
+
+    def get_many(
+        self, keys: Sequence[str], collection: str = DEFAULT_COLLECTION
+    ) -> Dict[str, dict]:
+        """Get values of the given keys, skipping keys not in the store."""
+        collection_data = self._data.get(collection, {})
+        return {
+            key: collection_data[key].copy() for key in keys if key in collection_data
+        }
+
+    def delete_many(
+        self, keys: Sequence[str], collection: str = DEFAULT_COLLECTION
+    ) -> None:
+        """Delete values of the given keys, skipping keys not in the store."""
+        collection_data = self._data.get(collection, {})
+        for key in keys:
+            if collection_data.pop(key, None) is not None:
+                self._persist_path = None
+
     def persist(
         self, persist_path: str, fs: Optional[fsspec.AbstractFileSystem] = None
     ) -> None:
-        """Persist the store."""
+        """Persist the store, unless unchanged since persisted to persist_path."""
         fs = fs or fsspec.filesystem("file")
+        if is_same_path(persist_path, self._persist_path, fs) and fs.exists(
+            persist_path
+        ):
+            logger.debug(f"Skipping persist of unchanged {__name__}.")
+            return
+
         dirpath = os.path.dirname(persist_path)
         if not fs.exists(dirpath):
             fs.makedirs(dirpath)
 
-        with fs.open(persist_path, "w") as f:
+        with atomic_write(persist_path, fs) as f:
             f.write(json.dumps(self._data))
+        self._persist_path = persist_path
 
     @classmethod
     def from_persist_path(
@@ -74,7 +118,9 @@ class SimpleKVStore(BaseInMemoryKVStore):
         logger.debug(f"Loading {__name__} from {persist_path}.")
         with fs.open(persist_path, "rb") as f:
             data = json.load(f)
-        return cls(data)
+        kvstore = cls(data)
+        kvstore._persist_path = persist_path
+        return kvstore
 
     def to_dict(self) -> dict:
         """Save the store as dict."""
@@ -0,0 +1,169 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import fsspec
+
+from llama_index.storage.kvstore.types import DEFAULT_COLLECTION, BaseKVStore
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_FNAME = "kvstore.db"
+# max number of keys per `IN (...)` query, below the default SQLite variable limit
+SQLITE_MAX_KEYS = 500
+
+
+class SQLiteKVStore(BaseKVStore):
+    """SQLite Key-Value store.
+
+    A local persistent store that needs no external service. Values are stored
+    as JSON rows keyed by (collection, key), so reads only load the requested
+    keys, and every write only touches the rows it changes: there is no full
+    rewrite of the store on persist.
+
+    Use `from_json_persist_path` to migrate a persisted `SimpleKVStore` (e.g. a
+    `docstore.json` or `index_store.json` file).
+
+    Args:
+        db_path (str): path to the SQLite database file,
+            or ":memory:" for an in-memory database.
+
+    """
+
+    def __init__(self, db_path: str = DEFAULT_DB_FNAME) -> None:
+        """Init a SQLiteKVStore."""
+        if db_path != ":memory:":
+            dirpath = os.path.dirname(db_path)
+            if dirpath and not os.path.exists(dirpath):
+                os.makedirs(dirpath)
+        self._db_path = db_path
+        # NOTE: the connection is shared across threads (e.g. by the async
+        # thread pool fallback), and serialized by a lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        with self._lock, self._conn:
+            if db_path != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS kvstore ("
+                "collection TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, "
+                "PRIMARY KEY (collection, key))"
+            )
+
+    @property
+    def db_path(self) -> str:
+        """Get the database path."""
+        return self._db_path
+
+    def put(self, key: str, val: dict, collection: str = DEFAULT_COLLECTION) -> None:
+        """Put a key-value pair into the store."""
+        self.put_all([(key, val)], collection=collection)
+
+    def get(self, key: str, collection: str = DEFAULT_COLLECTION) -> Optional[dict]:
+        """Get a value from the store."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM kvstore WHERE collection = ? AND key = ?",
+                (collection, key),
+            ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0])
+
+    def get_all(self, collection: str = DEFAULT_COLLECTION) -> Dict[str, dict]:
+        """Get all values from the store."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key, value FROM kvstore WHERE collection = ?", (collection,)
+            ).fetchall()
+        return {key: json.loads(value) for key, value in rows}
+
+    def delete(self, key: str, collection: str = DEFAULT_COLLECTION) -> bool:
+        """Delete a value from the store."""
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM kvstore WHERE collection = ? AND key = ?",
+                (collection, key),
+            )
+        return cursor.rowcount > 0
+
+    def put_all(
+        self,
+        kv_pairs: Sequence[Tuple[str, dict]],
+        collection: str = DEFAULT_COLLECTION,
+    ) -> None:
+        """Put key-value pairs into the store, in a single transaction."""
+        rows = [(collection, key, json.dumps(val)) for key, val in kv_pairs]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO kvstore (collection, key, value) "
+                "VALUES (?, ?, ?)",
+                rows,
+            )
+
+    def get_many(
+        self, keys: Sequence[str], collection: str = DEFAULT_COLLECTION
+    ) -> Dict[str, dict]:
+        """Get values of the given keys, skipping keys not in the store."""
+        unique_keys = list(dict.fromkeys(keys))
+        rows: List[Tuple[str, str]] = []
+        with self._lock:
+            for start in range(0, len(unique_keys), SQLITE_MAX_KEYS):
+                batch = unique_keys[start : start + SQLITE_MAX_KEYS]
+                placeholders = ", ".join("?" * len(batch))
+                rows.extend(
+                    self._conn.execute(
+                        "SELECT key, value FROM kvstore "
+                        f"WHERE collection = ? AND key IN ({placeholders})",
+                        (collection, *batch),
+                    ).fetchall()
+                )
+        return {key: json.loads(value) for key, value in rows}
+
+    def delete_many(
+        self, keys: Sequence[str], collection: str = DEFAULT_COLLECTION
+    ) -> None:
+        """Delete values of the given keys, in a single transaction."""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "DELETE FROM kvstore WHERE collection = ? AND key = ?",
+                [(collection, key) for key in keys],
+            )
+
+    def compact(self) -> None:
+        """Reclaim the space of deleted and overwritten values."""
+        with self._lock:
+            self._conn.execute("VACUUM")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    @classmethod
+    def from_json_persist_path(
+        cls,
+        persist_path: str,
+        db_path: str = DEFAULT_DB_FNAME,
+        fs: Optional[fsspec.AbstractFileSystem] = None,
+    ) -> "SQLiteKVStore":
+        """Migrate a persisted SimpleKVStore JSON file into a SQLiteKVStore.
+
+        Args:
+            persist_path (str): path of the JSON file written by `SimpleKVStore`
+            db_path (str): path to the SQLite database file to write to
+            fs (Optional[fsspec.AbstractFileSystem]): filesystem of persist_path
+
+        """
+        fs = fs or fsspec.filesystem("file")
+        logger.debug(f"Migrating {persist_path} to {db_path}.")
+        with fs.open(persist_path, "rb") as f:
+            data: Dict[str, Dict[str, dict]] = json.load(f)
+
+        kvstore = cls(db_path)
+        for collection, collection_data in data.items():
+            kvstore.put_all(list(collection_data.items()), collection=collection)
+        return kvstore
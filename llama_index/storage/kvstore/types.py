@@ -1,9 +1,21 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict, Optional
+from functools import partial
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, TypeVar
+
 import fsspec
 
 DEFAULT_COLLECTION = "data"
 
+T = TypeVar("T")
+
+
+async def run_in_thread(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking function in the default thread pool executor."""
+    return await asyncio.get_running_loop().run_in_executor(
+        None, partial(fn, *args, **kwargs)
+    )
+
 
 class BaseKVStore(ABC):
     """Base key-value store."""
@@ -24,10 +36,122 @@ class BaseKVStore(ABC):
     def delete(self, key: str, collection: str = DEFAULT_COLLECTION) -> bool:
         pass
 
+    def put_all(
+        self,
+        kv_pairs: Sequence[Tuple[str, dict]],
+        collection: str = DEFAULT_COLLECTION,
+    ) -> None:
+        """Put key-value pairs into the store.
+
+        By default, this puts pairs one by one.
+        Meant to be overriden by stores with a bulk write API.
+
+        """
+        for key, val in kv_pairs:
+            self.put(key, val, collection=collection)
+
+    def get_many(
+        self, keys: Sequence[str], collection: str = DEFAULT_COLLECTION
+    ) -> Dict[str, dict]:
+        """Get values of the given keys, skipping keys not in the store.
+
+        By default, this gets keys one by one.
+        Meant to be overriden by stores with a bulk read API.
+
+        """
+        result = {}
+        for key in keys:
+            val = self.get(key, collection=collection)
+            if val is not None:
+                result[key] = val
+        return result
+
+    def delete_many(
+        self, keys: Sequence[str], collection: str = DEFAULT_COLLECTION
+    ) -> None:
+        """Delete values of the given keys, skipping keys not in the store.
+
+        By default, this deletes keys one by one.
+        Meant to be overriden by stores with a bulk delete API.
+
+        """
+        for key in keys:
+            self.delete(key, collection=collection)
+
+    # ===== Async interface =====
+    # NOTE: by default, async methods run their sync counterpart in a thread.
+    # Stores with an async driver should override them.
+    async def aput(
+        self, key: str, val: dict, collection: str = DEFAULT_COLLECTION
+    ) -> None:
+        await run_in_thread(self.put, key, val, collection=collection)
+
+    async def aget(
+        self, key: str, collection: str = DEFAULT_COLLECTION
+    ) -> Optional[dict]:
+        return await run_in_thread(self.get, key, collection=collection)
+
+    async def aget_all(self, collection: str = DEFAULT_COLLECTION) -> Dict[str, dict]:
+        return await run_in_thread(self.get_all, collection=collection)
+
+    async def adelete(self, key: str, collection: str = DEFAULT_COLLECTION) -> bool:
+        return await run_in_thread(self.delete, key, collection=collection)
+
+    async def aput_all(
+        self,
+        kv_pairs: Sequence[Tuple[str, dict]],
+        collection: str = DEFAULT_COLLECTION,
+    ) -> None:
+        await run_in_thread(self.put_all, kv_pairs, collection=collection)
+
+    async def aget_many(
+        self, keys: Sequence[str], collection: str = DEFAULT_COLLECTION
+    ) -> Dict[str, dict]:
+        return await run_in_thread(self.get_many, keys, collection=collection)
+
+    async def adelete_many(
+        self, keys: Sequence[str], collection: str = DEFAULT_COLLECTION
+    ) -> None:
+        await run_in_thread(self.delete_many, keys, collection=collection)
+
 
 class BaseInMemoryKVStore(BaseKVStore):
     """Base in-memory key-value store."""
 
+    # NOTE: in-memory operations do not block, so async methods run inline
+    async def aput(
+        self, key: str, val: dict, collection: str = DEFAULT_COLLECTION
+    ) -> None:
+        self.put(key, val, collection=collection)
+
+    async def aget(
+        self, key: str, collection: str = DEFAULT_COLLECTION
+    ) -> Optional[dict]:
+        return self.get(key, collection=collection)
+
+    async def aget_all(self, collection: str = DEFAULT_COLLECTION) -> Dict[str, dict]:
+        return self.get_all(collection=collection)
+
+    async def adelete(self, key: str, collection: str = DEFAULT_COLLECTION) -> bool:
+        return self.delete(key, collection=collection)
+
+    async def aput_all(
+        self,
+        kv_pairs: Sequence[Tuple[str, dict]],
+        collection: str = DEFAULT_COLLECTION,
+    ) -> None:
+        self.put_all(kv_pairs, collection=collection)
+
+    async def aget_many(
+        self, keys: Sequence[str], collection: str = DEFAULT_COLLECTION
+    ) -> Dict[str, dict]:
+        return self.get_many(keys, collection=collection)
+
+    async def adelete_many(
+        self, keys: Sequence[str], collection: str = DEFAULT_COLLECTION
+    ) -> None:
+        self.delete_many(keys, collection=collection)
+
     @abstractmethod
     def persist(
         self, persist_path: str, fs: Optional[fsspec.AbstractFileSystem] = None
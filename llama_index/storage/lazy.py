@@ -0,0 +1,112 @@
+"""Lazy loading of storage components."""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Type
+
+import fsspec
+
+from llama_index.utils import is_same_path
+
+logger = logging.getLogger(__name__)
+
+
+class LazyStore:
+    """Proxy loading a storage component on first access.
+
+    Attribute access is forwarded to the component, which is loaded by
+    `loader` the first time it is needed. `isinstance` checks against
+    `store_cls` pass without loading the component.
+
+    Persisting a component that was never loaded back to the path it would be
+    loaded from is a no-op, since it cannot have changed.
+
+    Args:
+        name (str): name of the component, e.g. "docstore"
+        store_cls (Type): class of the loaded component
+        loader (Callable[[], Any]): function loading the component
+        persist_path (Optional[str]): path the component is loaded from
+        load_timings (Optional[Dict[str, float]]): dict to record the load time
+            (in seconds) of the component in, under `name`
+
+    """
+
+    def __init__(
+        self,
+        name: str,
+        store_cls: Type,
+        loader: Callable[[], Any],
+        persist_path: Optional[str] = None,
+        load_timings: Optional[Dict[str, float]] = None,
+    ) -> None:
+        """Init params."""
+        # NOTE: set through __dict__, as __getattr__ forwards to the component
+        self.__dict__.update(
+            _name=name,
+            _store_cls=store_cls,
+            _loader=loader,
+            _persist_path=persist_path,
+            _load_timings=load_timings if load_timings is not None else {},
+            _store=None,
+            _lock=threading.Lock(),
+        )
+
+    @property  # type: ignore
+    def __class__(self) -> Type:
+        return self._store_cls
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the component has been loaded."""
+        return self._store is not None
+
+    def load(self) -> Any:
+        """Load the component, if not loaded yet, and return it."""
+        if self._store is None:
+            with self._lock:
+                if self._store is None:
+                    start = time.perf_counter()
+                    store = self._loader()
+                    self._load_timings[self._name] = time.perf_counter() - start
+                    logger.info(
+                        f"> Loaded {self._name} in "
+                        f"{self._load_timings[self._name]:.3f} seconds"
+                    )
+                    self.__dict__["_store"] = store
+        return self._store
+
+    def _is_load_path(
+        self, persist_path: Optional[str], fs: Optional[fsspec.AbstractFileSystem]
+    ) -> bool:
+        """Whether persist_path is the path the component is loaded from."""
+        if persist_path is None:
+            return self._persist_path is None
+        return is_same_path(
+            persist_path, self._persist_path, fs or fsspec.filesystem("file")
+        )
+
+    def persist(
+        self,
+        persist_path: Optional[str] = None,
+        fs: Optional[fsspec.AbstractFileSystem] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Persist the component, unless unchanged since it was loaded."""
+        if not self.is_loaded and self._is_load_path(persist_path, fs):
+            return
+        if persist_path is None:
+            self.load().persist(fs=fs, **kwargs)
+        else:
+            self.load().persist(persist_path=persist_path, fs=fs, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.load(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self.load(), name, value)
+
+    def __repr__(self) -> str:
+        if self._store is None:
+            return f"LazyStore({self._name}, not loaded)"
+        return repr(self._store)
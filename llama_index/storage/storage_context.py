@@ -1,6 +1,6 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Dict, Optional, Sequence, Type, cast
 
 import fsspec
 
@@ -21,12 +21,14 @@ from llama_index.storage.index_store.types import (
     DEFAULT_PERSIST_FNAME as INDEX_STORE_FNAME,
 )
 from llama_index.storage.index_store.types import BaseIndexStore
+from llama_index.storage.lazy import LazyStore
 from llama_index.vector_stores.simple import DEFAULT_PERSIST_FNAME as VECTOR_STORE_FNAME
 from llama_index.vector_stores.simple import SimpleVectorStore
 from llama_index.vector_stores.types import VectorStore
 from llama_index.utils import concat_dirs
 
 DEFAULT_PERSIST_DIR = "./storage"
+STORAGE_COMPONENTS = ("docstore", "index_store", "vector_store", "graph_store")
 
 
 @dataclass
@@ -40,12 +42,17 @@ class StorageContext:
     - vector_store: VectorStore
     - graph_store: GraphStore
 
+    Components loaded from a persist dir with `lazy=True` are only loaded on
+    first access. Load times (in seconds) of components loaded from a persist dir
+    are recorded in `load_timings`.
+
     """
 
     docstore: BaseDocumentStore
     index_store: BaseIndexStore
     vector_store: VectorStore
     graph_store: GraphStore
+    load_timings: Dict[str, float] = field(default_factory=dict, compare=False)
 
     @classmethod
     def from_defaults(
@@ -56,6 +63,7 @@ class StorageContext:
         graph_store: Optional[GraphStore] = None,
         persist_dir: Optional[str] = None,
         fs: Optional[fsspec.AbstractFileSystem] = None,
+        lazy: bool = False,
     ) -> "StorageContext":
         """Create a StorageContext from defaults.
 
@@ -64,28 +72,84 @@ class StorageContext:
             index_store (Optional[BaseIndexStore]): index store
             vector_store (Optional[VectorStore]): vector store
             graph_store (Optional[GraphStore]): graph store
+            persist_dir (Optional[str]): directory to load missing stores from
+            fs (Optional[fsspec.AbstractFileSystem]): filesystem of persist_dir
+            lazy (bool): only load stores from persist_dir on first access
 
         """
+        load_timings: Dict[str, float] = {}
         if persist_dir is None:
             docstore = docstore or SimpleDocumentStore()
             index_store = index_store or SimpleIndexStore()
             vector_store = vector_store or SimpleVectorStore()
             graph_store = graph_store or SimpleGraphStore()
         else:
-            docstore = docstore or SimpleDocumentStore.from_persist_dir(
-                persist_dir, fs=fs
+            load_dir = persist_dir
+
+            def load(
+                name: str, store_cls: Type, fname: str, loader: Callable[[], Any]
+            ) -> Any:
+                if fs is not None:
+                    persist_path = concat_dirs(load_dir, fname)
+                else:
+                    persist_path = str(Path(load_dir) / fname)
+                lazy_store = LazyStore(
+                    name,
+                    store_cls,
+                    loader,
+                    persist_path=persist_path,
+                    load_timings=load_timings,
+                )
+                return lazy_store if lazy else lazy_store.load()
+
+            docstore = docstore or load(
+                "docstore",
+                SimpleDocumentStore,
+                DOCSTORE_FNAME,
+                lambda: SimpleDocumentStore.from_persist_dir(load_dir, fs=fs),
             )
-            index_store = index_store or SimpleIndexStore.from_persist_dir(
-                persist_dir, fs=fs
+            index_store = index_store or load(
+                "index_store",
+                SimpleIndexStore,
+                INDEX_STORE_FNAME,
+                lambda: SimpleIndexStore.from_persist_dir(load_dir, fs=fs),
             )
-            vector_store = vector_store or SimpleVectorStore.from_persist_dir(
-                persist_dir, fs=fs
+            vector_store = vector_store or load(
+                "vector_store",
+                SimpleVectorStore,
+                VECTOR_STORE_FNAME,
+                lambda: SimpleVectorStore.from_persist_dir(load_dir, fs=fs),
             )
-            graph_store = graph_store or SimpleGraphStore.from_persist_dir(
-                persist_dir, fs=fs
+            graph_store = graph_store or load(
+                "graph_store",
+                SimpleGraphStore,
+                GRAPH_STORE_FNAME,
+                lambda: SimpleGraphStore.from_persist_dir(load_dir, fs=fs),
             )
 
-        return cls(docstore, index_store, vector_store, graph_store)
+        return cls(
+            docstore=cast(BaseDocumentStore, docstore),
+            index_store=cast(BaseIndexStore, index_store),
+            vector_store=cast(VectorStore, vector_store),
+            graph_store=cast(GraphStore, graph_store),
+            load_timings=load_timings,
+        )
+
+    def warm_up(self, components: Optional[Sequence[str]] = None) -> None:
+        """Load lazily loaded components ahead of their first access.
+
+        Args:
+            components (Optional[Sequence[str]]): names of the components to load,
+                among "docstore", "index_store", "vector_store" and "graph_store".
+                Defaults to all components.
+
+        """
+        for name in components or STORAGE_COMPONENTS:
+            if name not in STORAGE_COMPONENTS:
+                raise ValueError(f"Unknown storage component: {name}")
+            store = getattr(self, name)
+            if type(store) is LazyStore:
+                store.load()
 
     def persist(
         self,
@@ -0,0 +1,166 @@
+"""Memoized token counting.
+
+The same strings get tokenized over and over purely to count their tokens:
+e.g. a formatted prompt is counted by the LLM predictor and again by a
+`TokenCountingHandler`, and the empty prompt template is re-counted on every
+`PromptHelper.truncate`/`repack` call. `TokenCountCache` memoizes these counts.
+
+"""
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from llama_index.prompts.base import Prompt
+from llama_index.prompts.utils import get_empty_prompt_txt
+from llama_index.utils import globals_helper
+
+DEFAULT_TOKEN_COUNT_CACHE_SIZE = 10000
+
+Tokenizer = Callable[[str], List]
+
+
+def get_tiktoken_encoding(tokenizer: Callable) -> Optional[Any]:
+    """Get the tiktoken encoding of a tokenizer, if it is a tiktoken `encode`."""
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    encoding = getattr(tokenizer, "__self__", None)
+    if isinstance(encoding, tiktoken.Encoding) and tokenizer.__name__ == "encode":
+        return encoding
+    return None
+
+
+def _get_count_fn(tokenizer: Tokenizer) -> Callable[[str], int]:
+    """Get a function counting the tokens of a text, without caching."""
+    encoding = get_tiktoken_encoding(tokenizer)
+    if encoding is None:
+        return lambda text: len(tokenizer(text))
+
+    encode, encode_ordinary = encoding.encode, encoding.encode_ordinary
+    special_tokens = tuple(encoding.special_tokens_set)
+
+    def count_fn(text: str) -> int:
+        # NOTE: `encode` checks the text for special tokens on every call, which
+        # dominates the cost for short texts. Without special tokens, the result
+        # is the same as `encode_ordinary`.
+        if any(token in text for token in special_tokens):
+            return len(encode(text))
+        return len(encode_ordinary(text))
+
+    return count_fn
+
+
+class TokenCountCache:
+    """Bounded LRU cache of token counts.
+
+    Counts are keyed by the tokenizer and the hash (and length) of the text, so
+    that the cache does not hold on to the counted texts. The tokenizer is part
+    of the key, so tokenizers can share one cache.
+
+    Token counts of empty prompt templates (see `get_empty_prompt_txt`) are
+    additionally cached per prompt instance, since prompts are not changed after
+    creation (`Prompt.partial_format` returns a new prompt).
+
+    Args:
+        max_size (int): maximum number of cached token counts.
+
+    """
+
+    def __init__(self, max_size: int = DEFAULT_TOKEN_COUNT_CACHE_SIZE) -> None:
+        """Init params."""
+        if max_size <= 0:
+            raise ValueError("max_size must be positive.")
+        self._max_size = max_size
+        self._counts: "OrderedDict[Tuple[Tokenizer, int, int], int]" = OrderedDict()
+        self._count_fns: Dict[Tokenizer, Callable[[str], int]] = {}
+        self._empty_prompt_counts: "weakref.WeakKeyDictionary[Prompt, Dict]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Get the number of cached token counts."""
+        return len(self._counts)
+
+    def count_tokens(self, text: str, tokenizer: Optional[Tokenizer] = None) -> int:
+        """Count the tokens of text.
+
+        Args:
+            text (str): text to count the tokens of.
+            tokenizer (Optional[Callable[[str], List]]): tokenizer to count the
+                tokens with. Defaults to the global tokenizer.
+
+        """
+        tokenizer = tokenizer or globals_helper.tokenizer
+        try:
+            key = (tokenizer, hash(text), len(text))
+            hash(key)
+        except TypeError:
+            # unhashable tokenizer
+            return len(tokenizer(text))
+        with self._lock:
+            num_tokens = self._counts.get(key, None)
+            if num_tokens is not None:
+                self._counts.move_to_end(key)
+                self.hits += 1
+                return num_tokens
+            count_fn = self._count_fns.get(tokenizer, None)
+
+        if count_fn is None:
+            count_fn = _get_count_fn(tokenizer)
+        num_tokens = count_fn(text)
+
+        with self._lock:
+            self.misses += 1
+            self._count_fns[tokenizer] = count_fn
+            self._counts[key] = num_tokens
+            if len(self._counts) > self._max_size:
+                self._counts.popitem(last=False)
+        return num_tokens
+
+    def get_empty_prompt_num_tokens(
+        self, prompt: Prompt, tokenizer: Optional[Tokenizer] = None
+    ) -> int:
+        """Count the tokens of the empty prompt text of a prompt.
+
+        Args:
+            prompt (Prompt): prompt, with unfilled variables substituted with
+                empty strings (see `get_empty_prompt_txt`).
+            tokenizer (Optional[Callable[[str], List]]): tokenizer to count the
+                tokens with. Defaults to the global tokenizer.
+
+        """
+        tokenizer = tokenizer or globals_helper.tokenizer
+        try:
+            with self._lock:
+                prompt_counts = self._empty_prompt_counts.setdefault(prompt, {})
+                num_tokens = prompt_counts.get(tokenizer, None)
+        except TypeError:
+            # unhashable tokenizer
+            return self.count_tokens(get_empty_prompt_txt(prompt), tokenizer)
+        if num_tokens is None:
+            num_tokens = self.count_tokens(get_empty_prompt_txt(prompt), tokenizer)
+            with self._lock:
+                prompt_counts[tokenizer] = num_tokens
+        return num_tokens
+
+    def clear(self) -> None:
+        """Clear the cache."""
+        with self._lock:
+            self._counts.clear()
+            self._count_fns.clear()
+            self._empty_prompt_counts.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+token_count_cache = TokenCountCache()
+
+
+def count_tokens(text: str, tokenizer: Optional[Tokenizer] = None) -> int:
+    """Count the tokens of text, using the global token count cache."""
+    return token_count_cache.count_tokens(text, tokenizer)
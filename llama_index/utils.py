@@ -1,5 +1,6 @@
 """General utils functions."""
 
+import asyncio
 import random
 import sys
 import time
@@ -10,6 +11,7 @@ from dataclasses import dataclass
 from itertools import islice
 from typing import (
     Any,
+    Awaitable,
     Callable,
     Generator,
     List,
@@ -22,6 +24,8 @@ from typing import (
 )
 import os
 
+import fsspec
+
 
 class GlobalsHelper:
     """Helper to retrieve globals.
@@ -189,6 +193,46 @@ def retry_on_exceptions_with_backoff(
             backoff_secs = min(backoff_secs * 2, max_backoff_secs)
 
 
+async def aretry_on_exceptions_with_backoff(
+    async_fn: Callable[[], Awaitable[Any]],
+    errors_to_retry: List[ErrorToRetry],
+    max_tries: int = 10,
+    min_backoff_secs: float = 0.5,
+    max_backoff_secs: float = 60.0,
+) -> Any:
+    """Await async function with retries and exponential backoff.
+
+    Async version of `retry_on_exceptions_with_backoff`: waiting between
+    attempts does not block the event loop.
+
+    """
+    if not errors_to_retry:
+        raise ValueError("At least one error to retry needs to be provided")
+
+    error_checks = {
+        error_to_retry.exception_cls: error_to_retry.check_fn
+        for error_to_retry in errors_to_retry
+    }
+    exception_class_tuples = tuple(error_checks.keys())
+
+    backoff_secs = min_backoff_secs
+    tries = 0
+
+    while True:
+        try:
+            return await async_fn()
+        except exception_class_tuples as e:
+            traceback.print_exc()
+            tries += 1
+            if tries >= max_tries:
+                raise
+            check_fn = error_checks.get(e.__class__)
+            if check_fn and not check_fn(e):
+                raise
+            await asyncio.sleep(backoff_secs)
+            backoff_secs = min(backoff_secs * 2, max_backoff_secs)
+
+
 def truncate_text(text: str, max_length: int) -> str:
     """Truncate text to a maximum length."""
     return text[: max_length - 3] + "..."
@@ -216,3 +260,45 @@ def concat_dirs(dir1: str, dir2: str) -> str:
     """
     dir1 += "/" if dir1[-1] != "/" else ""
     return os.path.join(dir1, dir2)
+
+
+def is_same_path(
+    path: str, other_path: Optional[str], fs: fsspec.AbstractFileSystem
+) -> bool:
+    """Check whether two paths of fs point to the same file.
+
+    Paths are compared once normalized, e.g. `./storage/docstore.json` and
+    `storage/docstore.json` are the same path on a local filesystem.
+
+    """
+    if other_path is None:
+        return False
+    return os.path.normpath(fs._strip_protocol(path)) == os.path.normpath(
+        fs._strip_protocol(other_path)
+    )
+
+
+@contextmanager
+def atomic_write(
+    path: str, fs: fsspec.AbstractFileSystem, mode: str = "w"
+) -> Generator[Any, None, None]:
+    """
+    Open `path` for writing through a temporary file, moved over `path` once
+    fully written, so that an interrupted write never leaves a torn file.
+    The move is an atomic rename on local filesystems.
+
+    Args:
+        path (str): path of the file to write
+        fs (fsspec.AbstractFileSystem): filesystem of path
+        mode (str): "w" or "wb"
+    """
+    # NOTE: unique temp file, in the same directory so that the move is a rename
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    try:
+        with fs.open(tmp_path, mode) as f:
+            yield f
+    except BaseException:
+        if fs.exists(tmp_path):
+            fs.rm(tmp_path)
+        raise
+    fs.mv(tmp_path, path)
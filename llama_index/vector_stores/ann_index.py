@@ -0,0 +1,321 @@
+"""Approximate nearest neighbour indices for the simple vector store.
+
+These indices work on the rows of an EmbeddingMatrix: they never store
+embeddings themselves, they only narrow a query down to a set of candidate
+rows, which are then scored exactly by the matrix.
+
+"""
+
+import math
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional, Type
+
+import numpy as np
+
+DEFAULT_NPROBE = 8
+DEFAULT_MIN_TRAIN_SIZE = 10000
+DEFAULT_MAX_TRAIN_SIZE = 100000
+DEFAULT_NUM_ITERS = 20
+# rows are assigned to centroids in chunks to bound the size of the score matrix
+ASSIGN_CHUNK_SIZE = 65536
+# rebuild the inverted lists once this fraction of rows was added after the build
+MAX_PENDING_FRACTION = 0.1
+MIN_PENDING_TO_REBUILD = 1024
+
+
+def _normalize(embeddings: np.ndarray) -> np.ndarray:
+    """L2-normalize rows, leaving zero rows untouched."""
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    return np.divide(embeddings, norms, out=np.zeros_like(embeddings), where=norms > 0)
+
+
+def _assign(embeddings: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """Assign every row to the centroid with the highest cosine similarity."""
+    assignments = np.empty(embeddings.shape[0], dtype=np.int32)
+    for start in range(0, embeddings.shape[0], ASSIGN_CHUNK_SIZE):
+        chunk = _normalize(
+            np.asarray(embeddings[start : start + ASSIGN_CHUNK_SIZE], np.float32)
+        )
+        assignments[start : start + len(chunk)] = np.argmax(chunk @ centroids.T, axis=1)
+    return assignments
+
+
+def spherical_kmeans(
+    embeddings: np.ndarray,
+    num_clusters: int,
+    num_iters: int = DEFAULT_NUM_ITERS,
+    seed: int = 0,
+) -> np.ndarray:
+    """Cluster L2-normalized embeddings with k-means on the unit sphere.
+
+    Returns:
+        np.ndarray: (num_clusters, dim) matrix of unit-norm centroids.
+
+    """
+    rng = np.random.default_rng(seed)
+    points = _normalize(np.asarray(embeddings, dtype=np.float32))
+    num_clusters = min(num_clusters, len(points))
+    centroids = points[rng.choice(len(points), num_clusters, replace=False)]
+
+    for _ in range(num_iters):
+        assignments = np.argmax(points @ centroids.T, axis=1)
+        order = np.argsort(assignments, kind="stable")
+        clusters, starts = np.unique(assignments[order], return_index=True)
+        sums = np.add.reduceat(points[order], starts, axis=0)
+
+        new_centroids = centroids.copy()
+        new_centroids[clusters] = _normalize(sums)
+        # re-seed empty clusters with random points
+        empty = np.setdiff1d(np.arange(num_clusters), clusters)
+        if len(empty) > 0:
+            new_centroids[empty] = points[rng.choice(len(points), len(empty))]
+        if np.allclose(new_centroids, centroids):
+            break
+        centroids = new_centroids
+
+    return centroids.astype(np.float32)
+
+
+class BaseANNIndex(ABC):
+    """Base class for approximate nearest neighbour indices over matrix rows."""
+
+    index_type: str
+
+    @property
+    @abstractmethod
+    def is_trained(self) -> bool:
+        """Whether the index can be used for queries."""
+
+    @abstractmethod
+    def train(self, embeddings: np.ndarray, alive: np.ndarray) -> None:
+        """(Re)build the index over all used rows of the matrix."""
+
+    @abstractmethod
+    def add(self, rows: np.ndarray, embeddings: np.ndarray) -> None:
+        """Index (or re-index) the given rows."""
+
+    @abstractmethod
+    def compact(self, live_rows: np.ndarray) -> None:
+        """Remap rows after the matrix dropped its tombstones."""
+
+    @abstractmethod
+    def candidates(self, query_embedding: np.ndarray, **kwargs: Any) -> np.ndarray:
+        """Get candidate rows for a query."""
+
+    def should_train(self, num_embeddings: int) -> bool:
+        """Whether the store should train the index before the next query."""
+        return False
+
+    @abstractmethod
+    def get_params(self) -> Dict[str, Any]:
+        """Get constructor params."""
+
+    @abstractmethod
+    def to_arrays(self, rows: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+        """Get index state, restricted to (and renumbered over) `rows` if given."""
+
+    @classmethod
+    def from_arrays(
+        cls, params: Dict[str, Any], arrays: Dict[str, np.ndarray]
+    ) -> "BaseANNIndex":
+        """Load index from params and state arrays."""
+        index = cls(**params)
+        index.load_arrays(arrays)
+        return index
+
+    @abstractmethod
+    def load_arrays(self, arrays: Dict[str, np.ndarray]) -> None:
+        """Load index state."""
+
+
+class IVFIndex(BaseANNIndex):
+    """Inverted file index.
+
+    Embeddings are clustered with spherical k-means (the coarse quantizer), and
+    every row is put in the inverted list of its nearest centroid. A query only
+    scores the rows of the `nprobe` lists whose centroids are closest to it, so
+    `nprobe` trades recall for latency.
+
+    The index is trained lazily on the first query once the store holds
+    `min_train_size` embeddings; smaller stores use exact search. New rows are
+    assigned to the existing centroids; call `train` again (e.g. through
+    `SimpleVectorStore.train_ann_index`) after the data distribution changed.
+
+    Args:
+        nlist (Optional[int]): number of clusters. Defaults to 4 * sqrt(N).
+        nprobe (int): number of clusters to search per query. Can be overridden
+            per query by passing `nprobe` to `SimpleVectorStore.query`.
+        min_train_size (int): number of embeddings from which to train.
+        max_train_size (int): max number of embeddings sampled for training.
+        num_iters (int): number of k-means iterations.
+        seed (int): random seed for training.
+
+    """
+
+    index_type = "ivf"
+
+    def __init__(
+        self,
+        nlist: Optional[int] = None,
+        nprobe: int = DEFAULT_NPROBE,
+        min_train_size: int = DEFAULT_MIN_TRAIN_SIZE,
+        max_train_size: int = DEFAULT_MAX_TRAIN_SIZE,
+        num_iters: int = DEFAULT_NUM_ITERS,
+        seed: int = 0,
+    ) -> None:
+        """Init params."""
+        if nprobe <= 0:
+            raise ValueError("nprobe must be > 0")
+        self._nlist = nlist
+        self._nprobe = nprobe
+        self._min_train_size = min_train_size
+        self._max_train_size = max_train_size
+        self._num_iters = num_iters
+        self._seed = seed
+
+        self._centroids: Optional[np.ndarray] = None
+        # centroid of every matrix row (-1 if not assigned), over-allocated
+        self._assignments = np.zeros(0, dtype=np.int32)
+        self._num_rows = 0
+        # inverted lists in CSR form over rows [0, self._num_indexed)
+        self._list_rows = np.zeros(0, dtype=np.int64)
+        self._list_offsets = np.zeros(1, dtype=np.int64)
+        self._num_indexed = 0
+        self._lists_dirty = False
+
+    @property
+    def is_trained(self) -> bool:
+        """Whether the coarse quantizer has been trained."""
+        return self._centroids is not None
+
+    @property
+    def nprobe(self) -> int:
+        """Get default number of lists to probe."""
+        return self._nprobe
+
+    def should_train(self, num_embeddings: int) -> bool:
+        """Train once there are enough embeddings."""
+        return not self.is_trained and num_embeddings >= self._min_train_size
+
+    def train(self, embeddings: np.ndarray, alive: np.ndarray) -> None:
+        """Train the coarse quantizer and assign every row."""
+        live_rows = np.flatnonzero(alive)
+        if len(live_rows) == 0:
+            return
+        nlist = self._nlist or max(1, int(4 * math.sqrt(len(live_rows))))
+        rng = np.random.default_rng(self._seed)
+        if len(live_rows) > self._max_train_size:
+            sample = np.sort(rng.choice(live_rows, self._max_train_size, False))
+        else:
+            sample = live_rows
+        self._centroids = spherical_kmeans(
+            embeddings[sample], nlist, num_iters=self._num_iters, seed=self._seed
+        )
+        self._assignments = _assign(embeddings, self._centroids)
+        self._num_rows = len(self._assignments)
+        self._rebuild_lists()
+
+    def add(self, rows: np.ndarray, embeddings: np.ndarray) -> None:
+        """Assign new (or overwritten) rows to their nearest centroid."""
+        if len(rows) == 0:
+            return
+        num_rows = int(rows.max()) + 1
+        self._num_rows = max(self._num_rows, num_rows)
+        if num_rows > len(self._assignments):
+            assignments = np.full(
+                max(num_rows, 2 * len(self._assignments)), -1, dtype=np.int32
+            )
+            assignments[: len(self._assignments)] = self._assignments
+            self._assignments = assignments
+        if self._centroids is None:
+            return
+        self._assignments[rows] = _assign(embeddings, self._centroids)
+        if rows.min() < self._num_indexed:
+            # an indexed row moved to another list
+            self._lists_dirty = True
+
+    def compact(self, live_rows: np.ndarray) -> None:
+        """Remap rows after compaction of the matrix."""
+        assignments = np.full(len(live_rows), -1, dtype=np.int32)
+        in_range = live_rows < len(self._assignments)
+        assignments[in_range] = self._assignments[live_rows[in_range]]
+        self._assignments = assignments
+        self._num_rows = len(assignments)
+        if self.is_trained:
+            self._rebuild_lists()
+
+    def _rebuild_lists(self) -> None:
+        """Build the inverted lists from the row assignments."""
+        assert self._centroids is not None
+        assignments = self._assignments[: self._num_rows]
+        order = np.argsort(assignments, kind="stable")
+        self._list_rows = order[assignments[order] >= 0]
+        self._list_offsets = np.searchsorted(
+            assignments[self._list_rows], np.arange(len(self._centroids) + 1)
+        )
+        self._num_indexed = self._num_rows
+        self._lists_dirty = False
+
+    def candidates(
+        self, query_embedding: np.ndarray, nprobe: Optional[int] = None, **kwargs: Any
+    ) -> np.ndarray:
+        """Get the rows of the `nprobe` lists closest to the query."""
+        if self._centroids is None:
+            raise ValueError("IVFIndex is not trained.")
+        num_pending = self._num_rows - self._num_indexed
+        if self._lists_dirty or num_pending > max(
+            MIN_PENDING_TO_REBUILD, MAX_PENDING_FRACTION * self._num_indexed
+        ):
+            self._rebuild_lists()
+
+        nprobe = min(nprobe or self._nprobe, len(self._centroids))
+        centroid_scores = (
+            self._centroids
+            @ _normalize(np.asarray(query_embedding, dtype=np.float32)[np.newaxis, :])[
+                0
+            ]
+        )
+        probe = np.argpartition(-centroid_scores, nprobe - 1)[:nprobe]
+
+        rows = [
+            self._list_rows[self._list_offsets[c] : self._list_offsets[c + 1]]
+            for c in probe
+        ]
+        # rows added since the lists were built
+        pending = self._assignments[self._num_indexed : self._num_rows]
+        rows.append(self._num_indexed + np.flatnonzero(np.isin(pending, probe)))
+        return np.concatenate(rows)
+
+    def get_params(self) -> Dict[str, Any]:
+        """Get constructor params."""
+        return {
+            "nlist": self._nlist,
+            "nprobe": self._nprobe,
+            "min_train_size": self._min_train_size,
+            "max_train_size": self._max_train_size,
+            "num_iters": self._num_iters,
+            "seed": self._seed,
+        }
+
+    def to_arrays(self, rows: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+        """Get centroids and row assignments."""
+        if self._centroids is None:
+            return {}
+        assignments = self._assignments[: self._num_rows]
+        if rows is not None:
+            assignments = assignments[rows]
+        return {"centroids": self._centroids, "assignments": assignments}
+
+    def load_arrays(self, arrays: Dict[str, np.ndarray]) -> None:
+        """Load centroids and row assignments."""
+        if "centroids" not in arrays:
+            return
+        self._centroids = np.asarray(arrays["centroids"], dtype=np.float32)
+        self._assignments = np.asarray(arrays["assignments"], dtype=np.int32)
+        self._num_rows = len(self._assignments)
+        self._rebuild_lists()
+
+
+ANN_INDEX_TYPE_TO_CLASS: Dict[str, Type[BaseANNIndex]] = {
+    IVFIndex.index_type: IVFIndex,
+}
@@ -0,0 +1,326 @@
+"""Contiguous embedding matrix used by the simple vector store."""
+
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from llama_index.embeddings.base import similarity_batch
+
+DEFAULT_CAPACITY = 1024
+DEFAULT_GROWTH_FACTOR = 2.0
+# compact once tombstoned rows outnumber live ones (and there are enough of them)
+MIN_TOMBSTONES_TO_COMPACT = 1024
+
+
+class EmbeddingMatrix:
+    """Contiguous float32 embedding matrix.
+
+    Rows are stored in a single preallocated matrix alongside a row -> id array and
+    precomputed row norms, so that a query is one matrix-vector product followed by
+    an ``argpartition``. Adds append rows (growing the buffer geometrically) and
+    deletes tombstone rows, which are reclaimed by ``compact``.
+
+    Args:
+        dim (Optional[int]): embedding dimension. Inferred from the first add
+            if not set.
+        capacity (int): number of rows to preallocate.
+        growth_factor (float): factor by which the buffer grows when full.
+
+    """
+
+    def __init__(
+        self,
+        dim: Optional[int] = None,
+        capacity: int = DEFAULT_CAPACITY,
+        growth_factor: float = DEFAULT_GROWTH_FACTOR,
+    ) -> None:
+        """Init params."""
+        if growth_factor <= 1.0:
+            raise ValueError("growth_factor must be > 1.0")
+        self._dim = dim
+        self._capacity = max(capacity, 1)
+        self._growth_factor = growth_factor
+
+        self._embeddings = np.zeros((0, dim or 0), dtype=np.float32)
+        # norms are computed lazily for matrices loaded from disk
+        self._norms: Optional[np.ndarray] = np.zeros(0, dtype=np.float32)
+        self._alive = np.zeros(0, dtype=bool)
+        self._ids: List[Optional[str]] = []
+        self._id_to_row: Dict[str, int] = {}
+        self._num_rows = 0
+
+    @property
+    def dim(self) -> Optional[int]:
+        """Get embedding dimension."""
+        return self._dim
+
+    @property
+    def num_rows(self) -> int:
+        """Get number of used rows, including tombstones."""
+        return self._num_rows
+
+    @property
+    def embeddings(self) -> np.ndarray:
+        """Get view over the used rows of the matrix (including tombstones)."""
+        return self._embeddings[: self._num_rows]
+
+    @property
+    def norms(self) -> np.ndarray:
+        """Get view over the norms of the used rows."""
+        return self._ensure_norms()[: self._num_rows]
+
+    @property
+    def alive(self) -> np.ndarray:
+        """Get view over the liveness mask of the used rows."""
+        return self._alive[: self._num_rows]
+
+    @property
+    def row_ids(self) -> List[Optional[str]]:
+        """Get row -> id array. Tombstoned rows map to None."""
+        return self._ids
+
+    def __len__(self) -> int:
+        return len(self._id_to_row)
+
+    def __contains__(self, text_id: object) -> bool:
+        return text_id in self._id_to_row
+
+    def _ensure_norms(self) -> np.ndarray:
+        """Compute row norms if they have not been computed yet."""
+        if self._norms is None:
+            norms = np.zeros(self._embeddings.shape[0], dtype=np.float32)
+            norms[: self._num_rows] = np.linalg.norm(
+                self._embeddings[: self._num_rows], axis=1
+            )
+            self._norms = norms
+        return self._norms
+
+    def _reserve(self, num_rows: int) -> None:
+        """Make sure the buffers can hold `num_rows` rows."""
+        if num_rows <= self._embeddings.shape[0]:
+            return
+        old_norms = self._ensure_norms()
+        new_capacity = max(
+            num_rows,
+            self._capacity,
+            int(self._embeddings.shape[0] * self._growth_factor),
+        )
+        embeddings = np.zeros((new_capacity, self._dim or 0), dtype=np.float32)
+        embeddings[: self._num_rows] = self._embeddings[: self._num_rows]
+        norms = np.zeros(new_capacity, dtype=np.float32)
+        norms[: self._num_rows] = old_norms[: self._num_rows]
+        alive = np.zeros(new_capacity, dtype=bool)
+        alive[: self._num_rows] = self._alive[: self._num_rows]
+        self._embeddings, self._norms, self._alive = embeddings, norms, alive
+
+    def add(
+        self, text_ids: Sequence[str], embeddings: Sequence[Sequence[float]]
+    ) -> None:
+        """Add (or overwrite) embeddings."""
+        if len(text_ids) == 0:
+            return
+        embeddings_np = np.asarray(embeddings, dtype=np.float32)
+        if embeddings_np.ndim != 2 or embeddings_np.shape[0] != len(text_ids):
+            raise ValueError("Expected one embedding per id.")
+        if self._dim is None:
+            self._dim = embeddings_np.shape[1]
+            self._embeddings = np.zeros((0, self._dim), dtype=np.float32)
+        elif embeddings_np.shape[1] != self._dim:
+            raise ValueError(
+                f"Embedding dimension {embeddings_np.shape[1]} does not match "
+                f"store dimension {self._dim}."
+            )
+
+        rows = np.empty(len(text_ids), dtype=np.int64)
+        new_ids: List[str] = []
+        for idx, text_id in enumerate(text_ids):
+            row = self._id_to_row.get(text_id)
+            if row is None:
+                row = self._num_rows + len(new_ids)
+                new_ids.append(text_id)
+                self._id_to_row[text_id] = row
+            rows[idx] = row
+
+        self._reserve(self._num_rows + len(new_ids))
+        self._ids.extend(new_ids)
+        self._num_rows += len(new_ids)
+
+        norms = self._ensure_norms()
+        self._embeddings[rows] = embeddings_np
+        norms[rows] = np.linalg.norm(embeddings_np, axis=1)
+        self._alive[rows] = True
+
+    def delete(self, text_ids: Sequence[str]) -> Optional[np.ndarray]:
+        """Tombstone the rows of the given ids. Unknown ids are ignored.
+
+        Returns:
+            Optional[np.ndarray]: if deleting triggered a compaction, the old row of
+                every row after compaction (see ``compact``), else None.
+
+        """
+        for text_id in text_ids:
+            row = self._id_to_row.pop(text_id, None)
+            if row is None:
+                continue
+            self._alive[row] = False
+            self._ids[row] = None
+
+        num_tombstones = self._num_rows - len(self._id_to_row)
+        if num_tombstones >= MIN_TOMBSTONES_TO_COMPACT and num_tombstones > len(
+            self._id_to_row
+        ):
+            return self.compact()
+        return None
+
+    def compact(self) -> np.ndarray:
+        """Drop tombstoned rows, keeping the relative order of live rows.
+
+        Returns:
+            np.ndarray: the old row of every row after compaction, so that
+                row-aligned structures can be remapped with ``arr[live_rows]``.
+
+        """
+        live_rows = np.flatnonzero(self.alive)
+        self._embeddings = np.ascontiguousarray(self._embeddings[live_rows])
+        self._norms = self._ensure_norms()[live_rows]
+        self._alive = np.ones(len(live_rows), dtype=bool)
+        self._ids = [self._ids[row] for row in live_rows]
+        self._id_to_row = {
+            text_id: row for row, text_id in enumerate(self._ids) if text_id is not None
+        }
+        self._num_rows = len(live_rows)
+        return live_rows
+
+    def get(self, text_id: str) -> List[float]:
+        """Get embedding."""
+        return self._embeddings[self._id_to_row[text_id]].tolist()
+
+    def get_row(self, text_id: str) -> int:
+        """Get row of an id."""
+        return self._id_to_row[text_id]
+
+    def get_rows(self, text_ids: Optional[Iterable[str]] = None) -> np.ndarray:
+        """Get sorted rows of the given ids (or of all live rows). Unknown ids are
+        ignored."""
+        if text_ids is None:
+            return np.flatnonzero(self.alive)
+        rows = [self._id_to_row[i] for i in text_ids if i in self._id_to_row]
+        return np.sort(np.array(rows, dtype=np.int64))
+
+    def items(self) -> Iterator[Tuple[str, List[float]]]:
+        """Iterate over (id, embedding) pairs of live rows in insertion order."""
+        for row in np.flatnonzero(self.alive):
+            text_id = self._ids[row]
+            if text_id is not None:
+                yield text_id, self._embeddings[row].tolist()
+
+    def to_dict(self) -> Dict[str, List[float]]:
+        """Get embedding dict."""
+        return dict(self.items())
+
+    @classmethod
+    def from_dict(
+        cls, embedding_dict: Dict[str, List[float]], **kwargs: object
+    ) -> "EmbeddingMatrix":
+        """Create matrix from an embedding dict."""
+        matrix = cls(capacity=max(len(embedding_dict), 1), **kwargs)  # type: ignore
+        matrix.add(list(embedding_dict.keys()), list(embedding_dict.values()))
+        return matrix
+
+    @classmethod
+    def from_arrays(
+        cls, text_ids: Sequence[str], embeddings: np.ndarray, **kwargs: object
+    ) -> "EmbeddingMatrix":
+        """Create matrix on top of an existing (n, dim) float32 array.
+
+        The array is used as-is without copying, so it may be a memory-mapped
+        array. Norms are computed on first use.
+
+        """
+        if embeddings.ndim != 2 or embeddings.shape[0] != len(text_ids):
+            raise ValueError("Expected one embedding per id.")
+        matrix = cls(dim=embeddings.shape[1], **kwargs)  # type: ignore
+        matrix._embeddings = embeddings
+        matrix._norms = None
+        matrix._alive = np.ones(len(text_ids), dtype=bool)
+        matrix._ids = list(text_ids)
+        matrix._id_to_row = {text_id: row for row, text_id in enumerate(text_ids)}
+        matrix._num_rows = len(text_ids)
+        return matrix
+
+    def live_view(self) -> Tuple[List[str], np.ndarray]:
+        """Get ids and embeddings of live rows.
+
+        Returns a view (no copy) of the matrix when there are no tombstones.
+
+        """
+        if len(self) == self._num_rows:
+            return list(self._ids), self.embeddings  # type: ignore
+        live_rows = np.flatnonzero(self.alive)
+        return (
+            [self._ids[row] for row in live_rows],  # type: ignore
+            self.embeddings[live_rows],
+        )
+
+    def scores(
+        self, query_embedding: Sequence[float], mask: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Get cosine similarity of the query with every used row.
+
+        Rows outside of `mask` (or tombstoned) get a score of -inf.
+
+        """
+        scores = self._cosine(query_embedding)
+        mask = self.alive if mask is None else mask & self.alive
+        scores[~mask] = -np.inf
+        return scores
+
+    def _cosine(
+        self, query_embedding: Sequence[float], rows: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Get cosine similarity of the query with the given (or all used) rows."""
+        if rows is None:
+            return similarity_batch(query_embedding, self.embeddings, norms=self.norms)
+        return similarity_batch(
+            query_embedding, self._embeddings[rows], norms=self.norms[rows]
+        )
+
+    def top_k(
+        self,
+        query_embedding: Sequence[float],
+        similarity_top_k: Optional[int] = None,
+        mask: Optional[np.ndarray] = None,
+        similarity_cutoff: Optional[float] = None,
+        rows: Optional[np.ndarray] = None,
+    ) -> Tuple[List[float], List[str]]:
+        """Get top k ids by cosine similarity to the query.
+
+        Args:
+            rows (Optional[np.ndarray]): only score these candidate rows
+                (e.g. from an approximate index) instead of every row.
+
+        """
+        if self._num_rows == 0:
+            return [], []
+        if rows is None:
+            scores = self.scores(query_embedding, mask=mask)
+            candidates = np.flatnonzero(scores > -np.inf)
+            candidate_scores = scores[candidates]
+        else:
+            keep = self.alive[rows] if mask is None else (mask & self.alive)[rows]
+            candidates = rows[keep]
+            candidate_scores = self._cosine(query_embedding, rows=candidates)
+
+        if similarity_cutoff is not None:
+            keep = candidate_scores > similarity_cutoff
+            candidates, candidate_scores = candidates[keep], candidate_scores[keep]
+        if similarity_top_k and len(candidates) > similarity_top_k:
+            part = np.argpartition(-candidate_scores, similarity_top_k - 1)
+            part = part[:similarity_top_k]
+            candidates, candidate_scores = candidates[part], candidate_scores[part]
+        order = np.argsort(-candidate_scores, kind="stable")
+
+        return (
+            candidate_scores[order].astype(float).tolist(),
+            [self._ids[row] for row in candidates[order]],  # type: ignore
+        )
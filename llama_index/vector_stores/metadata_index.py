@@ -0,0 +1,68 @@
+"""Metadata index used by the simple vector store for filtering."""
+
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+
+from llama_index.vector_stores.types import MetadataFilters
+
+# only values of these types can be matched by ExactMatchFilter
+INDEXED_VALUE_TYPES = (str, int, float)
+
+
+class MetadataIndex:
+    """Inverted postings from metadata (key, value) pairs to node ids.
+
+    Filters are evaluated as an intersection of postings, so their cost depends
+    on the number of matching nodes rather than on the size of the store.
+
+    """
+
+    def __init__(self) -> None:
+        """Init params."""
+        self._postings: Dict[str, Dict[Any, Set[str]]] = {}
+
+    @classmethod
+    def from_metadata_dict(
+        cls, metadata_dict: Dict[str, Dict[str, Any]]
+    ) -> "MetadataIndex":
+        """Build index from a dict mapping node ids to their metadata."""
+        index = cls()
+        for text_id, metadata in metadata_dict.items():
+            index.add(text_id, metadata)
+        return index
+
+    @staticmethod
+    def _indexed_items(metadata: Dict[str, Any]) -> Iterable[Tuple[str, Any]]:
+        for key, value in metadata.items():
+            if isinstance(value, INDEXED_VALUE_TYPES):
+                yield key, value
+
+    def add(self, text_id: str, metadata: Dict[str, Any]) -> None:
+        """Add postings of a node."""
+        for key, value in self._indexed_items(metadata):
+            self._postings.setdefault(key, {}).setdefault(value, set()).add(text_id)
+
+    def delete(self, text_id: str, metadata: Dict[str, Any]) -> None:
+        """Remove postings of a node."""
+        for key, value in self._indexed_items(metadata):
+            key_postings = self._postings.get(key, {})
+            text_ids = key_postings.get(value)
+            if text_ids is None:
+                continue
+            text_ids.discard(text_id)
+            if not text_ids:
+                del key_postings[value]
+
+    def filter(self, filters: MetadataFilters) -> Set[str]:
+        """Get ids of the nodes matching all filters."""
+        postings = [
+            self._postings.get(f.key, {}).get(f.value, set()) for f in filters.filters
+        ]
+        if not postings:
+            raise ValueError("MetadataFilters must contain at least one filter.")
+        postings.sort(key=len)
+        matches: Optional[Set[str]] = None
+        for text_ids in postings:
+            matches = set(text_ids) if matches is None else matches & text_ids
+            if not matches:
+                break
+        return matches or set()
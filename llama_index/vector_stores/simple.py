@@ -4,16 +4,21 @@ import json
 import logging
 import os
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Dict, Iterable, List, Optional, Set, cast
 
 import fsspec
+import numpy as np
 from dataclasses_json import DataClassJsonMixin
+from fsspec.implementations.local import LocalFileSystem
 
 from llama_index.indices.query.embedding_utils import (
     get_top_k_embeddings,
     get_top_k_embeddings_learner,
     get_top_k_mmr_embeddings,
 )
+from llama_index.vector_stores.ann_index import ANN_INDEX_TYPE_TO_CLASS, BaseANNIndex
+from llama_index.vector_stores.embedding_matrix import EmbeddingMatrix
+from llama_index.vector_stores.metadata_index import MetadataIndex
 from llama_index.vector_stores.types import (
     DEFAULT_PERSIST_DIR,
     DEFAULT_PERSIST_FNAME,
@@ -23,7 +28,7 @@ from llama_index.vector_stores.types import (
     VectorStoreQueryMode,
     VectorStoreQueryResult,
 )
-from llama_index.utils import concat_dirs
+from llama_index.utils import atomic_write, concat_dirs, is_same_path
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +40,22 @@ LEARNER_MODES = {
 
 MMR_MODE = VectorStoreQueryMode.MMR
 
+# persist format of matrix-backed stores: a small JSON sidecar (at the persist path)
+# holding ids / ref doc ids, plus a raw .npy embedding file next to it
+NPY_FORMAT = "npy"
+EMBEDDINGS_FILE_EXT = ".npy"
+ANN_INDEX_FILE_EXT = ".ann.npz"
+
+
+def _get_embeddings_path(persist_path: str) -> str:
+    """Get path of the .npy embedding file for a persist path."""
+    return os.path.splitext(persist_path)[0] + EMBEDDINGS_FILE_EXT
+
+
+def _get_ann_index_path(persist_path: str) -> str:
+    """Get path of the approximate nearest neighbour index file for a persist path."""
+    return os.path.splitext(persist_path)[0] + ANN_INDEX_FILE_EXT
+
 
 @dataclass
 class SimpleVectorStoreData(DataClassJsonMixin):
@@ -43,11 +64,14 @@ class SimpleVectorStoreData(DataClassJsonMixin):
     Args:
         embedding_dict (Optional[dict]): dict mapping doc_ids to embeddings.
         text_id_to_ref_doc_id (Optional[dict]): dict mapping text_ids to ref_doc_ids.
+        metadata_dict (Optional[dict]): dict mapping text_ids to the extra_info of
+            their nodes (only for nodes with extra_info), used for filtering.
 
     """
 
     embedding_dict: Dict[str, List[float]] = field(default_factory=dict)
     text_id_to_ref_doc_id: Dict[str, str] = field(default_factory=dict)
+    metadata_dict: Dict[str, Dict[str, Any]] = field(default_factory=dict)
 
 
 class SimpleVectorStore(VectorStore):
@@ -55,10 +79,32 @@ class SimpleVectorStore(VectorStore):
 
     In this vector store, embeddings are stored within a simple, in-memory dictionary.
 
+    With `use_matrix=True`, embeddings are instead kept in a contiguous float32
+    matrix (see EmbeddingMatrix), so that queries are a single vectorized
+    similarity computation instead of a Python loop over every embedding.
+    Matrix-backed stores persist to a binary format (a raw .npy embedding file
+    plus a JSON sidecar with the ids), which is memory-mapped on load.
+
+    Matrix-backed stores can also use an approximate nearest neighbour index
+    (e.g. IVFIndex) for default-mode queries, which then only score a subset of
+    the embeddings. The index is persisted alongside the store.
+
+    Queries can be restricted with exact match metadata filters on the extra_info
+    of the nodes; filtered queries only score the matching embeddings.
+
+    Persisting an unchanged store to the path it was loaded from or last
+    persisted to is skipped, and matrix-backed stores only rewrite their
+    embedding file when embeddings were added or deleted.
+
     Args:
         simple_vector_store_data_dict (Optional[dict]): data dict
             containing the embeddings and doc_ids. See SimpleVectorStoreData
             for more details.
+        use_matrix (bool): whether to store embeddings in a contiguous matrix.
+        embedding_matrix (Optional[EmbeddingMatrix]): prebuilt embedding matrix.
+            Implies `use_matrix=True`.
+        ann_index (Optional[BaseANNIndex]): approximate nearest neighbour index.
+            Implies `use_matrix=True`.
     """
 
     stores_text: bool = False
@@ -67,32 +113,76 @@ class SimpleVectorStore(VectorStore):
         self,
         data: Optional[SimpleVectorStoreData] = None,
         fs: Optional[fsspec.AbstractFileSystem] = None,
+        use_matrix: bool = False,
+        embedding_matrix: Optional[EmbeddingMatrix] = None,
+        ann_index: Optional[BaseANNIndex] = None,
         **kwargs: Any,
     ) -> None:
         """Initialize params."""
         self._data = data or SimpleVectorStoreData()
         self._fs = fs or fsspec.filesystem("file")
+        self._ann_index = ann_index
+
+        self._matrix: Optional[EmbeddingMatrix] = embedding_matrix
+        if self._matrix is None and (use_matrix or ann_index is not None):
+            # embeddings live in the matrix only, to_dict materializes them
+            self._matrix = EmbeddingMatrix.from_dict(self._data.embedding_dict)
+            self._data.embedding_dict = {}
+
+        # reverse index of text_id_to_ref_doc_id, so that deletes only touch the
+        # nodes of the deleted documents. Derived on load, not persisted.
+        self._ref_doc_id_to_text_ids: Dict[str, Set[str]] = {}
+        for text_id, ref_doc_id in self._data.text_id_to_ref_doc_id.items():
+            self._ref_doc_id_to_text_ids.setdefault(ref_doc_id, set()).add(text_id)
+        self._metadata_index = MetadataIndex.from_metadata_dict(
+            self._data.metadata_dict
+        )
+
+        # paths the current data (resp. embeddings of matrix-backed stores) were
+        # loaded from or persisted to, if unchanged since
+        self._persist_path: Optional[str] = None
+        self._embeddings_persist_path: Optional[str] = None
 
     @classmethod
     def from_persist_dir(
         cls,
         persist_dir: str = DEFAULT_PERSIST_DIR,
         fs: Optional[fsspec.AbstractFileSystem] = None,
+        **kwargs: Any,
     ) -> "SimpleVectorStore":
         """Load from persist dir."""
         if fs is not None:
             persist_path = concat_dirs(persist_dir, DEFAULT_PERSIST_FNAME)
         else:
             persist_path = os.path.join(persist_dir, DEFAULT_PERSIST_FNAME)
-        return cls.from_persist_path(persist_path, fs=fs)
+        return cls.from_persist_path(persist_path, fs=fs, **kwargs)
 
     @property
     def client(self) -> None:
         """Get client."""
         return None
 
+    @property
+    def use_matrix(self) -> bool:
+        """Whether embeddings are stored in a contiguous matrix."""
+        return self._matrix is not None
+
+    @property
+    def ann_index(self) -> Optional[BaseANNIndex]:
+        """Get approximate nearest neighbour index."""
+        return self._ann_index
+
+    def train_ann_index(self) -> None:
+        """(Re)train the approximate nearest neighbour index on the current data."""
+        if self._ann_index is None or self._matrix is None:
+            raise ValueError("No ann_index configured for this SimpleVectorStore.")
+        self._ann_index.train(self._matrix.embeddings, self._matrix.alive)
+        self._persist_path = None
+
     def get(self, text_id: str) -> List[float]:
         """Get embedding."""
+        if self._matrix is not None:
+            return self._matrix.get(text_id)
         return self._data.embedding_dict[text_id]
 
     def add(
@@ -100,9 +190,34 @@ class SimpleVectorStore(VectorStore):
         embedding_results: List[NodeWithEmbedding],
     ) -> List[str]:
         """Add embedding_results to index."""
+        self._persist_path = None
+        self._embeddings_persist_path = None
+        if self._matrix is not None:
+            text_ids = [result.id for result in embedding_results]
+            embeddings = [result.embedding for result in embedding_results]
+            self._matrix.add(text_ids, embeddings)
+            if self._ann_index is not None and len(text_ids) > 0:
+                self._ann_index.add(
+                    np.array([self._matrix.get_row(i) for i in text_ids]),
+                    np.asarray(embeddings, dtype=np.float32),
+                )
         for result in embedding_results:
-            self._data.embedding_dict[result.id] = result.embedding
+            if self._matrix is None:
+                self._data.embedding_dict[result.id] = result.embedding
+            prev_ref_doc_id = self._data.text_id_to_ref_doc_id.get(result.id)
+            if prev_ref_doc_id is not None and prev_ref_doc_id != result.ref_doc_id:
+                self._ref_doc_id_to_text_ids[prev_ref_doc_id].discard(result.id)
             self._data.text_id_to_ref_doc_id[result.id] = result.ref_doc_id
+            self._ref_doc_id_to_text_ids.setdefault(result.ref_doc_id, set()).add(
+                result.id
+            )
+
+            prev_metadata = self._data.metadata_dict.pop(result.id, None)
+            if prev_metadata is not None:
+                self._metadata_index.delete(result.id, prev_metadata)
+            if result.node.extra_info:
+                self._data.metadata_dict[result.id] = result.node.extra_info
+                self._metadata_index.add(result.id, result.node.extra_info)
         return [result.id for result in embedding_results]
 
     def delete(self, ref_doc_id: str, **delete_kwargs: Any) -> None:
@@ -113,14 +228,36 @@ class SimpleVectorStore(VectorStore):
             ref_doc_id (str): The doc_id of the document to delete.
 
         """
-        text_ids_to_delete = set()
-        for text_id, ref_doc_id_ in self._data.text_id_to_ref_doc_id.items():
-            if ref_doc_id == ref_doc_id_:
-                text_ids_to_delete.add(text_id)
+        self.delete_many([ref_doc_id], **delete_kwargs)
+
+    def delete_many(self, ref_doc_ids: Iterable[str], **delete_kwargs: Any) -> None:
+        """
+        Delete nodes of several documents at once.
+
+        Args:
+            ref_doc_ids (Iterable[str]): The doc_ids of the documents to delete.
 
+        """
+        text_ids_to_delete: Set[str] = set()
+        for ref_doc_id in ref_doc_ids:
+            text_ids_to_delete.update(
+                self._ref_doc_id_to_text_ids.pop(ref_doc_id, set())
+            )
+        if text_ids_to_delete:
+            self._persist_path = None
+            self._embeddings_persist_path = None
+
+        if self._matrix is not None:
+            live_rows = self._matrix.delete(list(text_ids_to_delete))
+            if live_rows is not None and self._ann_index is not None:
+                self._ann_index.compact(live_rows)
         for text_id in text_ids_to_delete:
-            del self._data.embedding_dict[text_id]
+            if self._matrix is None:
+                del self._data.embedding_dict[text_id]
             del self._data.text_id_to_ref_doc_id[text_id]
+            metadata = self._data.metadata_dict.pop(text_id, None)
+            if metadata is not None:
+                self._metadata_index.delete(text_id, metadata)
 
     def query(
         self,
@@ -128,24 +265,50 @@ class SimpleVectorStore(VectorStore):
         **kwargs: Any,
     ) -> VectorStoreQueryResult:
         """Get nodes for response."""
-        if query.filters is not None:
-            raise ValueError(
-                "Metadata filters not implemented for SimpleVectorStore yet."
-            )
-
-        # TODO: consolidate with get_query_text_embedding_similarities
-        items = self._data.embedding_dict.items()
+        query_embedding = cast(List[float], query.query_embedding)
 
+        # restrict to doc_ids and metadata filters before computing similarities
+        available_ids: Optional[Set[str]] = None
         if query.doc_ids:
             available_ids = set(query.doc_ids)
-
-            node_ids = [t[0] for t in items if t[0] in available_ids]
-            embeddings = [t[1] for t in items if t[0] in available_ids]
+        if query.filters is not None:
+            filtered_ids = self._metadata_index.filter(query.filters)
+            if available_ids is None:
+                available_ids = filtered_ids
+            else:
+                available_ids &= filtered_ids
+
+        if self._matrix is not None:
+            if available_ids is not None:
+                rows: Optional[np.ndarray] = self._matrix.get_rows(available_ids)
+            elif query.mode == VectorStoreQueryMode.DEFAULT:
+                rows = self._get_ann_candidates(query, **kwargs)
+            else:
+                rows = self._matrix.get_rows()
+
+            if query.mode == VectorStoreQueryMode.DEFAULT:
+                top_similarities, top_ids = self._matrix.top_k(
+                    query_embedding,
+                    similarity_top_k=query.similarity_top_k,
+                    rows=rows,
+                )
+                return VectorStoreQueryResult(
+                    similarities=top_similarities, ids=top_ids
+                )
+
+            assert rows is not None
+            node_ids = [cast(str, self._matrix.row_ids[row]) for row in rows]
+            embeddings = list(self._matrix.embeddings[rows])
         else:
-            node_ids = [t[0] for t in items]
-            embeddings = [t[1] for t in items]
+            # TODO: consolidate with get_query_text_embedding_similarities
+            items = self._data.embedding_dict.items()
 
-        query_embedding = cast(List[float], query.query_embedding)
+            if available_ids is not None:
+                node_ids = [t[0] for t in items if t[0] in available_ids]
+                embeddings = [t[1] for t in items if t[0] in available_ids]
+            else:
+                node_ids = [t[0] for t in items]
+                embeddings = [t[1] for t in items]
 
         if query.mode in LEARNER_MODES:
             top_similarities, top_ids = get_top_k_embeddings_learner(
@@ -162,6 +325,7 @@ class SimpleVectorStore(VectorStore):
                 similarity_top_k=query.similarity_top_k,
                 embedding_ids=node_ids,
                 mmr_threshold=mmr_threshold,
+                candidate_top_k=kwargs.get("mmr_candidate_top_k", None),
             )
         elif query.mode == VectorStoreQueryMode.DEFAULT:
             top_similarities, top_ids = get_top_k_embeddings(
@@ -175,23 +339,95 @@ class SimpleVectorStore(VectorStore):
 
         return VectorStoreQueryResult(similarities=top_similarities, ids=top_ids)
 
+    def _get_ann_candidates(
+        self, query: VectorStoreQuery, **kwargs: Any
+    ) -> Optional[np.ndarray]:
+        """Get candidate rows from the ann index, or None for exact search."""
+        if self._ann_index is None or self._matrix is None:
+            return None
+        if self._ann_index.should_train(len(self._matrix)):
+            self.train_ann_index()
+        if not self._ann_index.is_trained:
+            return None
+        return self._ann_index.candidates(
+            np.asarray(query.query_embedding, dtype=np.float32), **kwargs
+        )
+
     def persist(
         self,
         persist_path: str = os.path.join(DEFAULT_PERSIST_DIR, DEFAULT_PERSIST_FNAME),
         fs: Optional[fsspec.AbstractFileSystem] = None,
     ) -> None:
-        """Persist the SimpleVectorStore to a directory."""
+        """Persist the SimpleVectorStore to a directory.
+
+        Matrix-backed stores are persisted in the binary format, other stores
+        as a single JSON file. Files are written atomically.
+
+        """
         fs = fs or self._fs
+        if is_same_path(persist_path, self._persist_path, fs) and fs.exists(
+            persist_path
+        ):
+            logger.debug(f"Skipping persist of unchanged {__name__}.")
+            return
+
         dirpath = os.path.dirname(persist_path)
         if not fs.exists(dirpath):
             fs.makedirs(dirpath)
 
-        with fs.open(persist_path, "w") as f:
-            json.dump(self._data.to_dict(), f)
+        if self._matrix is not None:
+            self._persist_binary(persist_path, fs)
+        else:
+            with atomic_write(persist_path, fs) as f:
+                json.dump(self.to_dict(), f)
+        self._persist_path = persist_path
+
+    def _persist_binary(self, persist_path: str, fs: fsspec.AbstractFileSystem) -> None:
+        """Persist embeddings to a .npy file and ids to a JSON sidecar."""
+        assert self._matrix is not None
+        text_ids, embeddings = self._matrix.live_view()
+
+        # NOTE: written through a temp file, the current file may be memory-mapped
+        embeddings_path = _get_embeddings_path(persist_path)
+        if not is_same_path(
+            persist_path, self._embeddings_persist_path, fs
+        ) or not fs.exists(embeddings_path):
+            with atomic_write(embeddings_path, fs, mode="wb") as f:
+                np.save(f, np.ascontiguousarray(embeddings, dtype=np.float32))
+            self._embeddings_persist_path = persist_path
+
+        sidecar: Dict[str, Any] = {
+            "format": NPY_FORMAT,
+            "ids": text_ids,
+            "ref_doc_ids": [
+                self._data.text_id_to_ref_doc_id[text_id] for text_id in text_ids
+            ],
+            "metadata_dict": self._data.metadata_dict,
+        }
+
+        if self._ann_index is not None:
+            sidecar["ann_index"] = {
+                "type": self._ann_index.index_type,
+                "params": self._ann_index.get_params(),
+            }
+            live_rows = None
+            if len(self._matrix) != self._matrix.num_rows:
+                live_rows = np.flatnonzero(self._matrix.alive)
+            ann_arrays = self._ann_index.to_arrays(live_rows)
+            if ann_arrays:
+                with atomic_write(
+                    _get_ann_index_path(persist_path), fs, mode="wb"
+                ) as f:
+                    np.savez(f, **ann_arrays)
+        with atomic_write(persist_path, fs) as f:
+            json.dump(sidecar, f)
 
     @classmethod
     def from_persist_path(
-        cls, persist_path: str, fs: Optional[fsspec.AbstractFileSystem] = None
+        cls,
+        persist_path: str,
+        fs: Optional[fsspec.AbstractFileSystem] = None,
+        **kwargs: Any,
     ) -> "SimpleVectorStore":
         """Create a SimpleKVStore from a persist directory."""
         fs = fs or fsspec.filesystem("file")
@@ -203,13 +439,79 @@ class SimpleVectorStore(VectorStore):
         logger.debug(f"Loading {__name__} from {persist_path}.")
         with fs.open(persist_path, "rb") as f:
             data_dict = json.load(f)
-            data = SimpleVectorStoreData.from_dict(data_dict)
-        return cls(data)
+
+        if data_dict.get("format") == NPY_FORMAT:
+            return cls._from_binary(persist_path, data_dict, fs=fs, **kwargs)
+        data = SimpleVectorStoreData.from_dict(data_dict)
+        vector_store = cls(data, **kwargs)
+        vector_store._persist_path = persist_path
+        return vector_store
+
+    @classmethod
+    def _from_binary(
+        cls,
+        persist_path: str,
+        sidecar: dict,
+        fs: fsspec.AbstractFileSystem,
+        **kwargs: Any,
+    ) -> "SimpleVectorStore":
+        """Load a store persisted in the binary format.
+
+        Local files are memory-mapped (copy-on-write), so load time does not
+        depend on the number of embeddings and pages are read lazily.
+
+        """
+        embeddings_path = _get_embeddings_path(persist_path)
+        if isinstance(fs, LocalFileSystem):
+            embeddings = np.load(embeddings_path, mmap_mode="c")
+        else:
+            with fs.open(embeddings_path, "rb") as f:
+                embeddings = np.load(f)
+
+        text_ids = sidecar["ids"]
+        if embeddings.shape[0] != len(text_ids):
+            raise ValueError(
+                f"Embedding file {embeddings_path} does not match {persist_path}."
+            )
+        data = SimpleVectorStoreData(
+            text_id_to_ref_doc_id=dict(zip(text_ids, sidecar["ref_doc_ids"])),
+            metadata_dict=sidecar.get("metadata_dict", {}),
+        )
+
+        ann_index = kwargs.pop("ann_index", None)
+        if ann_index is None and "ann_index" in sidecar:
+            ann_index_cls = ANN_INDEX_TYPE_TO_CLASS[sidecar["ann_index"]["type"]]
+            ann_arrays = {}
+            ann_index_path = _get_ann_index_path(persist_path)
+            if fs.exists(ann_index_path):
+                with fs.open(ann_index_path, "rb") as f:
+                    with np.load(f) as npz:
+                        ann_arrays = dict(npz)
+            ann_index = ann_index_cls.from_arrays(
+                sidecar["ann_index"]["params"], ann_arrays
+            )
+
+        kwargs.pop("use_matrix", None)
+        vector_store = cls(
+            data,
+            embedding_matrix=EmbeddingMatrix.from_arrays(text_ids, embeddings),
+            ann_index=ann_index,
+            **kwargs,
+        )
+        vector_store._persist_path = persist_path
+        vector_store._embeddings_persist_path = persist_path
+        return vector_store
 
     @classmethod
-    def from_dict(cls, save_dict: dict) -> "SimpleVectorStore":
+    def from_dict(cls, save_dict: dict, **kwargs: Any) -> "SimpleVectorStore":
         data = SimpleVectorStoreData.from_dict(save_dict)
-        return cls(data)
+        return cls(data, **kwargs)
 
     def to_dict(self) -> dict:
+        if self._matrix is not None:
+            return SimpleVectorStoreData(
+                embedding_dict=self._matrix.to_dict(),
+                text_id_to_ref_doc_id=self._data.text_id_to_ref_doc_id,
+                metadata_dict=self._data.metadata_dict,
+            ).to_dict()
         return self._data.to_dict()
@@ -1,9 +1,22 @@
 """Embeddings."""
+import asyncio
 from typing import Any, List
 from unittest.mock import patch
 
-from llama_index.embeddings.base import SimilarityMode, mean_agg
+import numpy as np
+import openai
+import pytest
+
+from llama_index.embeddings.base import (
+    BaseEmbedding,
+    SimilarityMode,
+    mean_agg,
+    pairwise_similarity,
+    similarity,
+    similarity_batch,
+)
 from llama_index.embeddings.openai import OpenAIEmbedding
+from llama_index.embeddings.utils import RateLimiter
 
 
 def mock_get_text_embedding(text: str) -> List[float]:
@@ -97,3 +110,131 @@ def test_mean_agg() -> None:
     embedding_1 = [0.0, 1.0, 0.0]
     output = mean_agg([embedding_0, embedding_1])
     assert output == [1.5, 2.5, 0.0]
+
+
+@pytest.mark.parametrize("mode", list(SimilarityMode))
+def test_similarity_batch(mode: SimilarityMode) -> None:
+    """Test batched similarity matches pairwise similarity."""
+    rng = np.random.default_rng(0)
+    query_embedding = rng.normal(size=8).tolist()
+    embeddings = rng.normal(size=(10, 8)).tolist()
+
+    expected = [similarity(query_embedding, emb, mode=mode) for emb in embeddings]
+    similarities = similarity_batch(query_embedding, embeddings, mode=mode)
+    assert similarities.dtype == np.float32
+    assert np.allclose(similarities, expected, atol=1e-5)
+
+    pairwise = pairwise_similarity(embeddings[:3], embeddings, mode=mode)
+    assert pairwise.shape == (3, 10)
+    for i in range(3):
+        expected = [similarity(embeddings[i], emb, mode=mode) for emb in embeddings]
+        assert np.allclose(pairwise[i], expected, atol=1e-4)
+
+
+def test_similarity_batch_edge_cases() -> None:
+    """Test batched similarity with empty and zero embeddings."""
+    assert similarity_batch([1.0, 0.0], []).shape == (0,)
+    assert pairwise_similarity([], [[1.0, 0.0]]).shape == (0, 1)
+
+    embeddings = [[0.0, 0.0], [3.0, 4.0]]
+    norms = np.linalg.norm(embeddings, axis=1)
+    similarities = similarity_batch([0.0, 1.0], embeddings, norms=norms)
+    assert np.allclose(similarities, [0.0, 0.8])
+
+
+class MockTokenEmbedding(BaseEmbedding):
+    """Mock embedding model recording its batches."""
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(tokenizer=lambda text: text.split(), **kwargs)
+        self.batches: List[List[str]] = []
+        self.num_running = 0
+        self.max_running = 0
+        self.num_failures = 0
+        self.error: Exception = ConnectionError("Connection reset.")
+
+    def _get_query_embedding(self, query: str) -> List[float]:
+        return [0.0]
+
+    def _get_text_embedding(self, text: str) -> List[float]:
+        return [float(len(text))]
+
+    def _get_text_embeddings(self, texts: List[str]) -> List[List[float]]:
+        self.batches.append(texts)
+        return [self._get_text_embedding(text) for text in texts]
+
+    async def _aget_text_embeddings(self, texts: List[str]) -> List[List[float]]:
+        self.num_running += 1
+        self.max_running = max(self.max_running, self.num_running)
+        await asyncio.sleep(0.01)
+        self.num_running -= 1
+        if self.num_failures > 0:
+            self.num_failures -= 1
+            raise self.error
+        return self._get_text_embeddings(texts)
+
+
+def test_get_queued_text_embeddings_max_tokens() -> None:
+    """Test batches are sized by token count."""
+    embed_model = MockTokenEmbedding(embed_batch_size=3, embed_batch_max_tokens=4)
+    texts = ["a b", "c d", "e", "f g h i j", "k", "l", "m"]
+    for i, text in enumerate(texts):
+        embed_model.queue_text_for_embedding(f"id:{i}", text)
+    ids, embeddings = embed_model.get_queued_text_embeddings()
+    assert ids == [f"id:{i}" for i in range(len(texts))]
+    assert embeddings == [[float(len(text))] for text in texts]
+    assert embed_model.batches == [
+        ["a b", "c d"],
+        ["e"],
+        ["f g h i j"],
+        ["k", "l", "m"],
+    ]
+    assert embed_model.total_tokens_used == 13
+
+
+def test_aget_queued_text_embeddings_concurrency() -> None:
+    """Test async embeddings are computed with bounded concurrency."""
+    embed_model = MockTokenEmbedding(
+        embed_batch_size=1, max_concurrency=2, max_retries=1
+    )
+    embed_model.num_failures = 1
+    text_queue = [(f"id:{i}", "a" * i) for i in range(10)]
+    ids, embeddings = asyncio.run(embed_model.aget_queued_text_embeddings(text_queue))
+    assert ids == [text_id for text_id, _ in text_queue]
+    assert embeddings == [[float(i)] for i in range(10)]
+    assert embed_model.max_running == 2
+
+
+def test_aget_queued_text_embeddings_no_retry() -> None:
+    """Test that non-transient errors are not retried."""
+    embed_model = MockTokenEmbedding(embed_batch_size=1, max_retries=3)
+    embed_model.num_failures = 1
+    embed_model.error = ValueError("Bad request.")
+    with pytest.raises(ValueError):
+        asyncio.run(embed_model.aget_queued_text_embeddings([("id:0", "a")]))
+    assert embed_model.num_failures == 0
+
+
+def test_openai_embedding_errors_to_retry() -> None:
+    """Test that OpenAI embeddings also retry OpenAI transient errors."""
+    errors = [error.exception_cls for error in OpenAIEmbedding()._get_errors_to_retry()]
+    assert openai.error.RateLimitError in errors
+    assert ConnectionError in errors
+    assert openai.error.InvalidRequestError not in errors
+
+
+def test_rate_limiter() -> None:
+    """Test requests wait for the rate limit window."""
+    now = [0.0]
+    rate_limiter = RateLimiter(
+        requests_per_minute=2, tokens_per_minute=100, clock=lambda: now[0]
+    )
+    assert rate_limiter._get_delay(10) == 0
+    now[0] = 10.0
+    assert rate_limiter._get_delay(10) == 0
+    # over the request budget until the first request leaves the window
+    assert rate_limiter._get_delay(10) == 50.0
+    now[0] = 60.0
+    assert rate_limiter._get_delay(10) == 0
+    # over the token budget
+    assert rate_limiter._get_delay(90) == 10.0
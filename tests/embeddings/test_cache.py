@@ -0,0 +1,152 @@
+"""Test embedding cache."""
+import asyncio
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+from llama_index.callbacks.base import CallbackManager
+from llama_index.callbacks.llama_debug import LlamaDebugHandler
+from llama_index.callbacks.schema import CBEventType, EventPayload
+from llama_index.embeddings.base import BaseEmbedding
+from llama_index.embeddings.cache import CachedEmbedding
+from llama_index.storage.kvstore.lru_kvstore import LRUKVStore
+from llama_index.storage.kvstore.simple_kvstore import SimpleKVStore
+from llama_index.storage.kvstore.types import DEFAULT_COLLECTION
+
+
+class CountingEmbedding(BaseEmbedding):
+    """Embedding model recording the texts it embeds."""
+
+    def __init__(self) -> None:
+        super().__init__(embed_batch_size=2, tokenizer=lambda text: text.split())
+        self.embedded_texts: List[str] = []
+
+    def _get_query_embedding(self, query: str) -> List[float]:
+        return [float(len(query)), 0.0]
+
+    def _get_text_embedding(self, text: str) -> List[float]:
+        self.embedded_texts.append(text)
+        return [float(len(text)), 1.0]
+
+
+class CountingKVStore(SimpleKVStore):
+    """Key-value store recording its bulk calls."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls: List[str] = []
+
+    def put_all(
+        self, kv_pairs: Sequence[Tuple[str, dict]], collection: str = DEFAULT_COLLECTION
+    ) -> None:
+        self.calls.append("put_all")
+        super().put_all(kv_pairs, collection=collection)
+
+    def get_many(
+        self, keys: Sequence[str], collection: str = DEFAULT_COLLECTION
+    ) -> Dict[str, dict]:
+        self.calls.append("get_many")
+        return super().get_many(keys, collection=collection)
+
+
+def test_cached_embedding_queue() -> None:
+    embed_model = CountingEmbedding()
+    cached_model = CachedEmbedding(embed_model)
+    for i, text in enumerate(["a", "bb", "a", "ccc"]):
+        cached_model.queue_text_for_embedding(f"id_{i}", text)
+    ids, embeddings = cached_model.get_queued_text_embeddings()
+    assert ids == ["id_0", "id_1", "id_2", "id_3"]
+    assert embeddings == [[1.0, 1.0], [2.0, 1.0], [1.0, 1.0], [3.0, 1.0]]
+    assert embed_model.embedded_texts == ["a", "bb", "ccc"]
+    assert cached_model.total_tokens_used == 3
+
+    # only misses are sent to the model
+    for i, text in enumerate(["bb", "dddd", "ccc"]):
+        cached_model.queue_text_for_embedding(f"id_{i}", text)
+    ids, embeddings = cached_model.get_queued_text_embeddings()
+    assert embeddings == [[2.0, 1.0], [4.0, 1.0], [3.0, 1.0]]
+    assert embed_model.embedded_texts == ["a", "bb", "ccc", "dddd"]
+    assert cached_model.cache_hits == 2
+    assert cached_model.cache_misses == 4
+
+    assert cached_model.get_text_embedding("dddd") == [4.0, 1.0]
+    assert cached_model.cache_hits == 3
+
+
+def test_cached_embedding_bulk_kvstore() -> None:
+    """Test that queued texts are looked up and cached in bulk."""
+    kvstore = CountingKVStore()
+    cached_model = CachedEmbedding(CountingEmbedding(), kvstore=kvstore)
+    for i, text in enumerate(["a", "bb", "ccc", "dddd", "a"]):
+        cached_model.queue_text_for_embedding(f"id_{i}", text)
+    cached_model.get_queued_text_embeddings()
+    # one lookup, and one write per embedding batch (of 2 texts)
+    assert kvstore.calls == ["get_many", "put_all", "put_all"]
+
+
+def test_cached_embedding_async() -> None:
+    embed_model = CountingEmbedding()
+    cached_model = CachedEmbedding(embed_model)
+    cached_model.get_text_embedding("a")
+
+    ids, embeddings = asyncio.run(
+        cached_model.aget_queued_text_embeddings([("id_0", "a"), ("id_1", "bb")])
+    )
+    assert ids == ["id_0", "id_1"]
+    assert embeddings == [[1.0, 1.0], [2.0, 1.0]]
+    assert embed_model.embedded_texts == ["a", "bb"]
+
+
+def test_cached_embedding_keys() -> None:
+    kvstore = SimpleKVStore()
+    embed_model = CountingEmbedding()
+    CachedEmbedding(embed_model, kvstore=kvstore).get_text_embedding("a")
+
+    # the model name is part of the key
+    CachedEmbedding(
+        embed_model, kvstore=kvstore, model_name="other"
+    ).get_text_embedding("a")
+    assert embed_model.embedded_texts == ["a", "a"]
+    CachedEmbedding(embed_model, kvstore=kvstore).get_text_embedding("a")
+    assert embed_model.embedded_texts == ["a", "a"]
+
+
+def test_cached_embedding_persist(tmp_path: Path) -> None:
+    kvstore = SimpleKVStore()
+    CachedEmbedding(CountingEmbedding(), kvstore=kvstore).get_text_embedding("a")
+    persist_path = str(tmp_path / "embedding_cache.json")
+    kvstore.persist(persist_path)
+
+    embed_model = CountingEmbedding()
+    cached_model = CachedEmbedding(
+        embed_model, kvstore=SimpleKVStore.from_persist_path(persist_path)
+    )
+    assert cached_model.get_text_embedding("a") == [1.0, 1.0]
+    assert embed_model.embedded_texts == []
+
+
+def test_cached_embedding_callbacks() -> None:
+    embed_model = CountingEmbedding()
+    llama_debug = LlamaDebugHandler()
+    embed_model.callback_manager = CallbackManager([llama_debug])
+    cached_model = CachedEmbedding(embed_model, kvstore=LRUKVStore(max_size=10))
+    cached_model.queue_text_for_embedding("id_0", "a")
+    cached_model.queue_text_for_embedding("id_1", "a")
+    cached_model.queue_text_for_embedding("id_2", "bb")
+    cached_model.get_queued_text_embeddings()
+    cached_model.get_text_embedding("bb")
+
+    cache_payloads = [
+        end_event.payload
+        for _, end_event in llama_debug.get_event_pairs(CBEventType.EMBEDDING_CACHE)
+    ]
+    assert [
+        (p[EventPayload.CACHE_HITS], p[EventPayload.CACHE_MISSES])
+        for p in cache_payloads
+        if p
+    ] == [(0, 2), (1, 0)]
+    # embedding events only cover texts actually embedded
+    payloads = [
+        end_event.payload
+        for _, end_event in llama_debug.get_event_pairs(CBEventType.EMBEDDING)
+    ]
+    assert [p[EventPayload.CHUNKS] for p in payloads if p] == [["a", "bb"]]
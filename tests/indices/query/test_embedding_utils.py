@@ -2,6 +2,8 @@
 
 import numpy as np
 
+from llama_index.embeddings.base import similarity
+
 from llama_index.indices.query.embedding_utils import (
     get_top_k_mmr_embeddings,
     get_top_k_embeddings,
@@ -73,3 +75,28 @@ def test_get_top_k_mmr_embeddings() -> None:
         result_similarities_no_mmr, result_similarities
     ):
         assert np.isclose(result_no_mmr, result_with_mmr, atol=0.00001)
+
+
+def test_get_top_k_mmr_embeddings_candidate_top_k() -> None:
+    """Test restricting MMR to the candidates most similar to the query."""
+    query_embedding = [1.0, 0.0, 1.0]
+    embeddings = [[1.0, 0.0, 0.9], [1.0, 0.0, 0.8], [0.7, 0.0, 1.0], [-1.0, 0.0, 0.0]]
+
+    # the least similar embedding is not a candidate anymore
+    _, result_ids = get_top_k_mmr_embeddings(
+        query_embedding, embeddings, mmr_threshold=0.5, candidate_top_k=3
+    )
+    assert result_ids == [0, 2, 1]
+
+    # custom similarity functions give the same results
+    result_similarities, result_ids = get_top_k_mmr_embeddings(
+        query_embedding, embeddings, mmr_threshold=0.5
+    )
+    custom_similarities, custom_ids = get_top_k_mmr_embeddings(
+        query_embedding,
+        embeddings,
+        similarity_fn=similarity,
+        mmr_threshold=0.5,
+    )
+    assert result_ids == custom_ids
+    assert np.allclose(result_similarities, custom_similarities)
@@ -1,12 +1,16 @@
 """Test response utils."""
 
 import asyncio
-from typing import List
+from typing import Any, List, Tuple
+from unittest.mock import patch
 
 from llama_index.constants import DEFAULT_CONTEXT_WINDOW, DEFAULT_NUM_OUTPUTS
 from llama_index.indices.prompt_helper import PromptHelper
 from llama_index.indices.response import ResponseMode, get_response_builder
+from llama_index.indices.query.response_synthesis import ResponseSynthesizer
+from llama_index.indices.response.compact_and_refine import CompactAndRefine
 from llama_index.indices.service_context import ServiceContext
+from llama_index.llm_predictor.base import LLMPredictor
 from llama_index.prompts.base import Prompt
 from llama_index.prompts.prompt_type import PromptType
 from llama_index.readers.schema.base import Document
@@ -105,6 +109,188 @@ def test_compact_response(mock_service_context: ServiceContext) -> None:
     assert str(response) == "What is?:This:is:a:bar:This:is:a:test"
 
 
+def test_give_response_async(
+    mock_service_context: ServiceContext,
+    documents: List[Document],
+) -> None:
+    """Test async refine, preparing the next chunk during LLM calls."""
+    prompt_helper = PromptHelper(
+        context_window=DEFAULT_CONTEXT_WINDOW, num_output=DEFAULT_NUM_OUTPUTS
+    )
+    service_context = mock_service_context
+    service_context.prompt_helper = prompt_helper
+    query_str = "What is?"
+    text_chunks = documents[0].get_text().split("\n")
+
+    builder = get_response_builder(
+        mode=ResponseMode.REFINE,
+        service_context=service_context,
+        text_qa_template=MOCK_TEXT_QA_PROMPT,
+        refine_template=MOCK_REFINE_PROMPT,
+    )
+    expected_response = builder.get_response(
+        text_chunks=text_chunks, query_str=query_str
+    )
+    response = asyncio.run(
+        builder.aget_response(text_chunks=text_chunks, query_str=query_str)
+    )
+    assert str(response) == str(expected_response)
+    assert str(response) == (
+        "What is?:"
+        "Hello world.:"
+        "This is a test.:"
+        "This is another test.:"
+        "This is a test v2."
+    )
+
+    # refine a previous response
+    response = asyncio.run(
+        builder.aget_response(
+            text_chunks=text_chunks[1:], query_str=query_str, prev_response="Hi"
+        )
+    )
+    assert str(response) == (
+        "Hi:This is a test.:This is another test.:This is a test v2."
+    )
+
+
+def test_refine_reserves_answer_tokens(patch_llm_predictor: None) -> None:
+    """Test that refine contexts leave room for the existing answer."""
+    mock_refine_prompt_tmpl = "{query_str}{existing_answer}{context_msg}"
+    mock_refine_prompt = Prompt(mock_refine_prompt_tmpl, prompt_type=PromptType.REFINE)
+    mock_qa_prompt_tmpl = "{context_str}{query_str}"
+    mock_qa_prompt = Prompt(mock_qa_prompt_tmpl, prompt_type=PromptType.QUESTION_ANSWER)
+
+    prompt_helper = PromptHelper(
+        max_input_size=16,
+        num_output=0,
+        max_chunk_overlap=0,
+        tokenizer=mock_tokenizer,
+        separator=" ",
+    )
+    # max input size is 16, prompt is two tokens (the query), 5 tokens are
+    # reserved --> padding is 5 --> 4 tokens
+    partial_refine_prompt = mock_refine_prompt.partial_format(query_str="What is?")
+    compacted_chunks = prompt_helper.repack(
+        partial_refine_prompt, ["a b c d e f g h i j"], num_extra_tokens=5
+    )
+    assert compacted_chunks == ["a b c d", "e f g h", "i j"]
+
+    service_context = ServiceContext.from_defaults(embed_model=MockEmbedding())
+    service_context.prompt_helper = prompt_helper
+    builder = get_response_builder(
+        service_context=service_context,
+        text_qa_template=mock_qa_prompt,
+        refine_template=mock_refine_prompt,
+        mode=ResponseMode.REFINE,
+    )
+    response = asyncio.run(
+        builder.aget_response(
+            text_chunks=["This is", "a b c d e f g h"], query_str="What is?"
+        )
+    )
+    # the first answer is 3 tokens, so refine contexts are at most 6 tokens
+    assert str(response) == "What is?:This is:a b c d e f:g h"
+
+
+def test_refine_repacks_first_chunk_for_refine(patch_llm_predictor: None) -> None:
+    """Test that sub-chunks of the first chunk fit in the refine prompt."""
+    mock_refine_prompt_tmpl = "{query_str} {existing_answer} {context_msg}"
+    mock_refine_prompt = Prompt(mock_refine_prompt_tmpl, prompt_type=PromptType.REFINE)
+    mock_qa_prompt_tmpl = "{context_str} {query_str}"
+    mock_qa_prompt = Prompt(mock_qa_prompt_tmpl, prompt_type=PromptType.QUESTION_ANSWER)
+    prompts: List[str] = []
+
+    def mock_predict(self: Any, prompt: Prompt, **prompt_args: Any) -> Tuple[str, str]:
+        formatted_prompt = prompt.format(**prompt_args)
+        prompts.append(formatted_prompt)
+        return " ".join(f"a{i}" for i in range(10)), formatted_prompt
+
+    async def mock_apredict(
+        self: Any, prompt: Prompt, **prompt_args: Any
+    ) -> Tuple[str, str]:
+        return mock_predict(self, prompt, **prompt_args)
+
+    prompt_helper = PromptHelper(
+        context_window=32,
+        num_output=0,
+        chunk_overlap_ratio=0.0,
+        tokenizer=mock_tokenizer,
+        separator=" ",
+    )
+    service_context = ServiceContext.from_defaults(embed_model=MockEmbedding())
+    service_context.prompt_helper = prompt_helper
+    builder = get_response_builder(
+        service_context=service_context,
+        text_qa_template=mock_qa_prompt,
+        refine_template=mock_refine_prompt,
+        mode=ResponseMode.REFINE,
+    )
+    # the first chunk is repacked into several sub-chunks for the QA prompt
+    text_chunk = " ".join(f"w{i}" for i in range(60))
+    partial_qa_prompt = mock_qa_prompt.partial_format(query_str="What is?")
+    assert len(prompt_helper.repack(partial_qa_prompt, [text_chunk])) > 1
+
+    with patch.object(LLMPredictor, "predict", mock_predict), patch.object(
+        LLMPredictor, "apredict", mock_apredict
+    ):
+        for aget in [False, True]:
+            prompts.clear()
+            if aget:
+                asyncio.run(
+                    builder.aget_response(
+                        text_chunks=[text_chunk], query_str="What is?"
+                    )
+                )
+            else:
+                builder.get_response(text_chunks=[text_chunk], query_str="What is?")
+            # every prompt fits, and the whole chunk is read
+            assert all(len(mock_tokenizer(prompt)) <= 32 for prompt in prompts)
+            words = [token for prompt in prompts for token in mock_tokenizer(prompt)]
+            assert [word for word in words if word.startswith("w")] == (
+                text_chunk.split(" ")
+            )
+
+
+def test_refine_parallel_merge(mock_service_context: ServiceContext) -> None:
+    """Test answering chunks concurrently, then merging the answers."""
+    prompt_helper = PromptHelper(
+        context_window=DEFAULT_CONTEXT_WINDOW, num_output=DEFAULT_NUM_OUTPUTS
+    )
+    service_context = mock_service_context
+    service_context.prompt_helper = prompt_helper
+    builder = get_response_builder(
+        mode=ResponseMode.REFINE,
+        service_context=service_context,
+        text_qa_template=MOCK_TEXT_QA_PROMPT,
+        refine_template=MOCK_REFINE_PROMPT,
+        parallel_merge=True,
+        max_concurrency=2,
+    )
+    response = asyncio.run(
+        builder.aget_response(
+            text_chunks=["Hello world.", "This is a test.", "This is a test v2."],
+            query_str="What is?",
+        )
+    )
+    # answers of the second and third chunks are merged into the first one
+    assert str(response) == (
+        "What is?:Hello world.:What is?:This is a test.:What is?:This is a test v2."
+    )
+
+    # the options are passed through the response synthesizer too
+    response_synthesizer = ResponseSynthesizer.from_args(
+        service_context=service_context,
+        response_mode=ResponseMode.COMPACT,
+        parallel_merge=True,
+        max_concurrency=2,
+    )
+    response_builder = response_synthesizer._response_builder
+    assert isinstance(response_builder, CompactAndRefine)
+    assert response_builder._parallel_merge
+    assert response_builder._max_concurrency == 2
+
+
 def test_accumulate_response(
     mock_service_context: ServiceContext,
     documents: List[Document],
@@ -48,6 +48,49 @@ def test_load_index_from_storage_simple(
     assert index.index_id == new_index.index_id
 
 
+def test_load_index_from_storage_lazy(
+    documents: List[Document],
+    tmp_path: Path,
+    mock_service_context: ServiceContext,
+) -> None:
+    storage_context = StorageContext.from_defaults()
+    index = VectorStoreIndex.from_documents(
+        documents=documents,
+        storage_context=storage_context,
+        service_context=mock_service_context,
+    )
+    storage_context.persist(str(tmp_path))
+
+    new_storage_context = StorageContext.from_defaults(
+        persist_dir=str(tmp_path), lazy=True
+    )
+    assert new_storage_context.load_timings == {}
+    assert isinstance(new_storage_context.docstore, SimpleDocumentStore)
+
+    new_index = load_index_from_storage(
+        new_storage_context, service_context=mock_service_context
+    )
+    assert index.index_id == new_index.index_id
+    # only the index store was needed to load the index
+    assert set(new_storage_context.load_timings) == {"index_store"}
+
+    nodes = new_index.as_retriever().retrieve("What is?")
+    assert len(nodes) > 0
+    assert "vector_store" in new_storage_context.load_timings
+
+    # persisting unchanged components back in place does not load them
+    new_storage_context.persist(str(tmp_path))
+    assert "graph_store" not in new_storage_context.load_timings
+
+    new_storage_context.warm_up()
+    assert set(new_storage_context.load_timings) == {
+        "docstore",
+        "index_store",
+        "vector_store",
+        "graph_store",
+    }
+
+
 def test_load_index_from_storage_multiple(
     nodes: List[Node],
     tmp_path: Path,
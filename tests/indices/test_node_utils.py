@@ -1,11 +1,14 @@
 """Test node utils."""
 
-from typing import List
+from itertools import islice
+from typing import List, Optional
 
 import pytest
 
+from llama_index.data_structs.node import DocumentRelationship, Node
 from llama_index.langchain_helpers.text_splitter import TokenTextSplitter
 from llama_index.node_parser.node_utils import get_nodes_from_document
+from llama_index.node_parser.simple import SimpleNodeParser
 from llama_index.readers.schema.base import Document
 
 
@@ -65,3 +68,50 @@ def test_get_nodes_from_document_with_extra_info(
         chunk_size <= text_splitter._chunk_size for chunk_size in actual_chunk_sizes
     )
     assert all(["test_key: test_val" in n.get_text() for n in nodes])
+
+
+def _check_prev_next_rel(nodes: List[Node]) -> None:
+    """Check prev/next relationships link consecutive nodes of each document."""
+    for prev_node, node in zip(nodes, nodes[1:]):
+        if prev_node.ref_doc_id != node.ref_doc_id:
+            continue
+        assert prev_node.relationships[DocumentRelationship.NEXT] == node.doc_id
+        assert node.relationships[DocumentRelationship.PREVIOUS] == prev_node.doc_id
+
+
+@pytest.mark.parametrize("num_workers", [None, 2])
+def test_simple_node_parser_parallel(
+    documents: List[Document], num_workers: Optional[int]
+) -> None:
+    """Test parallel node parsing gives the same nodes as serial parsing."""
+    many_documents = [
+        Document(
+            documents[0].get_text() * (i % 3 + 1),
+            doc_id=f"doc_{i}",
+            extra_info={"i": i},
+        )
+        for i in range(25)
+    ]
+    serial_parser = SimpleNodeParser.from_defaults(chunk_size=20, chunk_overlap=0)
+    parser = SimpleNodeParser.from_defaults(
+        chunk_size=20, chunk_overlap=0, num_workers=num_workers, batch_size=4
+    )
+
+    expected_nodes = serial_parser.get_nodes_from_documents(many_documents)
+    nodes = parser.get_nodes_from_documents(many_documents)
+    assert [
+        (node.get_text(), node.ref_doc_id, node.node_info, node.extra_info)
+        for node in nodes
+    ] == [
+        (node.get_text(), node.ref_doc_id, node.node_info, node.extra_info)
+        for node in expected_nodes
+    ]
+    _check_prev_next_rel(nodes)
+
+    # stream from a generator, stopping early
+    stream = parser.iter_nodes_from_documents(doc for doc in many_documents)
+    first_nodes = list(islice(stream, 5))
+    stream.close()
+    assert [node.get_text() for node in first_nodes] == [
+        node.get_text() for node in expected_nodes[:5]
+    ]
@@ -1,6 +1,8 @@
 """Test PromptHelper."""
 from typing import cast
 
+import pytest
+
 from llama_index.bridge.langchain import PromptTemplate as LangchainPrompt
 
 from llama_index.data_structs.node import Node
@@ -182,3 +184,16 @@ def test_get_biggest_prompt() -> None:
     lc_biggest_template = cast(LangchainPrompt, biggest_prompt.prompt).template
     prompt2_template = cast(LangchainPrompt, prompt2.prompt).template
     assert lc_biggest_template == prompt2_template
+
+
+def test_repack_token_offsets() -> None:
+    """Test repack with text cut on token offsets."""
+    pytest.importorskip("tiktoken")
+    test_prompt = Prompt("This is the prompt{text}")
+    prompt_helper = PromptHelper(
+        context_window=30, num_output=1, chunk_overlap_ratio=0, use_token_offsets=True
+    )
+    text_chunks = ["Hello world foo"] * 6
+    compacted_chunks = prompt_helper.repack(test_prompt, text_chunks)
+    assert "\n\n".join(compacted_chunks).split() == " ".join(text_chunks).split()
+    assert len(compacted_chunks) < len(text_chunks)
@@ -1,14 +1,22 @@
 """Test tree index."""
 
+import asyncio
+from pathlib import Path
 from typing import Any, Dict, List, Optional
 from unittest.mock import patch
 
+import pytest
+
 from llama_index.data_structs.data_structs import IndexGraph
 from llama_index.data_structs.node import Node
 from llama_index.indices.service_context import ServiceContext
-from llama_index.storage.docstore import BaseDocumentStore
+from llama_index.llm_predictor.base import LLMPredictor
+from llama_index.prompts.base import Prompt
+from llama_index.storage.storage_context import StorageContext
+from llama_index.storage.docstore import BaseDocumentStore, SimpleDocumentStore
 from llama_index.indices.tree.base import TreeIndex
 from llama_index.readers.schema.base import Document
+from tests.mock_utils.mock_predict import patch_llmpredictor_predict
 
 
 def _get_left_or_right_node(
@@ -134,6 +142,165 @@ def test_build_tree_multiple(
     assert nodes[3].text == "This is a test v2."
 
 
+EIGHT_LINE_DOC_TEXT = "\n".join(f"This is line {i}." for i in range(8))
+
+
+def test_build_tree_resume_from_checkpoint(
+    mock_service_context: ServiceContext,
+    struct_kwargs: Dict,
+    tmp_path: Path,
+) -> None:
+    """Test resuming an interrupted tree build from its checkpoint."""
+    index_kwargs, _ = struct_kwargs
+    storage_context = StorageContext.from_defaults()
+    checkpoint_path = str(tmp_path / "tree_checkpoint.json")
+    num_calls = 0
+
+    def flaky_predict(self: Any, prompt: Prompt, **prompt_args: Any) -> Any:
+        nonlocal num_calls
+        num_calls += 1
+        if num_calls == 5:
+            # first summary of the second level
+            raise ValueError("transient error")
+        return patch_llmpredictor_predict(self, prompt, **prompt_args)
+
+    with patch.object(LLMPredictor, "predict", flaky_predict):
+        with pytest.raises(ValueError, match="transient error"):
+            TreeIndex.from_documents(
+                [Document(EIGHT_LINE_DOC_TEXT)],
+                storage_context=storage_context,
+                service_context=mock_service_context,
+                checkpoint_path=checkpoint_path,
+                **index_kwargs,
+            )
+
+        num_calls = 0
+        # summary nodes are checked with a single bulk read
+        with patch.object(
+            SimpleDocumentStore, "document_exists", side_effect=AssertionError
+        ):
+            tree = TreeIndex.from_documents(
+                [Document(EIGHT_LINE_DOC_TEXT)],
+                storage_context=storage_context,
+                service_context=mock_service_context,
+                checkpoint_path=checkpoint_path,
+                **index_kwargs,
+            )
+    # only the second level is summarized again
+    assert num_calls == 2
+    assert len(tree.index_struct.all_nodes) == 14
+    assert len(tree.index_struct.root_nodes) == 2
+    nodes = tree.docstore.get_node_dict(tree.index_struct.all_nodes)
+    assert [nodes[i].text for i in range(8)] == EIGHT_LINE_DOC_TEXT.split("\n")
+    assert nodes[8].text == "This is line 0.\nThis is line 1."
+    assert nodes[12].text == (
+        "This is line 0.\nThis is line 1.\nThis is line 2.\nThis is line 3."
+    )
+    # children of summary nodes point to the new leaf nodes
+    assert tree.index_struct.get_children(nodes[8]) == {
+        0: nodes[0].get_doc_id(),
+        1: nodes[1].get_doc_id(),
+    }
+    # the checkpoint of a completed build is removed
+    assert not Path(checkpoint_path).exists()
+
+
+def test_build_tree_stale_checkpoint(
+    mock_service_context: ServiceContext,
+    struct_kwargs: Dict,
+    tmp_path: Path,
+) -> None:
+    """Test that checkpoints of other nodes or missing summaries are not resumed."""
+    index_kwargs, _ = struct_kwargs
+    checkpoint_path = str(tmp_path / "tree_checkpoint.json")
+    num_calls = 0
+
+    def flaky_predict(self: Any, prompt: Prompt, **prompt_args: Any) -> Any:
+        nonlocal num_calls
+        num_calls += 1
+        if num_calls == 5:
+            raise ValueError("transient error")
+        return patch_llmpredictor_predict(self, prompt, **prompt_args)
+
+    with patch.object(LLMPredictor, "predict", flaky_predict):
+        with pytest.raises(ValueError, match="transient error"):
+            TreeIndex.from_documents(
+                [Document(EIGHT_LINE_DOC_TEXT)],
+                storage_context=StorageContext.from_defaults(),
+                service_context=mock_service_context,
+                checkpoint_path=checkpoint_path,
+                **index_kwargs,
+            )
+    assert Path(checkpoint_path).exists()
+
+    # build from other nodes
+    other_text = "\n".join(f"This is other line {i}." for i in range(8))
+    tree = TreeIndex.from_documents(
+        [Document(other_text)],
+        storage_context=StorageContext.from_defaults(),
+        service_context=mock_service_context,
+        checkpoint_path=checkpoint_path,
+        **index_kwargs,
+    )
+    nodes = tree.docstore.get_node_dict(tree.index_struct.all_nodes)
+    assert [nodes[i].text for i in range(8)] == other_text.split("\n")
+    assert not Path(checkpoint_path).exists()
+
+    with patch.object(LLMPredictor, "predict", flaky_predict):
+        num_calls = 0
+        with pytest.raises(ValueError, match="transient error"):
+            TreeIndex.from_documents(
+                [Document(EIGHT_LINE_DOC_TEXT)],
+                storage_context=StorageContext.from_defaults(),
+                service_context=mock_service_context,
+                checkpoint_path=checkpoint_path,
+                **index_kwargs,
+            )
+    assert Path(checkpoint_path).exists()
+
+    # builds with new docstores, missing the checkpointed summary nodes
+    for _ in range(2):
+        tree = TreeIndex.from_documents(
+            [Document(EIGHT_LINE_DOC_TEXT)],
+            storage_context=StorageContext.from_defaults(),
+            service_context=mock_service_context,
+            checkpoint_path=checkpoint_path,
+            **index_kwargs,
+        )
+        nodes = tree.docstore.get_node_dict(tree.index_struct.all_nodes)
+        assert len(nodes) == 14
+        assert not Path(checkpoint_path).exists()
+
+
+def test_build_tree_async_max_concurrency(
+    mock_service_context: ServiceContext,
+    struct_kwargs: Dict,
+) -> None:
+    """Test that use_async summarizes at most max_concurrency nodes at once."""
+    index_kwargs, _ = struct_kwargs
+    num_running = 0
+    max_running = 0
+
+    async def slow_apredict(self: Any, prompt: Prompt, **prompt_args: Any) -> Any:
+        nonlocal num_running, max_running
+        num_running += 1
+        max_running = max(max_running, num_running)
+        await asyncio.sleep(0.01)
+        num_running -= 1
+        return patch_llmpredictor_predict(self, prompt, **prompt_args)
+
+    with patch.object(LLMPredictor, "apredict", slow_apredict):
+        tree = TreeIndex.from_documents(
+            [Document(EIGHT_LINE_DOC_TEXT)],
+            use_async=True,
+            max_concurrency=2,
+            service_context=mock_service_context,
+            **index_kwargs,
+        )
+    assert len(tree.index_struct.all_nodes) == 14
+    assert max_running == 2
+
+
 def test_insert(
     documents: List[Document],
     mock_service_context: ServiceContext,
@@ -1,3 +1,4 @@
+import asyncio
 from typing import List, cast
 from llama_index.data_structs.node import DocumentRelationship, Node
 from llama_index.indices.query.schema import QueryBundle
@@ -45,6 +46,22 @@ def test_simple_query(
     assert nodes[0].node.text == "This is another test."
 
 
+def test_simple_aquery(
+    documents: List[Document],
+    mock_service_context: ServiceContext,
+) -> None:
+    """Test async embedding query."""
+    index = VectorStoreIndex.from_documents(
+        documents, service_context=mock_service_context
+    )
+
+    query_str = "What is?"
+    retriever = index.as_retriever(similarity_top_k=1)
+    nodes = asyncio.run(retriever.aretrieve(QueryBundle(query_str)))
+    assert len(nodes) == 1
+    assert nodes[0].node.text == "This is another test."
+
+
 def test_query_and_similarity_scores(
     mock_service_context: ServiceContext,
 ) -> None:
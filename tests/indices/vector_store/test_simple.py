@@ -1,9 +1,13 @@
 """Test vector store indexes."""
 
-from typing import Any, List, cast
+from pathlib import Path
+from typing import Any, Iterator, List, cast
+
+import pytest
 from llama_index.indices.loading import load_index_from_storage
 
 
+from llama_index.data_structs.node import DocumentRelationship, Node
 from llama_index.indices.service_context import ServiceContext
 from llama_index.indices.vector_store.base import VectorStoreIndex
 
@@ -196,3 +200,115 @@ def test_simple_insert_save(
     loaded_index = load_index_from_storage(storage_context=storage_context)
     assert isinstance(loaded_index, VectorStoreIndex)
     assert index.index_struct == loaded_index.index_struct
+
+
+def test_simple_build_from_stream(
+    tmp_path: Path,
+    mock_service_context: ServiceContext,
+) -> None:
+    """Test resumable streaming build of VectorStoreIndex."""
+    texts = [
+        "Hello world.",
+        "This is a test.",
+        "This is another test.",
+        "This is a test v2.",
+        "This is a test v3.",
+    ]
+    documents = [Document(text, doc_id=f"doc_{i}") for i, text in enumerate(texts)]
+    checkpoint_path = str(tmp_path / "checkpoint.jsonl")
+    storage_context = StorageContext.from_defaults()
+
+    def crashing_stream() -> Iterator[Document]:
+        yield from documents[:3]
+        raise RuntimeError("crash")
+
+    with pytest.raises(RuntimeError):
+        VectorStoreIndex.from_documents_stream(
+            crashing_stream(),
+            storage_context=storage_context,
+            service_context=mock_service_context,
+            window_size=2,
+            checkpoint_path=checkpoint_path,
+        )
+    # only the first window was completed
+    assert len(storage_context.docstore.docs) == 2
+
+    index = VectorStoreIndex.from_documents_stream(
+        iter(documents),
+        storage_context=storage_context,
+        service_context=mock_service_context,
+        window_size=2,
+        checkpoint_path=checkpoint_path,
+    )
+    assert len(index.index_struct.nodes_dict) == 5
+    assert set(index.ref_doc_info.keys()) == {doc.doc_id for doc in documents}
+    vector_store = cast(SimpleVectorStore, index._vector_store)
+    assert len(vector_store.to_dict()["embedding_dict"]) == 5
+
+    loaded_index = load_index_from_storage(storage_context=storage_context)
+    assert loaded_index.index_struct == index.index_struct
+    # the checkpoint of a completed build is removed, so a new build with the
+    # same checkpoint path indexes every document again
+    assert not (tmp_path / "checkpoint.jsonl").exists()
+    index = VectorStoreIndex.from_documents_stream(
+        iter(documents),
+        service_context=mock_service_context,
+        window_size=2,
+        checkpoint_path=checkpoint_path,
+    )
+    assert len(index.index_struct.nodes_dict) == 5
+
+
+def test_simple_build_from_stream_nodes_across_windows(
+    tmp_path: Path,
+    mock_service_context: ServiceContext,
+) -> None:
+    """Test streaming nodes of a document that span several windows."""
+    nodes = [
+        Node(
+            text=f"This is node {i} of {ref_doc_id}.",
+            doc_id=f"{ref_doc_id}-{i}",
+            relationships={DocumentRelationship.SOURCE: ref_doc_id},
+        )
+        for ref_doc_id in ["A", "B"]
+        for i in range(3)
+    ]
+    checkpoint_path = str(tmp_path / "checkpoint.jsonl")
+    storage_context = StorageContext.from_defaults()
+
+    def crashing_stream() -> Iterator[Node]:
+        yield from nodes[:5]
+        raise RuntimeError("crash")
+
+    with pytest.raises(RuntimeError):
+        VectorStoreIndex.from_documents_stream(
+            crashing_stream(),
+            storage_context=storage_context,
+            service_context=mock_service_context,
+            window_size=2,
+            checkpoint_path=checkpoint_path,
+        )
+    # the first two windows were completed, across documents A and B
+    assert len(storage_context.docstore.docs) == 4
+
+    index = VectorStoreIndex.from_documents_stream(
+        iter(nodes),
+        storage_context=storage_context,
+        service_context=mock_service_context,
+        window_size=2,
+        checkpoint_path=checkpoint_path,
+    )
+    assert set(index.index_struct.nodes_dict.values()) == {
+        node.get_doc_id() for node in nodes
+    }
+    vector_store = cast(SimpleVectorStore, index._vector_store)
+    assert len(vector_store.to_dict()["embedding_dict"]) == 6
+
+    # without resuming, a new build with a checkpoint indexes every node
+    index = VectorStoreIndex.from_documents_stream(
+        iter(nodes),
+        service_context=mock_service_context,
+        window_size=2,
+        checkpoint_path=str(tmp_path / "new_checkpoint.jsonl"),
+    )
+    assert len(index.index_struct.nodes_dict) == 6
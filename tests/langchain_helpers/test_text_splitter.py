@@ -1,9 +1,18 @@
 """Test text splitter."""
+from typing import List
+
+import pytest
+
 from llama_index.langchain_helpers.text_splitter import (
     SentenceSplitter,
     TokenTextSplitter,
 )
 
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None  # type: ignore
+
 
 def test_split_token() -> None:
     """Test split normal token."""
@@ -85,3 +94,79 @@ def test_split_diff_sentence_token2() -> None:
     assert token_split[1] == " ".join(["bar"] * 11)
     assert sentence_split[0] == " ".join(["foo"] * 15) + "."
     assert sentence_split[1] == " ".join(["bar"] * 15)
+
+
+def test_split_tokenizes_splits_once() -> None:
+    """Test that every split is tokenized once, besides whole chunks."""
+    tokenized = []
+
+    def tokenizer(text: str) -> List[str]:
+        tokenized.append(text)
+        return text.split(" ")
+
+    text = " ".join(f"word{i}" for i in range(100))
+    text_splitter = TokenTextSplitter(
+        chunk_size=10, chunk_overlap=3, tokenizer=tokenizer
+    )
+    chunks = text_splitter.split_text(text)
+    assert chunks[0] == " ".join(f"word{i}" for i in range(10))
+    assert chunks[1] == " ".join(f"word{i}" for i in range(7, 17))
+    single_words = [text for text in tokenized if " " not in text]
+    assert len(single_words) == len(set(single_words)) == 100
+
+
+@pytest.mark.skipif(tiktoken is None, reason="tiktoken not installed")
+def test_split_token_offsets() -> None:
+    """Test splitting on the token offsets of the whole text."""
+    text_splitter = TokenTextSplitter(
+        chunk_size=2, chunk_overlap=1, use_token_offsets=True
+    )
+    chunks = text_splitter.split_text("foo bar hello world")
+    assert chunks == ["foo bar", "bar hello", "hello world"]
+
+    text = " ".join(f"word{i}" if i % 7 else "naïve wörld" for i in range(500))
+    text_splitter = TokenTextSplitter(
+        chunk_size=50, chunk_overlap=10, use_token_offsets=True
+    )
+    text_splits = text_splitter.split_text_with_overlaps(text)
+    tokenizer = text_splitter.tokenizer
+    assert all(len(tokenizer(split.text_chunk)) <= 50 for split in text_splits)
+    # chunks are cut on words, overlap their predecessor, and cover the text
+    prev_end = -1
+    for split in text_splits:
+        assert split.num_char_overlap is not None
+        if split.num_char_overlap > 0:
+            start = prev_end - split.num_char_overlap
+        else:
+            start = prev_end + 1
+        assert text[start : start + len(split.text_chunk)] == split.text_chunk
+        assert start == 0 or text[start - 1] == " "
+        prev_end = start + len(split.text_chunk)
+    assert prev_end == len(text)
+
+    assert text_splitter.truncate_text(text) == text_splits[0].text_chunk
+    assert text_splitter.truncate_text("foo bar") == "foo bar"
+
+
+def test_split_token_offsets_non_ascii() -> None:
+    """Test that chunks cut inside multi-byte characters fit the chunk size."""
+    texts = [
+        "日本語のテキストを分割します。東京都は日本の首都です。" * 40,
+        " ".join(["élève naïve façade Ωμέγα кириллица 😀🚀"] * 60),
+    ]
+    for text in texts:
+        for chunk_size in [7, 16, 31]:
+            text_splitter = TokenTextSplitter(
+                chunk_size=chunk_size, chunk_overlap=3, use_token_offsets=True
+            )
+            tokenizer = text_splitter.tokenizer
+            chunks = text_splitter.split_text(text)
+            assert all(len(tokenizer(chunk)) <= chunk_size for chunk in chunks)
+            assert len(tokenizer(text_splitter.truncate_text(text))) <= chunk_size
+
+
+def test_split_token_offsets_requires_tiktoken() -> None:
+    with pytest.raises(ValueError):
+        TokenTextSplitter(
+            tokenizer=lambda text: text.split(" "), use_token_offsets=True
+        )
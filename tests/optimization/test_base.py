@@ -1,11 +1,14 @@
 """Test optimization."""
 
+from pathlib import Path
 from typing import Any, List
 from unittest.mock import patch
 
+from llama_index.data_structs.node import Node
 from llama_index.embeddings.openai import OpenAIEmbedding
 from llama_index.indices.query.schema import QueryBundle
 from llama_index.optimization.optimizer import SentenceEmbeddingOptimizer
+from llama_index.optimization.sentence_embedding_cache import SentenceEmbeddingCache
 
 
 def mock_tokenizer_fn(text: str) -> List[str]:
@@ -75,3 +78,101 @@ def test_optimizer(_mock_embeds: Any, _mock_embed: Any) -> None:
     orig_txt = "hello,world,foo,bar"
     optimized_txt = optimizer.optimize(query, orig_txt)
     assert optimized_txt == "foo"
+
+
+@patch.object(
+    OpenAIEmbedding, "_get_text_embeddings", side_effect=mock_get_text_embeddings
+)
+def test_optimizer_sentence_cache(mock_embeds: Any, tmp_path: Path) -> None:
+    """Test optimizer with cached sentence embeddings."""
+    sentence_cache = SentenceEmbeddingCache()
+    optimizer = SentenceEmbeddingOptimizer(
+        tokenizer_fn=mock_tokenizer_fn,
+        threshold_cutoff=0.3,
+        sentence_cache=sentence_cache,
+    )
+    optimizer.precompute([Node("hello world foo"), Node("bar abc")])
+    assert mock_embeds.call_count == 1
+    assert len(sentence_cache) == 2
+
+    query = QueryBundle(query_str="world", embedding=[0, 1, 0, 0, 0])
+    assert optimizer.optimize(query, "hello world foo") == "world"
+    query = QueryBundle(query_str="abc", embedding=[0, 0, 0, 0, 1])
+    assert optimizer.optimize(query, "bar abc") == "abc"
+    assert mock_embeds.call_count == 1
+    assert sentence_cache.cache_hits == 2
+
+    # cache persisted, and loaded in another optimizer
+    persist_path = str(tmp_path / "sentence_cache.json")
+    sentence_cache.persist(persist_path)
+    optimizer = SentenceEmbeddingOptimizer(
+        tokenizer_fn=mock_tokenizer_fn,
+        threshold_cutoff=0.3,
+        sentence_cache=SentenceEmbeddingCache.from_persist_path(persist_path),
+    )
+    query = QueryBundle(query_str="foo", embedding=[0, 0, 1, 0, 0])
+    assert optimizer.optimize(query, "hello world foo") == "foo"
+    assert mock_embeds.call_count == 1
+
+
+@patch.object(
+    OpenAIEmbedding, "_get_text_embeddings", side_effect=mock_get_text_embeddings
+)
+def test_optimizer_sentence_cache_namespace(mock_embeds: Any) -> None:
+    """Test that cached sentences are not shared across models and tokenizers."""
+    sentence_cache = SentenceEmbeddingCache()
+    SentenceEmbeddingOptimizer(
+        tokenizer_fn=mock_tokenizer_fn, sentence_cache=sentence_cache
+    ).precompute([Node("hello")])
+    assert len(sentence_cache) == 1
+
+    SentenceEmbeddingOptimizer(
+        tokenizer_fn=mock_tokenizer_fn2, sentence_cache=sentence_cache
+    ).precompute([Node("hello")])
+    assert len(sentence_cache) == 2
+
+    SentenceEmbeddingOptimizer(
+        embed_model=OpenAIEmbedding(deployment_name="other"),
+        tokenizer_fn=mock_tokenizer_fn,
+        sentence_cache=sentence_cache,
+    ).precompute([Node("hello")])
+    assert len(sentence_cache) == 3
+    assert sentence_cache.cache_hits == 0
+
+    SentenceEmbeddingOptimizer(
+        tokenizer_fn=mock_tokenizer_fn, sentence_cache=sentence_cache
+    ).precompute([Node("hello")])
+    assert sentence_cache.cache_hits == 1
+    assert mock_embeds.call_count == 3
+
+
+@patch.object(
+    OpenAIEmbedding, "_get_text_embeddings", side_effect=mock_get_text_embeddings
+)
+def test_optimizer_token_budget(_mock_embeds: Any) -> None:
+    """Test that the token budget keeps the most similar sentences, in order."""
+    optimizer = SentenceEmbeddingOptimizer(
+        tokenizer_fn=mock_tokenizer_fn, token_budget=2
+    )
+    query = QueryBundle(query_str="abc hello", embedding=[0.6, 0, 0.2, 0, 0.8])
+    orig_txt = "hello world foo bar abc"
+    optimized_txt = optimizer.optimize(query, orig_txt)
+    assert optimized_txt == "hello abc"
+
+
+def mock_negative_similarity(embedding1: Any, embedding2: Any, **kwargs: Any) -> float:
+    """Mock similarity override, ranking the least similar sentences first."""
+    return -float(sum(a * b for a, b in zip(embedding1, embedding2)))
+
+
+@patch.object(OpenAIEmbedding, "similarity", side_effect=mock_negative_similarity)
+@patch.object(
+    OpenAIEmbedding, "_get_text_embeddings", side_effect=mock_get_text_embeddings
+)
+def test_optimizer_similarity_override(_mock_embeds: Any, _mock_sim: Any) -> None:
+    """Test that the similarity of the embed model is used."""
+    optimizer = SentenceEmbeddingOptimizer(
+        tokenizer_fn=mock_tokenizer_fn, percentile_cutoff=0.5
+    )
+    query = QueryBundle(query_str="hello", embedding=[1, 0, 0, 0, 0])
+    assert optimizer.optimize(query, "hello world") == "world"
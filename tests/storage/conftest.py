@@ -1,7 +1,7 @@
 import pytest
 from llama_index.storage.kvstore.mongodb_kvstore import MongoDBKVStore
 from llama_index.storage.kvstore.simple_kvstore import SimpleKVStore
-from tests.storage.kvstore.mock_mongodb import MockMongoClient
+from tests.storage.kvstore.mock_mongodb import MockAsyncMongoClient, MockMongoClient
 
 
 @pytest.fixture()
@@ -14,6 +14,14 @@ def mongo_kvstore(mongo_client: MockMongoClient) -> MongoDBKVStore:
     return MongoDBKVStore(mongo_client=mongo_client)  # type: ignore
 
 
+@pytest.fixture()
+def async_mongo_kvstore(mongo_client: MockMongoClient) -> MongoDBKVStore:
+    return MongoDBKVStore(
+        mongo_client=mongo_client,
+        async_mongo_client=MockAsyncMongoClient(mongo_client),
+    )
+
+
 @pytest.fixture()
 def simple_kvstore() -> SimpleKVStore:
     return SimpleKVStore()
@@ -0,0 +1,132 @@
+"""Test caching docstore."""
+import asyncio
+from typing import Any, Callable, List, Optional, Sequence
+
+from llama_index.callbacks.base import CallbackManager
+from llama_index.callbacks.llama_debug import LlamaDebugHandler
+from llama_index.callbacks.schema import CBEventType, EventPayload
+from llama_index.data_structs.node import DocumentRelationship, Node
+from llama_index.schema import BaseDocument
+from llama_index.storage.docstore import CachedDocumentStore, SimpleDocumentStore
+
+
+def _get_nodes() -> List[Node]:
+    return [
+        Node(
+            f"node {i}",
+            doc_id=f"n{i}",
+            relationships={DocumentRelationship.SOURCE: "d1"},
+        )
+        for i in range(3)
+    ]
+
+
+def test_cached_docstore() -> None:
+    nodes = _get_nodes()
+    docstore = SimpleDocumentStore()
+    docstore.add_documents(nodes)
+    llama_debug = LlamaDebugHandler()
+    cached_docstore = CachedDocumentStore(
+        docstore, callback_manager=CallbackManager([llama_debug])
+    )
+
+    assert cached_docstore.get_nodes(["n0", "n1"]) == nodes[:2]
+    assert cached_docstore.get_nodes(["n1", "n2"]) == nodes[1:]
+    assert cached_docstore.get_node("n2") == nodes[2]
+    assert cached_docstore.get_node_dict({0: "n0"}) == {0: nodes[0]}
+    assert cached_docstore.cache_hits == 3
+    assert cached_docstore.cache_misses == 3
+    assert cached_docstore.hit_rate == 0.5
+
+    events = llama_debug.get_event_pairs(CBEventType.DOCSTORE)
+    assert [event[1].payload[EventPayload.CACHE_HITS] for event in events] == [
+        0,
+        1,
+        1,
+        1,
+    ]
+
+
+def test_cached_docstore_invalidation() -> None:
+    nodes = _get_nodes()
+    cached_docstore = CachedDocumentStore(SimpleDocumentStore())
+    cached_docstore.add_documents(nodes)
+    cached_docstore.get_nodes(["n0", "n1", "n2"])
+
+    # writes go through to the wrapped store and invalidate the cache
+    new_node = Node("new text", doc_id="n0")
+    cached_docstore.add_documents([new_node])
+    assert cached_docstore.get_node("n0") == new_node
+
+    cached_docstore.delete_document("n1")
+    assert not cached_docstore.document_exists("n1")
+
+    cached_docstore.delete_ref_doc("d1")
+    assert not cached_docstore.document_exists("n2")
+
+
+class RacingDocumentStore(SimpleDocumentStore):
+    """Document store running a callback just before each write."""
+
+    on_write: Optional[Callable[[], Any]] = None
+
+    def add_documents(
+        self, docs: Sequence[BaseDocument], allow_update: bool = True
+    ) -> None:
+        if self.on_write is not None:
+            self.on_write()
+        super().add_documents(docs, allow_update=allow_update)
+
+
+def test_cached_docstore_invalidation_race() -> None:
+    nodes = _get_nodes()
+    docstore = RacingDocumentStore()
+    cached_docstore = CachedDocumentStore(docstore)
+    cached_docstore.add_documents(nodes)
+
+    # a read during the wrapped write caches the old node
+    docstore.on_write = lambda: cached_docstore.get_node("n0")
+    new_node = Node("new text", doc_id="n0")
+    cached_docstore.add_documents([new_node])
+    assert cached_docstore.get_node("n0") == new_node
+
+
+def test_cached_docstore_lru_and_ttl() -> None:
+    nodes = _get_nodes()
+    docstore = SimpleDocumentStore()
+    docstore.add_documents(nodes)
+    now = 0.0
+    cached_docstore = CachedDocumentStore(
+        docstore, max_size=2, ttl=10.0, clock=lambda: now
+    )
+
+    cached_docstore.get_nodes(["n0", "n1", "n2"])
+    # n0 was evicted
+    cached_docstore.get_nodes(["n0"])
+    assert cached_docstore.cache_misses == 4
+
+    cached_docstore.get_nodes(["n0"])
+    assert cached_docstore.cache_hits == 1
+
+    # cached nodes expire after the ttl
+    now = 20.0
+    cached_docstore.get_nodes(["n0"])
+    assert cached_docstore.cache_misses == 5
+
+    # expired entries do not answer existence checks
+    docstore.delete_document("n0")
+    assert cached_docstore.document_exists("n0")
+    now = 40.0
+    assert not cached_docstore.document_exists("n0")
+
+
+def test_cached_docstore_async() -> None:
+    nodes = _get_nodes()
+    cached_docstore = CachedDocumentStore(SimpleDocumentStore())
+    asyncio.run(cached_docstore.aadd_documents(nodes))
+    assert asyncio.run(cached_docstore.aget_nodes(["n0", "n1"])) == nodes[:2]
+    assert asyncio.run(cached_docstore.aget_nodes(["n1"])) == nodes[1:2]
+    assert cached_docstore.cache_hits == 1
+
+    asyncio.run(cached_docstore.adelete_ref_doc("d1"))
+    assert not cached_docstore.document_exists("n1")
@@ -1,9 +1,9 @@
 """Test docstore."""
 
-
+import asyncio
 from pathlib import Path
 import pytest
-from llama_index.data_structs.node import Node
+from llama_index.data_structs.node import DocumentRelationship, Node
 from llama_index.storage.docstore import SimpleDocumentStore
 from llama_index.readers.schema.base import Document
 from llama_index.storage.kvstore.simple_kvstore import SimpleKVStore
@@ -62,3 +62,62 @@ def test_docstore_dict() -> None:
     assert gd1 == doc
     gd2 = new_docstore.get_document("d2")
     assert gd2 == node
+
+
+def test_docstore_get_nodes(simple_docstore: SimpleDocumentStore) -> None:
+    nodes = [
+        Node(
+            f"node {i}",
+            doc_id=f"n{i}",
+            relationships={DocumentRelationship.SOURCE: "d1"},
+        )
+        for i in range(3)
+    ]
+    simple_docstore.add_documents(nodes)
+    assert simple_docstore.get_nodes(["n2", "n0"]) == [nodes[2], nodes[0]]
+    assert simple_docstore.get_node_dict({1: "n1", 0: "n0"}) == {
+        1: nodes[1],
+        0: nodes[0],
+    }
+    with pytest.raises(ValueError):
+        simple_docstore.get_nodes(["n0", "missing"])
+
+    simple_docstore.delete_ref_doc("d1")
+    assert simple_docstore.docs == {}
+
+
+def test_docstore_ref_doc_info(simple_docstore: SimpleDocumentStore) -> None:
+    nodes = [
+        Node(
+            f"node {i}",
+            doc_id=f"n{i}",
+            relationships={DocumentRelationship.SOURCE: "d1"},
+            extra_info={"foo": "bar"} if i > 0 else None,
+        )
+        for i in range(3)
+    ]
+    simple_docstore.add_documents(nodes[:2])
+    # re-added nodes are only listed once
+    simple_docstore.add_documents(nodes[1:])
+
+    ref_doc_info = simple_docstore.get_ref_doc_info("d1")
+    assert ref_doc_info is not None
+    assert ref_doc_info.doc_ids == ["n0", "n1", "n2"]
+    assert ref_doc_info.extra_info == {"foo": "bar"}
+
+    with pytest.raises(ValueError):
+        simple_docstore.add_documents(nodes[:1], allow_update=False)
+
+
+def test_docstore_async(simple_docstore: SimpleDocumentStore) -> None:
+    node = Node(
+        "my node", doc_id="n0", relationships={DocumentRelationship.SOURCE: "d1"}
+    )
+    asyncio.run(simple_docstore.aadd_documents([node]))
+    assert simple_docstore.get_node("n0") == node
+    assert asyncio.run(simple_docstore.aget_nodes(["n0"])) == [node]
+    assert asyncio.run(simple_docstore.aget_document_hash("n0")) == node.get_doc_hash()
+
+    asyncio.run(simple_docstore.adelete_ref_doc("d1"))
+    assert not simple_docstore.ref_doc_exists("d1")
+    assert not simple_docstore.document_exists("n0")
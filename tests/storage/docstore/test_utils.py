@@ -0,0 +1,85 @@
+from typing import List
+
+import pytest
+
+from llama_index.constants import DATA_KEY, TYPE_KEY
+from llama_index.data_structs.node import (
+    DocumentRelationship,
+    ImageNode,
+    IndexNode,
+    Node,
+)
+from llama_index.readers.schema.base import Document
+from llama_index.schema import BaseDocument
+from llama_index.storage.docstore.utils import (
+    bytes_to_doc,
+    doc_to_bytes,
+    doc_to_json,
+    json_to_doc,
+)
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None  # type: ignore
+
+
+@pytest.fixture
+def docs() -> List[BaseDocument]:
+    return [
+        Document("hello world", doc_id="d1", extra_info={"file_name": "a.txt"}),
+        Node(
+            "node text",
+            doc_id="n1",
+            embedding=[0.5, -1.25, 2.0],
+            extra_info={"page": 1},
+            relationships={
+                DocumentRelationship.SOURCE: "d1",
+                DocumentRelationship.CHILD: ["n2", "n3"],
+            },
+        ),
+        ImageNode("caption", doc_id="i1", image="aW1hZ2U="),
+        IndexNode("summary", doc_id="x1", index_id="index_1"),
+    ]
+
+
+def test_doc_to_json_matches_dataclasses_json(docs: List[BaseDocument]) -> None:
+    for doc in docs:
+        doc_dict = doc_to_json(doc)
+        assert doc_dict[TYPE_KEY] == doc.get_type()
+        assert doc_dict[DATA_KEY] == doc.to_dict()
+
+
+def test_json_to_doc_roundtrip(docs: List[BaseDocument]) -> None:
+    for doc in docs:
+        doc_dict = doc_to_json(doc)
+        new_doc = json_to_doc(doc_dict)
+        assert new_doc == doc
+        assert type(new_doc) is type(doc)
+
+        # previously stored data is still readable
+        legacy_dict = {DATA_KEY: doc.to_dict(), TYPE_KEY: doc.get_type()}
+        assert json_to_doc(legacy_dict) == doc
+
+
+def test_json_to_doc_does_not_alias_stored_data(docs: List[BaseDocument]) -> None:
+    doc_dict = doc_to_json(docs[1])
+    node = json_to_doc(doc_dict)
+    assert node.embedding is not None
+    node.embedding.append(0.0)
+    node.extra_info["page"] = 2  # type: ignore
+    assert doc_dict[DATA_KEY]["embedding"] == [0.5, -1.25, 2.0]
+    assert doc_dict[DATA_KEY]["extra_info"] == {"page": 1}
+
+
+def test_json_to_doc_unknown_type() -> None:
+    with pytest.raises(ValueError):
+        json_to_doc({DATA_KEY: {}, TYPE_KEY: "unknown"})
+
+
+@pytest.mark.skipif(msgpack is None, reason="msgpack not installed")
+def test_bytes_roundtrip(docs: List[BaseDocument]) -> None:
+    for doc in docs:
+        new_doc = bytes_to_doc(doc_to_bytes(doc))
+        assert new_doc == doc
+        assert type(new_doc) is type(doc)
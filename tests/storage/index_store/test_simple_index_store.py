@@ -1,3 +1,5 @@
+import asyncio
+
 from llama_index.data_structs.data_structs import IndexGraph
 from llama_index.storage.index_store.simple_index_store import SimpleIndexStore
 
@@ -15,3 +17,13 @@ def test_simple_index_store_dict() -> None:
 
     # test
     assert loaded_index_store.get_index_struct(index_struct.index_id) == index_struct
+
+
+def test_simple_index_store_async() -> None:
+    index_struct = IndexGraph()
+    index_store = SimpleIndexStore()
+    asyncio.run(index_store.aadd_index_struct(index_struct))
+    assert asyncio.run(index_store.aget_index_struct()) == index_struct
+
+    asyncio.run(index_store.adelete_index_struct(index_struct.index_id))
+    assert asyncio.run(index_store.aindex_structs()) == []
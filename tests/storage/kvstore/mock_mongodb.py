@@ -1,23 +1,35 @@
 from collections import defaultdict
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 from unittest.mock import Mock
 import uuid
 
 
+def _matches(data: dict, filter: Optional[dict]) -> bool:
+    if filter is None:
+        return True
+    for key, val in filter.items():
+        if isinstance(val, dict) and "$in" in val:
+            if data[key] not in val["$in"]:
+                return False
+        elif data[key] != val:
+            return False
+    return True
+
+
 class MockMongoCollection:
     def __init__(self) -> None:
         self._data: Dict[str, dict] = {}
 
     def find_one(self, filter: dict) -> Optional[dict]:
         for data in self._data.values():
-            if filter is None or all(data[key] == val for key, val in filter.items()):
+            if _matches(data, filter):
                 return data.copy()
         return None
 
     def find(self, filter: Optional[dict] = None) -> List[dict]:
         data_list = []
         for data in self._data.values():
-            if filter is None or all(data[key] == val for key, val in filter.items()):
+            if _matches(data, filter):
                 data_list.append(data.copy())
         return data_list
 
@@ -30,6 +42,21 @@ class MockMongoCollection:
         delete_result.deleted_count = 1 if matched else 0
         return delete_result
 
+    def delete_many(self, filter: dict) -> Any:
+        matched = self.find(filter)
+        for data in matched:
+            del self._data[data["_id"]]
+
+        delete_result = Mock()
+        delete_result.deleted_count = len(matched)
+        return delete_result
+
+    def bulk_write(self, requests: List[Any], ordered: bool = True) -> Any:
+        # NOTE: only supports ReplaceOne requests
+        for request in requests:
+            self.replace_one(request._filter, request._doc, upsert=request._upsert)
+        return Mock()
+
     def replace_one(self, filter: dict, obj: dict, upsert: bool = False) -> Any:
         matched = self.find_one(filter)
         if matched is not None:
@@ -85,3 +112,58 @@ class MockMongoClient:
     def __getitem__(self, db: str) -> MockMongoDB:
         del db
         return self._db
+
+
+class MockAsyncCursor:
+    def __init__(self, data_list: List[dict]) -> None:
+        self._data_list = data_list
+
+    def __aiter__(self) -> AsyncIterator[dict]:
+        return self._iter()
+
+    async def _iter(self) -> AsyncIterator[dict]:
+        for data in self._data_list:
+            yield data
+
+
+class MockAsyncMongoCollection:
+    """Async (motor-like) wrapper of a MockMongoCollection."""
+
+    def __init__(self, collection: MockMongoCollection) -> None:
+        self._collection = collection
+
+    async def find_one(self, filter: dict) -> Optional[dict]:
+        return self._collection.find_one(filter)
+
+    def find(self, filter: Optional[dict] = None) -> MockAsyncCursor:
+        return MockAsyncCursor(self._collection.find(filter))
+
+    async def replace_one(self, filter: dict, obj: dict, upsert: bool = False) -> Any:
+        return self._collection.replace_one(filter, obj, upsert=upsert)
+
+    async def bulk_write(self, requests: List[Any], ordered: bool = True) -> Any:
+        return self._collection.bulk_write(requests, ordered=ordered)
+
+    async def delete_one(self, filter: dict) -> Any:
+        return self._collection.delete_one(filter)
+
+    async def delete_many(self, filter: dict) -> Any:
+        return self._collection.delete_many(filter)
+
+
+class MockAsyncMongoDB:
+    def __init__(self, db: MockMongoDB) -> None:
+        self._db = db
+
+    def __getitem__(self, collection: str) -> MockAsyncMongoCollection:
+        return MockAsyncMongoCollection(self._db[collection])
+
+
+class MockAsyncMongoClient:
+    """Async client sharing the data of a MockMongoClient."""
+
+    def __init__(self, client: MockMongoClient) -> None:
+        self._client = client
+
+    def __getitem__(self, db: str) -> MockAsyncMongoDB:
+        return MockAsyncMongoDB(self._client[db])
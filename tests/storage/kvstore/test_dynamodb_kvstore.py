@@ -107,3 +107,50 @@ def test_get_all(kvstore_from_mocked_table: DynamoDBKVStore) -> None:
 
     items = kvstore_from_mocked_table.get_all()
     assert items == {test_key_a: test_item_a, test_key_b: test_item_b}
+
+
+@pytest.mark.skipif(not has_boto_libs, reason="boto3 and/or moto not installed")
+def test_bulk(kvstore_from_mocked_table: DynamoDBKVStore) -> None:
+    kvstore = kvstore_from_mocked_table
+    kvstore.put_all([("a", {"val": 1.5}), ("b", {"val": 2}), ("c", {"val": 3})])
+    assert kvstore.get_many(["a", "c", "missing"]) == {
+        "a": {"val": 1.5},
+        "c": {"val": 3},
+    }
+
+    kvstore.delete_many(["a", "b", "missing"])
+    assert kvstore.get_all() == {"c": {"val": 3}}
+
+
+@pytest.mark.skipif(not has_boto_libs, reason="boto3 and/or moto not installed")
+def test_get_many_unprocessed_keys(
+    kvstore_from_mocked_table: DynamoDBKVStore, monkeypatch: MonkeyPatch
+) -> None:
+    kvstore = kvstore_from_mocked_table
+    kvstore.put_all([("a", {"val": 1}), ("b", {"val": 2})])
+
+    client = kvstore._table.meta.client
+    batch_get_item = client.batch_get_item
+    calls = []
+
+    def throttled_batch_get_item(RequestItems: dict) -> dict:
+        calls.append(RequestItems)
+        if len(calls) < 3:
+            return {"Responses": {}, "UnprocessedKeys": RequestItems}
+        return batch_get_item(RequestItems=RequestItems)
+
+    sleeps: list = []
+    monkeypatch.setattr(client, "batch_get_item", throttled_batch_get_item)
+    monkeypatch.setattr(
+        "llama_index.storage.kvstore.dynamodb_kvstore.time.sleep", sleeps.append
+    )
+    assert kvstore.get_many(["a", "b"]) == {"a": {"val": 1}, "b": {"val": 2}}
+    assert len(calls) == 3
+    assert sleeps == [0.5, 1.0]
+
+    def always_throttled(RequestItems: dict) -> dict:
+        return {"Responses": {}, "UnprocessedKeys": RequestItems}
+
+    monkeypatch.setattr(client, "batch_get_item", always_throttled)
+    with pytest.raises(ValueError, match="unprocessed"):
+        kvstore.get_many(["a"])
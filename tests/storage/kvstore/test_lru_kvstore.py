@@ -0,0 +1,40 @@
+import asyncio
+
+from llama_index.storage.kvstore.lru_kvstore import LRUKVStore
+
+
+def test_lru_kvstore_eviction() -> None:
+    kvstore = LRUKVStore(max_size=2)
+    kvstore.put("a", {"val": 1})
+    kvstore.put("b", {"val": 2})
+    assert kvstore.get("a") == {"val": 1}
+
+    # "b" is the least recently used key
+    kvstore.put("c", {"val": 3})
+    assert kvstore.get("b") is None
+    assert kvstore.get_all() == {"a": {"val": 1}, "c": {"val": 3}}
+
+    # collections are bounded separately
+    kvstore.put("a", {"val": 4}, collection="other")
+    assert kvstore.get("a") == {"val": 1}
+    assert kvstore.delete("a")
+    assert not kvstore.delete("a")
+
+
+def test_lru_kvstore_async_concurrent() -> None:
+    """Test concurrent async operations, which run in a thread pool."""
+    kvstore = LRUKVStore(max_size=50)
+
+    async def worker(i: int) -> None:
+        for j in range(200):
+            key = f"key_{(i * j) % 80}"
+            await kvstore.aput(key, {"val": j})
+            await kvstore.aget(key)
+            if j % 7 == 0:
+                await kvstore.adelete(key)
+
+    async def run_workers() -> None:
+        await asyncio.gather(*[worker(i) for i in range(8)])
+
+    asyncio.run(run_workers())
+    assert len(kvstore.get_all()) <= 50
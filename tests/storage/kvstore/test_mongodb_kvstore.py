@@ -1,5 +1,10 @@
+import asyncio
+from typing import Any
+
 import pytest
+from pytest import MonkeyPatch
 from llama_index.storage.kvstore.mongodb_kvstore import MongoDBKVStore
+from tests.storage.kvstore.mock_mongodb import MockMongoClient
 
 try:
     from pymongo import MongoClient
@@ -25,3 +30,65 @@ def test_kvstore_basic(mongo_kvstore: MongoDBKVStore) -> None:
 
     blob = mongo_kvstore.get(test_key, collection="non_existent")
     assert blob is None
+
+
+@pytest.mark.skipif(MongoClient is None, reason="pymongo not installed")
+def test_kvstore_bulk(mongo_kvstore: MongoDBKVStore) -> None:
+    mongo_kvstore.put_all([("a", {"val": 1}), ("b", {"val": 2}), ("c", {"val": 3})])
+    assert mongo_kvstore.get_many(["a", "c", "missing"]) == {
+        "a": {"val": 1},
+        "c": {"val": 3},
+    }
+
+    mongo_kvstore.delete_many(["a", "b", "missing"])
+    assert mongo_kvstore.get_all() == {"c": {"val": 3}}
+
+
+async def _check_async_kvstore(kvstore: MongoDBKVStore) -> None:
+    await kvstore.aput("a", {"val": 1})
+    assert await kvstore.aget("a") == {"val": 1}
+    assert await kvstore.aget("a", collection="non_existent") is None
+
+    await kvstore.aput_all([("b", {"val": 2}), ("c", {"val": 3})])
+    assert await kvstore.aget_many(["a", "c", "missing"]) == {
+        "a": {"val": 1},
+        "c": {"val": 3},
+    }
+
+    assert await kvstore.adelete("a")
+    await kvstore.adelete_many(["b", "missing"])
+    assert await kvstore.aget_all() == {"c": {"val": 3}}
+
+
+@pytest.mark.skipif(MongoClient is None, reason="pymongo not installed")
+def test_kvstore_async(
+    mongo_kvstore: MongoDBKVStore, async_mongo_kvstore: MongoDBKVStore
+) -> None:
+    # without an async client, async methods run in a thread
+    asyncio.run(_check_async_kvstore(mongo_kvstore))
+    asyncio.run(_check_async_kvstore(async_mongo_kvstore))
+
+
+@pytest.mark.skipif(MongoClient is None, reason="pymongo not installed")
+def test_kvstore_motor_opt_in(monkeypatch: MonkeyPatch) -> None:
+    motor_args = []
+
+    def mock_motor_client(*args: Any) -> MockMongoClient:
+        motor_args.append(args)
+        return MockMongoClient()
+
+    monkeypatch.setattr("pymongo.MongoClient", MockMongoClient)
+    monkeypatch.setattr(
+        "llama_index.storage.kvstore.mongodb_kvstore._get_async_mongo_client",
+        mock_motor_client,
+    )
+
+    # async methods fall back to a thread pool unless motor is requested
+    assert MongoDBKVStore.from_uri("mongodb://test")._adb is None
+    assert MongoDBKVStore.from_host_and_port("test", 27017)._adb is None
+    assert motor_args == []
+
+    assert MongoDBKVStore.from_uri("mongodb://test", use_motor=True)._adb is not None
+    kvstore = MongoDBKVStore.from_host_and_port("test", 27017, use_motor=True)
+    assert kvstore._adb is not None
+    assert motor_args == [("mongodb://test",), ("test", 27017)]
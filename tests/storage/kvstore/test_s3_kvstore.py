@@ -87,3 +87,58 @@ def test_get_all(kvstore_from_mocked_bucket: S3DBKVStore) -> None:
     blobs = kvstore_from_mocked_bucket.get_all()
 
     assert blobs == {test_key_a: test_blob_a, test_key_b: test_blob_b}
+
+
+@pytest.mark.skipif(not has_boto_libs, reason="boto3 and/or moto not installed")
+def test_bulk(kvstore_from_mocked_bucket: S3DBKVStore) -> None:
+    kvstore = kvstore_from_mocked_bucket
+    kvstore.put_all([("a", {"val": 1}), ("b", {"val": 2}), ("c", {"val": 3})])
+    assert kvstore.get_many(["a", "c", "missing"]) == {
+        "a": {"val": 1},
+        "c": {"val": 3},
+    }
+
+    kvstore.delete_many(["a", "b", "missing"])
+    assert kvstore.get_all() == {"c": {"val": 3}}
+
+
+@pytest.mark.skipif(not has_boto_libs, reason="boto3 and/or moto not installed")
+def test_get_all_other_collection(kvstore_from_mocked_bucket: S3DBKVStore) -> None:
+    kvstore = kvstore_from_mocked_bucket
+    kvstore.put("a", {"val": 1}, collection="data")
+    kvstore.put("b", {"val": 2}, collection="data2")
+    assert kvstore.get_all(collection="data") == {"a": {"val": 1}}
+
+
+@pytest.mark.skipif(not has_boto_libs, reason="boto3 and/or moto not installed")
+def test_packed_shards() -> None:
+    with mock_s3():
+        s3 = boto3.resource("s3")
+        bucket = s3.Bucket("test_bucket")
+        bucket.create()
+        kvstore = S3DBKVStore(bucket, num_shards=4)
+
+        kv_pairs = [(f"key_{i}", {"val": i}) for i in range(50)]
+        kvstore.put_all(kv_pairs)
+        kvstore.put("other", {"val": -1})
+        # at most one object per shard
+        assert len(list(bucket.objects.all())) <= 4
+
+        assert kvstore.get("key_7") == {"val": 7}
+        assert kvstore.get("missing") is None
+        assert kvstore.get_many(["key_1", "key_2", "missing"]) == {
+            "key_1": {"val": 1},
+            "key_2": {"val": 2},
+        }
+        assert kvstore.get_all() == {**dict(kv_pairs), "other": {"val": -1}}
+
+        # objects that are not shards are ignored
+        stray_key = kvstore._get_object_key("data", "stray")
+        bucket.put_object(Key=stray_key, Body='{"x": {"y": 1}}')
+        assert kvstore.get_all() == {**dict(kv_pairs), "other": {"val": -1}}
+        bucket.Object(stray_key).delete()
+
+        assert kvstore.delete("other")
+        assert not kvstore.delete("other")
+        kvstore.delete_many([f"key_{i}" for i in range(1, 50)])
+        assert kvstore.get_all() == {"key_0": {"val": 0}}
@@ -35,3 +35,58 @@ def test_kvstore_dict(kvstore_with_data: SimpleKVStore) -> None:
     save_dict = kvstore_with_data.to_dict()
     loaded_kvstore = SimpleKVStore.from_dict(save_dict)
     assert len(loaded_kvstore.get_all()) == 1
+
+
+def test_kvstore_bulk(simple_kvstore: SimpleKVStore) -> None:
+    """Test kvstore bulk put, get and delete."""
+    simple_kvstore.put_all([("a", {"val": 1}), ("b", {"val": 2}), ("c", {"val": 3})])
+    assert simple_kvstore.get_many(["a", "c", "missing"]) == {
+        "a": {"val": 1},
+        "c": {"val": 3},
+    }
+
+    simple_kvstore.delete_many(["a", "b", "missing"])
+    assert simple_kvstore.get_all() == {"c": {"val": 3}}
+
+
+def test_kvstore_persist_skips_unchanged(
+    tmp_path: Path, kvstore_with_data: SimpleKVStore
+) -> None:
+    testpath = tmp_path / "kvstore.json"
+    kvstore_with_data.persist(str(testpath))
+
+    # an unchanged store is not written again
+    testpath.write_text('{"sentinel": {}}')
+    kvstore_with_data.persist(str(testpath))
+    assert testpath.read_text() == '{"sentinel": {}}'
+
+    # unless persisted elsewhere
+    kvstore_with_data.persist(str(tmp_path / "other.json"))
+    assert (
+        len(SimpleKVStore.from_persist_path(str(tmp_path / "other.json")).get_all())
+        == 1
+    )
+
+    # a changed store is written, atomically
+    kvstore_with_data.delete("test_key")
+    kvstore_with_data.persist(str(testpath))
+    loaded_kvstore = SimpleKVStore.from_persist_path(str(testpath))
+    assert loaded_kvstore.get_all() == {}
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "kvstore.json",
+        "other.json",
+    ]
+
+
+def test_kvstore_persist_skips_unchanged_equivalent_path(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, kvstore_with_data: SimpleKVStore
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    kvstore_with_data.persist("./storage/kvstore.json")
+    loaded_kvstore = SimpleKVStore.from_persist_path("./storage/kvstore.json")
+
+    # the same file, under a different spelling, is not written again
+    testpath = tmp_path / "storage" / "kvstore.json"
+    testpath.write_text('{"sentinel": {}}')
+    loaded_kvstore.persist("storage/kvstore.json")
+    assert testpath.read_text() == '{"sentinel": {}}'
@@ -0,0 +1,63 @@
+import asyncio
+from pathlib import Path
+
+from llama_index.storage.docstore.sqlite_docstore import SQLiteDocumentStore
+from llama_index.storage.docstore.simple_docstore import SimpleDocumentStore
+from llama_index.readers.schema.base import Document
+from llama_index.storage.kvstore.sqlite_kvstore import SQLiteKVStore
+
+
+def test_kvstore_basic(tmp_path: Path) -> None:
+    kvstore = SQLiteKVStore(str(tmp_path / "kvstore.db"))
+    test_key = "test_key"
+    test_blob = {"test_obj_key": "test_obj_val"}
+    kvstore.put(test_key, test_blob)
+    assert kvstore.get(test_key) == test_blob
+    assert kvstore.get(test_key, collection="non_existent") is None
+
+    kvstore.put(test_key, {"test_obj_key": "new_val"})
+    assert kvstore.get_all() == {test_key: {"test_obj_key": "new_val"}}
+
+    assert kvstore.delete(test_key)
+    assert not kvstore.delete(test_key)
+
+
+def test_kvstore_bulk() -> None:
+    kvstore = SQLiteKVStore(":memory:")
+    kvstore.put_all([(f"key_{i}", {"val": i}) for i in range(1000)])
+    assert kvstore.get_many(["key_1", "key_999", "missing"]) == {
+        "key_1": {"val": 1},
+        "key_999": {"val": 999},
+    }
+    # more keys than fit in a single query
+    assert len(kvstore.get_many([f"key_{i}" for i in range(1000)])) == 1000
+
+    kvstore.delete_many([f"key_{i}" for i in range(1, 1000)])
+    assert asyncio.run(kvstore.aget_all()) == {"key_0": {"val": 0}}
+
+
+def test_kvstore_reopen(tmp_path: Path) -> None:
+    db_path = str(tmp_path / "storage" / "kvstore.db")
+    kvstore = SQLiteKVStore(db_path)
+    kvstore.put_all([("a", {"val": 1}), ("b", {"val": 2})])
+    kvstore.delete("b")
+    kvstore.compact()
+    kvstore.close()
+
+    loaded_kvstore = SQLiteKVStore(db_path)
+    assert loaded_kvstore.get_all() == {"a": {"val": 1}}
+
+
+def test_migrate_from_json(tmp_path: Path) -> None:
+    doc = Document("hello world", doc_id="d1", extra_info={"foo": "bar"})
+    docstore = SimpleDocumentStore()
+    docstore.add_documents([doc])
+    json_path = str(tmp_path / "docstore.json")
+    docstore.persist(json_path)
+
+    kvstore = SQLiteKVStore.from_json_persist_path(
+        json_path, db_path=str(tmp_path / "docstore.db")
+    )
+    sqlite_docstore = SQLiteDocumentStore(kvstore)
+    assert sqlite_docstore.get_document("d1") == doc
+    assert sqlite_docstore.get_document_hash("d1") == doc.get_doc_hash()
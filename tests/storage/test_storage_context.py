@@ -1,5 +1,10 @@
+from pathlib import Path
+from typing import Dict
+
 from llama_index.data_structs.data_structs import IndexDict
 from llama_index.data_structs.node import Node
+from llama_index.storage.docstore.simple_docstore import SimpleDocumentStore
+from llama_index.storage.lazy import LazyStore
 from llama_index.storage.storage_context import StorageContext
 from llama_index.vector_stores.types import NodeWithEmbedding
 
@@ -28,3 +33,54 @@ def test_storage_context_dict() -> None:
         storage_context.index_store.get_index_struct(index_struct.index_id)
         == index_struct
     )
+
+
+def test_storage_context_persist_incremental(tmp_path: Path) -> None:
+    storage_context = StorageContext.from_defaults()
+    node = Node("test")
+    storage_context.vector_store.add(
+        [NodeWithEmbedding(node=node, embedding=[0.0, 0.0, 0.0])]
+    )
+    storage_context.docstore.add_documents([node])
+    storage_context.index_store.add_index_struct(IndexDict())
+    storage_context.persist(persist_dir=str(tmp_path))
+
+    def get_inodes() -> Dict[str, int]:
+        # files are replaced by a rename on write, which changes their inode
+        return {path.name: path.stat().st_ino for path in tmp_path.iterdir()}
+
+    # unchanged stores are not written again
+    inodes = get_inodes()
+    storage_context.persist(persist_dir=str(tmp_path))
+    assert get_inodes() == inodes
+
+    # only changed stores are written, without leftover temp files
+    storage_context.graph_store.upsert_triplet("a", "rel", "b")
+    storage_context.persist(persist_dir=str(tmp_path))
+    new_inodes = get_inodes()
+    assert new_inodes.keys() == inodes.keys()
+    assert {name for name in inodes if inodes[name] != new_inodes[name]} == {
+        "graph_store.json"
+    }
+
+    # loaded stores are not written back when unchanged
+    loaded_storage_context = StorageContext.from_defaults(persist_dir=str(tmp_path))
+    loaded_storage_context.persist(persist_dir=str(tmp_path))
+    assert get_inodes() == new_inodes
+
+
+def test_lazy_store_persist_same_path(tmp_path: Path) -> None:
+    StorageContext.from_defaults().persist(persist_dir=str(tmp_path))
+    lazy_store = LazyStore(
+        "docstore",
+        SimpleDocumentStore,
+        lambda: SimpleDocumentStore.from_persist_dir(str(tmp_path)),
+        persist_path=str(tmp_path / "docstore.json"),
+    )
+
+    # an equivalent spelling of the load path does not load the component
+    lazy_store.persist(persist_path=f"{tmp_path}/./docstore.json")
+    assert not lazy_store.is_loaded
+
+    lazy_store.persist(persist_path=str(tmp_path / "other" / "docstore.json"))
+    assert lazy_store.is_loaded
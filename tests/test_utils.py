@@ -1,12 +1,16 @@
 """Test utils."""
 
+from pathlib import Path
 from typing import Optional, Type, Union
 
+import fsspec
 import pytest
 
 from llama_index.utils import (
     ErrorToRetry,
+    atomic_write,
     globals_helper,
+    is_same_path,
     retry_on_exceptions_with_backoff,
     iter_batch,
 )
@@ -109,3 +113,36 @@ def test_iter_batch() -> None:
     assert list(iter_batch(gen, 3)) == [[0, 1, 2], [3, 4]]
 
     assert list(iter_batch([], 3)) == []
+
+
+def test_is_same_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test comparing normalized paths."""
+    monkeypatch.chdir(tmp_path)
+    fs = fsspec.filesystem("file")
+    assert is_same_path("./storage/docstore.json", "storage/docstore.json", fs)
+    assert is_same_path(
+        "storage//docstore.json", str(tmp_path / "storage" / "docstore.json"), fs
+    )
+    assert not is_same_path("storage/docstore.json", "storage/index_store.json", fs)
+    assert not is_same_path("storage/docstore.json", None, fs)
+
+
+def test_atomic_write(tmp_path: Path) -> None:
+    """Test that concurrent atomic writes use distinct temp files."""
+    fs = fsspec.filesystem("file")
+    path = str(tmp_path / "data.json")
+    with atomic_write(path, fs) as f1:
+        with atomic_write(path, fs) as f2:
+            f2.write("second")
+        f1.write("first")
+    with open(path) as f:
+        assert f.read() == "first"
+    assert [p.name for p in tmp_path.iterdir()] == ["data.json"]
+
+    with pytest.raises(RuntimeError):
+        with atomic_write(path, fs) as f:
+            f.write("torn")
+            raise RuntimeError("crash")
+    with open(path) as f:
+        assert f.read() == "first"
+    assert [p.name for p in tmp_path.iterdir()] == ["data.json"]
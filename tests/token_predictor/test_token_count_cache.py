@@ -0,0 +1,74 @@
+"""Test token count cache."""
+
+from typing import List
+
+import pytest
+
+from llama_index.prompts.base import Prompt
+from llama_index.prompts.utils import get_empty_prompt_txt
+from llama_index.token_counter.token_count_cache import TokenCountCache
+from llama_index.utils import globals_helper
+
+
+def test_count_tokens() -> None:
+    """Test counting tokens, with and without cache hits."""
+    cache = TokenCountCache()
+    tokenizer = globals_helper.tokenizer
+    texts = ["hello world", "", "hello world " * 50, "a <|endoftext|> b"]
+    for text in texts:
+        if "<|endoftext|>" in text:
+            # special tokens are still disallowed, same as the tokenizer
+            with pytest.raises(ValueError):
+                tokenizer(text)
+            with pytest.raises(ValueError):
+                cache.count_tokens(text)
+            continue
+        assert cache.count_tokens(text) == len(tokenizer(text))
+        assert cache.count_tokens(text) == len(tokenizer(text))
+    assert cache.misses == 3
+    assert cache.hits == 3
+
+
+def test_count_tokens_per_tokenizer() -> None:
+    """Test that counts of different tokenizers are cached separately."""
+    calls: List[str] = []
+
+    def char_tokenizer(text: str) -> List[str]:
+        calls.append(text)
+        return list(text)
+
+    cache = TokenCountCache()
+    assert cache.count_tokens("hello world", char_tokenizer) == 11
+    assert cache.count_tokens("hello world") == 2
+    assert cache.count_tokens("hello world", char_tokenizer) == 11
+    assert calls == ["hello world"]
+
+
+def test_count_tokens_lru() -> None:
+    """Test that the least recently used counts are evicted."""
+    cache = TokenCountCache(max_size=2)
+    cache.count_tokens("one")
+    cache.count_tokens("two")
+    cache.count_tokens("one")
+    cache.count_tokens("three")
+    assert len(cache) == 2
+
+    cache.count_tokens("one")
+    assert cache.hits == 2
+    cache.count_tokens("two")
+    assert cache.misses == 4
+
+
+def test_get_empty_prompt_num_tokens() -> None:
+    """Test counting the tokens of empty prompts."""
+    cache = TokenCountCache()
+    prompt = Prompt("This is the context: {context_str}. Answer: {query_str}")
+    partial_prompt = prompt.partial_format(query_str="what is the meaning of life?")
+
+    for _ in range(2):
+        for cur_prompt in [prompt, partial_prompt]:
+            assert cache.get_empty_prompt_num_tokens(cur_prompt) == len(
+                globals_helper.tokenizer(get_empty_prompt_txt(cur_prompt))
+            )
+    assert cache.misses == 2
+    assert cache.hits == 0
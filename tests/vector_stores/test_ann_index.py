@@ -0,0 +1,101 @@
+from pathlib import Path
+from typing import List
+
+import numpy as np
+import pytest
+
+from llama_index.data_structs.node import DocumentRelationship, Node
+from llama_index.vector_stores.ann_index import IVFIndex, spherical_kmeans
+from llama_index.vector_stores.simple import SimpleVectorStore
+from llama_index.vector_stores.types import NodeWithEmbedding, VectorStoreQuery
+
+
+def _clustered_embeddings(num: int, dim: int = 16, seed: int = 0) -> np.ndarray:
+    centers = np.random.default_rng(0).normal(size=(20, dim))
+    rng = np.random.default_rng(seed)
+    return centers[rng.integers(0, 20, num)] + 0.1 * rng.normal(size=(num, dim))
+
+
+def _node_embeddings(
+    embeddings: np.ndarray, offset: int = 0
+) -> List[NodeWithEmbedding]:
+    return [
+        NodeWithEmbedding(
+            embedding=embedding.tolist(),
+            node=Node(
+                text="",
+                doc_id=f"node_{offset + i}",
+                relationships={DocumentRelationship.SOURCE: f"doc_{offset + i}"},
+            ),
+        )
+        for i, embedding in enumerate(embeddings)
+    ]
+
+
+@pytest.fixture
+def ivf_vector_store() -> SimpleVectorStore:
+    vector_store = SimpleVectorStore(
+        ann_index=IVFIndex(nlist=20, nprobe=2, min_train_size=100)
+    )
+    vector_store.add(_node_embeddings(_clustered_embeddings(500)))
+    return vector_store
+
+
+def test_spherical_kmeans() -> None:
+    embeddings = _clustered_embeddings(500)
+    centroids = spherical_kmeans(embeddings, 20)
+    assert centroids.shape == (20, 16)
+    assert np.allclose(np.linalg.norm(centroids, axis=1), 1.0, atol=1e-5)
+
+
+def test_ivf_query(ivf_vector_store: SimpleVectorStore) -> None:
+    exact_store = SimpleVectorStore(use_matrix=True)
+    exact_store.add(_node_embeddings(_clustered_embeddings(500)))
+    assert ivf_vector_store.ann_index is not None
+    assert not ivf_vector_store.ann_index.is_trained
+
+    queries = _clustered_embeddings(20, seed=1)
+    num_hits = 0
+    for query_embedding in queries:
+        query = VectorStoreQuery(
+            query_embedding=query_embedding.tolist(), similarity_top_k=5
+        )
+        exact_ids = exact_store.query(query).ids or []
+        approx_ids = ivf_vector_store.query(query).ids or []
+        num_hits += len(set(exact_ids) & set(approx_ids))
+        # probing every list is exact
+        assert ivf_vector_store.query(query, nprobe=20).ids == exact_ids
+
+    assert ivf_vector_store.ann_index.is_trained
+    assert num_hits / (5 * len(queries)) > 0.9
+
+
+def test_ivf_add_delete(ivf_vector_store: SimpleVectorStore) -> None:
+    ivf_vector_store.train_ann_index()
+
+    new_embeddings = _clustered_embeddings(10, seed=2)
+    ivf_vector_store.add(_node_embeddings(new_embeddings, offset=500))
+    query = VectorStoreQuery(
+        query_embedding=new_embeddings[3].tolist(), similarity_top_k=1
+    )
+    assert ivf_vector_store.query(query).ids == ["node_503"]
+
+    ivf_vector_store.delete("doc_503")
+    assert ivf_vector_store.query(query).ids != ["node_503"]
+
+
+def test_ivf_persist(tmp_path: Path, ivf_vector_store: SimpleVectorStore) -> None:
+    ivf_vector_store.train_ann_index()
+    ivf_vector_store.delete("doc_0")
+    persist_path = str(tmp_path / "vector_store.json")
+    ivf_vector_store.persist(persist_path)
+    assert (tmp_path / "vector_store.ann.npz").exists()
+
+    loaded_store = SimpleVectorStore.from_persist_path(persist_path)
+    assert isinstance(loaded_store.ann_index, IVFIndex)
+    assert loaded_store.ann_index.is_trained
+    for query_embedding in _clustered_embeddings(5, seed=1):
+        query = VectorStoreQuery(
+            query_embedding=query_embedding.tolist(), similarity_top_k=5
+        )
+        assert loaded_store.query(query).ids == ivf_vector_store.query(query).ids
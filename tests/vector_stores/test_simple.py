@@ -0,0 +1,305 @@
+from pathlib import Path
+from typing import Dict, List
+
+import fsspec
+import numpy as np
+import pytest
+
+from llama_index.data_structs.node import DocumentRelationship, Node
+from llama_index.vector_stores.ann_index import IVFIndex
+from llama_index.vector_stores.embedding_matrix import EmbeddingMatrix
+from llama_index.vector_stores.simple import SimpleVectorStore
+from llama_index.vector_stores.types import (
+    ExactMatchFilter,
+    MetadataFilters,
+    NodeWithEmbedding,
+    VectorStoreQuery,
+    VectorStoreQueryMode,
+)
+
+
+def _node_embeddings(embeddings: List[List[float]]) -> List[NodeWithEmbedding]:
+    return [
+        NodeWithEmbedding(
+            embedding=embedding,
+            node=Node(
+                text=f"text {i}",
+                doc_id=f"node_{i}",
+                relationships={DocumentRelationship.SOURCE: f"doc_{i % 3}"},
+            ),
+        )
+        for i, embedding in enumerate(embeddings)
+    ]
+
+
+@pytest.fixture
+def node_embeddings() -> List[NodeWithEmbedding]:
+    rng = np.random.default_rng(0)
+    return _node_embeddings(rng.normal(size=(50, 8)).tolist())
+
+
+@pytest.mark.parametrize(
+    "mode", [VectorStoreQueryMode.DEFAULT, VectorStoreQueryMode.MMR]
+)
+def test_matrix_matches_dict(
+    node_embeddings: List[NodeWithEmbedding], mode: VectorStoreQueryMode
+) -> None:
+    dict_store = SimpleVectorStore()
+    matrix_store = SimpleVectorStore(use_matrix=True)
+    dict_store.add(node_embeddings)
+    matrix_store.add(node_embeddings)
+
+    query_embedding = np.random.default_rng(1).normal(size=8).tolist()
+    for doc_ids in [None, ["node_1", "node_2", "node_3", "node_4"]]:
+        query = VectorStoreQuery(
+            query_embedding=query_embedding,
+            similarity_top_k=3,
+            doc_ids=doc_ids,
+            mode=mode,
+        )
+        dict_result = dict_store.query(query)
+        matrix_result = matrix_store.query(query)
+        assert dict_result.ids == matrix_result.ids
+        assert np.allclose(
+            dict_result.similarities or [],
+            matrix_result.similarities or [],
+            atol=1e-5,
+        )
+
+
+def test_matrix_add_delete(node_embeddings: List[NodeWithEmbedding]) -> None:
+    vector_store = SimpleVectorStore(use_matrix=True)
+    vector_store.add(node_embeddings)
+
+    vector_store.delete("doc_0")
+    query = VectorStoreQuery(
+        query_embedding=node_embeddings[0].embedding, similarity_top_k=50
+    )
+    result = vector_store.query(query)
+    assert result.ids is not None
+    assert len(result.ids) == 50 - 17
+    assert "node_0" not in result.ids
+
+    # re-adding a deleted node makes it searchable again
+    vector_store.add(node_embeddings[:1])
+    result = vector_store.query(query)
+    assert result.ids is not None
+    assert result.ids[0] == "node_0"
+
+
+def test_matrix_to_dict_backwards_compatible(
+    node_embeddings: List[NodeWithEmbedding],
+) -> None:
+    dict_store = SimpleVectorStore()
+    dict_store.add(node_embeddings)
+
+    matrix_store = SimpleVectorStore.from_dict(dict_store.to_dict(), use_matrix=True)
+    assert matrix_store.use_matrix
+    save_dict = matrix_store.to_dict()
+    assert save_dict.keys() == dict_store.to_dict().keys()
+    assert (
+        save_dict["text_id_to_ref_doc_id"]
+        == dict_store.to_dict()["text_id_to_ref_doc_id"]
+    )
+
+    loaded_store = SimpleVectorStore.from_dict(save_dict)
+    for result in node_embeddings:
+        assert np.allclose(loaded_store.get(result.id), result.embedding, atol=1e-6)
+
+
+def test_embedding_matrix_growth_and_compaction() -> None:
+    matrix = EmbeddingMatrix(capacity=2)
+    ids = [str(i) for i in range(2000)]
+    embeddings = (
+        np.random.default_rng(0).normal(size=(2000, 4)).astype(np.float32).tolist()
+    )
+    for text_id, embedding in zip(ids, embeddings):
+        matrix.add([text_id], [embedding])
+    assert len(matrix) == 2000
+
+    matrix.delete(ids[:1500])
+    # tombstones outnumber live rows, so rows have been compacted
+    assert matrix.num_rows == 500
+    assert matrix.get(ids[1500]) == embeddings[1500]
+    _, top_ids = matrix.top_k(embeddings[1600], similarity_top_k=1)
+    assert top_ids == ["1600"]
+
+
+def test_matrix_persist_binary(
+    tmp_path: Path, node_embeddings: List[NodeWithEmbedding]
+) -> None:
+    vector_store = SimpleVectorStore(use_matrix=True)
+    vector_store.add(node_embeddings)
+    vector_store.delete("doc_1")
+    persist_path = str(tmp_path / "vector_store.json")
+    vector_store.persist(persist_path)
+    assert (tmp_path / "vector_store.npy").exists()
+
+    loaded_store = SimpleVectorStore.from_persist_dir(str(tmp_path))
+    assert loaded_store.use_matrix
+    query = VectorStoreQuery(
+        query_embedding=node_embeddings[0].embedding, similarity_top_k=5
+    )
+    assert loaded_store.query(query).ids == vector_store.query(query).ids
+    assert loaded_store.to_dict() == vector_store.to_dict()
+
+    # loaded stores stay writable and can be persisted over their own files
+    loaded_store.add(node_embeddings[1:2])
+    loaded_store.delete("doc_0")
+    loaded_store.persist(persist_path)
+    reloaded_store = SimpleVectorStore.from_persist_path(persist_path)
+    assert reloaded_store.to_dict() == loaded_store.to_dict()
+
+
+def test_matrix_load_json_format(
+    tmp_path: Path, node_embeddings: List[NodeWithEmbedding]
+) -> None:
+    vector_store = SimpleVectorStore()
+    vector_store.add(node_embeddings)
+    persist_path = str(tmp_path / "vector_store.json")
+    vector_store.persist(persist_path)
+
+    loaded_store = SimpleVectorStore.from_persist_path(persist_path, use_matrix=True)
+    assert loaded_store.use_matrix
+    assert loaded_store.to_dict().keys() == vector_store.to_dict().keys()
+
+
+def test_matrix_persist_binary_fsspec(
+    node_embeddings: List[NodeWithEmbedding],
+) -> None:
+    fs = fsspec.filesystem("memory")
+    vector_store = SimpleVectorStore(use_matrix=True)
+    vector_store.add(node_embeddings)
+    vector_store.persist("/storage/vector_store.json", fs=fs)
+
+    loaded_store = SimpleVectorStore.from_persist_dir("/storage", fs=fs)
+    assert loaded_store.to_dict() == vector_store.to_dict()
+
+
+@pytest.mark.parametrize("use_matrix", [False, True])
+def test_delete_many(
+    node_embeddings: List[NodeWithEmbedding], use_matrix: bool
+) -> None:
+    vector_store = SimpleVectorStore(use_matrix=use_matrix)
+    vector_store.add(node_embeddings)
+
+    vector_store.delete_many(["doc_0", "doc_2", "unknown_doc"])
+    save_dict = vector_store.to_dict()
+    assert set(save_dict["text_id_to_ref_doc_id"].values()) == {"doc_1"}
+    assert (
+        save_dict["embedding_dict"].keys() == save_dict["text_id_to_ref_doc_id"].keys()
+    )
+
+    # reverse index is rebuilt from persisted data on load
+    loaded_store = SimpleVectorStore.from_dict(save_dict, use_matrix=use_matrix)
+    loaded_store.delete("doc_1")
+    assert loaded_store.to_dict()["text_id_to_ref_doc_id"] == {}
+
+
+def test_delete_after_ref_doc_id_change(
+    node_embeddings: List[NodeWithEmbedding],
+) -> None:
+    vector_store = SimpleVectorStore()
+    vector_store.add(node_embeddings[:1])
+    moved_node = NodeWithEmbedding(
+        embedding=node_embeddings[0].embedding,
+        node=Node(
+            text="text 0",
+            doc_id="node_0",
+            relationships={DocumentRelationship.SOURCE: "doc_1"},
+        ),
+    )
+    vector_store.add([moved_node])
+
+    vector_store.delete("doc_0")
+    assert vector_store.get("node_0") == node_embeddings[0].embedding
+    vector_store.delete("doc_1")
+    assert vector_store.to_dict()["embedding_dict"] == {}
+
+
+@pytest.fixture
+def tenant_node_embeddings() -> List[NodeWithEmbedding]:
+    return [
+        NodeWithEmbedding(
+            embedding=[1.0, float(i)],
+            node=Node(
+                text=f"text {i}",
+                doc_id=f"node_{i}",
+                relationships={DocumentRelationship.SOURCE: f"doc_{i}"},
+                extra_info={"tenant": f"tenant_{i % 2}", "rank": i % 3},
+            ),
+        )
+        for i in range(6)
+    ]
+
+
+@pytest.mark.parametrize("use_matrix", [False, True])
+def test_metadata_filters(
+    tmp_path: Path,
+    tenant_node_embeddings: List[NodeWithEmbedding],
+    use_matrix: bool,
+) -> None:
+    vector_store = SimpleVectorStore(use_matrix=use_matrix)
+    vector_store.add(tenant_node_embeddings)
+
+    filters = MetadataFilters(
+        filters=[
+            ExactMatchFilter(key="tenant", value="tenant_0"),
+            ExactMatchFilter(key="rank", value=1),
+        ]
+    )
+    query = VectorStoreQuery(
+        query_embedding=[1.0, 0.0], similarity_top_k=10, filters=filters
+    )
+    assert vector_store.query(query).ids == ["node_4"]
+
+    query.filters = MetadataFilters(
+        filters=[ExactMatchFilter(key="tenant", value="tenant_1")]
+    )
+    assert vector_store.query(query).ids == ["node_1", "node_3", "node_5"]
+    query.doc_ids = ["node_0", "node_3"]
+    assert vector_store.query(query).ids == ["node_3"]
+    query.doc_ids = None
+
+    # deleted nodes are removed from the filter index
+    vector_store.delete("doc_1")
+    assert vector_store.query(query).ids == ["node_3", "node_5"]
+
+    # the filter index is persisted with the store
+    persist_path = str(tmp_path / "vector_store.json")
+    vector_store.persist(persist_path)
+    loaded_store = SimpleVectorStore.from_persist_path(persist_path)
+    assert loaded_store.query(query).ids == ["node_3", "node_5"]
+
+
+def test_matrix_persist_only_changed_files(
+    tmp_path: Path, node_embeddings: List[NodeWithEmbedding]
+) -> None:
+    vector_store = SimpleVectorStore(ann_index=IVFIndex(nlist=2, min_train_size=1000))
+    vector_store.add(node_embeddings)
+    persist_path = str(tmp_path / "vector_store.json")
+    vector_store.persist(persist_path)
+
+    def get_inodes() -> Dict[str, int]:
+        return {path.name: path.stat().st_ino for path in tmp_path.iterdir()}
+
+    inodes = get_inodes()
+    vector_store.persist(persist_path)
+    assert get_inodes() == inodes
+
+    # retraining the ann index does not rewrite the embedding file
+    vector_store.train_ann_index()
+    vector_store.persist(persist_path)
+    new_inodes = get_inodes()
+    assert new_inodes["vector_store.npy"] == inodes["vector_store.npy"]
+    assert new_inodes["vector_store.json"] != inodes["vector_store.json"]
+
+    # deleting embeddings does
+    loaded_store = SimpleVectorStore.from_persist_path(persist_path)
+    loaded_store.persist(persist_path)
+    assert get_inodes() == new_inodes
+    loaded_store.delete("doc_1")
+    loaded_store.persist(persist_path)
+    assert get_inodes()["vector_store.npy"] != new_inodes["vector_store.npy"]
+    reloaded_store = SimpleVectorStore.from_persist_path(persist_path)
+    assert reloaded_store.to_dict() == loaded_store.to_dict()